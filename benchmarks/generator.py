@@ -0,0 +1,76 @@
+# MODULO: benchmarks
+# .. ............................................................ generator ..󰌠
+"""Generador de tareas sintéticas reproducibles para los benchmarks.
+
+Con la misma semilla, `generate_tasks` produce siempre las mismas tareas, de
+modo que dos ejecuciones (ej. antes y después de un cambio de
+almacenamiento) miden exactamente los mismos datos. Las proporciones imitan
+una lista real: la mayoría de tareas pendientes y de prioridad baja, pocas
+con detalles y unas pocas con detalles largos (que se comprimen).
+"""
+import random
+from typing import Iterator
+from models.model_task import Priority, Status, Tag, Task
+
+
+# Valores de cada campo y su peso relativo.
+STATUS_WEIGHTS: dict[Status, int] = {
+    "pending": 50, "in_progress": 15, "completed": 35
+}
+TAG_WEIGHTS: dict[Tag, int] = {
+    "personal": 40, "trabajo": 35, "proyecto": 15, "calendario": 10
+}
+PRIORITY_WEIGHTS: dict[Priority, int] = {"baja": 55, "media": 30, "alta": 15}
+
+# Proporción de tareas con detalles, y de ésas, con detalles largos.
+DETAILS_RATIO: float = 0.2
+LONG_DETAILS_RATIO: float = 0.1
+
+# Palabras con las que se escriben contenidos y detalles.
+WORDS: tuple[str, ...] = (
+    "revisar", "reunión", "equipo", "informe", "enviar", "correo", "llamar",
+    "cliente", "comprar", "pan", "leche", "pagar", "factura", "preparar",
+    "presentación", "actualizar", "documentación", "corregir", "error",
+    "planificar", "viaje", "médico", "cita", "proyecto", "entrega", "diseño",
+    "base", "datos", "migración", "prueba", "servidor", "copia", "seguridad",
+    "lectura", "libro", "curso", "python", "sqlite", "tarea", "semanal",
+)
+
+
+def generate_tasks(count: int, seed: int = 0) -> Iterator[Task]:
+    """Genera tareas sin ID de forma perezosa y reproducible.
+
+    Args:
+        count (int): Número de tareas.
+        seed (int, optional): Semilla del generador aleatorio.
+
+    Yields:
+        Iterator[Task]: Tareas listas para `new_tasks_many`.
+    """
+    rng = random.Random(seed)
+    statuses = rng.choices(
+        list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()), k=count
+    )
+    tags = rng.choices(
+        list(TAG_WEIGHTS), weights=list(TAG_WEIGHTS.values()), k=count
+    )
+    priorities = rng.choices(
+        list(PRIORITY_WEIGHTS), weights=list(PRIORITY_WEIGHTS.values()),
+        k=count
+    )
+    for index in range(count):
+        content = " ".join(rng.choices(WORDS, k=rng.randint(2, 8)))
+        details = None
+        if rng.random() < DETAILS_RATIO:
+            lines = 40 if rng.random() < LONG_DETAILS_RATIO else 2
+            details = "\n".join(
+                "- " + " ".join(rng.choices(WORDS, k=10))
+                for _ in range(lines)
+            )
+        yield Task(
+            status=statuses[index],
+            tag=tags[index],
+            priority=priorities[index],
+            content=content.capitalize(),
+            details=details,
+        )
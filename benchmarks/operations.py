@@ -0,0 +1,361 @@
+# MODULO: benchmarks
+# .. ........................................................... operations ..󰌠
+"""Mide las operaciones del repositorio y del servicio por tamaño de tabla.
+
+Para cada tamaño (por defecto 10k, 100k y 1M tareas) crea una base de datos
+temporal con tareas de `generate_tasks` (misma semilla, mismos datos) y
+mide:
+
+    - `new_tasks_many`: la carga inicial completa.
+    - `new_task`, `update_task`, `check_or_uncheck_task` y `delete_task`:
+      `--sample` llamadas sueltas sobre IDs aleatorios.
+    - `check_or_uncheck_tasks` y `delete_tasks`: lotes de `BATCH_SIZE` IDs.
+    - `get_all_tasks` y `filter_tasks` con cada forma de `FILTER_SHAPES`.
+    - `TaskService.get_tasks_for_ui` (siempre lee de la base de datos).
+    - Con `TaskCache` activa: la carga de la caché y, ya cargada,
+      `get_tasks_page_service` y `filter_tasks_service` con cada forma de
+      `FILTER_SHAPES` que la caché resuelve (ordenadas por ID).
+
+Las lecturas se miden antes que las escrituras, para que todas vean la
+tabla completa. Los resultados se guardan en JSON y se pueden comparar con
+los de otra ejecución:
+
+    python -m benchmarks.operations --output antes.json
+    python -m benchmarks.operations --output despues.json --compare antes.json
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+from benchmarks.generator import PRIORITY_WEIGHTS, generate_tasks
+from benchmarks.results import environment, save, summarize, timed
+from repositories.repository_db import RepositoryDB
+from repositories.task_filter import TaskFilter
+from services.task_service import TaskService
+
+
+# Tamaños de tabla medidos por defecto.
+DEFAULT_SIZES: tuple[int, ...] = (10_000, 100_000, 1_000_000)
+
+# IDs por lote en las operaciones sobre varias tareas.
+BATCH_SIZE: int = 1000
+
+# Tamaño de la página pedida a `get_tasks_page_service` (la ventana de la
+# tabla de la interfaz).
+PAGE_LIMIT: int = 200
+
+# Formas de filtro medidas con `filter_tasks`.
+FILTER_SHAPES: dict[str, TaskFilter] = {
+    "status": TaskFilter(status="pending"),
+    "tag": TaskFilter(tag="trabajo"),
+    "priority": TaskFilter(priority="alta"),
+    "status_tag": TaskFilter(status="pending", tag="trabajo"),
+    "status_priority": TaskFilter(status="pending", priority="alta"),
+    "tag_priority": TaskFilter(tag="trabajo", priority="alta"),
+    "status_tag_priority": TaskFilter(
+        status="pending", tag="trabajo", priority="alta"
+    ),
+    "multi_value": TaskFilter(
+        status=("pending", "in_progress"), priority=("alta", "media")
+    ),
+    "exclusion": TaskFilter(exclude_status="completed"),
+    "limit": TaskFilter(status="pending", limit=100),
+    "sorted_limit": TaskFilter(
+        tag="trabajo", order_by=("-priority", "id"), limit=100
+    ),
+}
+
+
+def _repeat(func: Callable[[], Any], repeat: int) -> dict[str, float | int]:
+    """Mide una función varias veces.
+
+    Args:
+        func (Callable[[], Any]): Operación a medir.
+        repeat (int): Número de ejecuciones.
+
+    Returns:
+        dict[str, float | int]: Resumen de `summarize`.
+    """
+    return summarize([timed(func) for _ in range(repeat)])
+
+
+def _each(
+        func: Callable[[int], Any],
+        task_ids: list[int]
+) -> dict[str, float | int]:
+    """Mide una llamada suelta por cada ID.
+
+    Args:
+        func (Callable[[int], Any]): Operación sobre un ID.
+        task_ids (list[int]): IDs sobre los que se llama.
+
+    Returns:
+        dict[str, float | int]: Resumen de `summarize`.
+    """
+    return summarize([timed(lambda: func(task_id)) for task_id in task_ids])
+
+
+def _benchmark_cache(
+        db_path: Path,
+        ids: list[int],
+        repeat: int
+) -> dict[str, Any]:
+    """Mide las lecturas que `TaskService` responde desde su caché.
+
+    Args:
+        db_path (Path): Base de datos ya cargada.
+        ids (list[int]): IDs de la carga inicial.
+        repeat (int): Ejecuciones de cada lectura.
+
+    Returns:
+        dict[str, Any]: `cache_load` (primera lectura, que carga la caché),
+            `get_tasks_page_service_cached` (una página desde la mitad de
+            la tabla) y `filter_tasks_service_cached` por forma de filtro.
+    """
+    service = TaskService(db_path=db_path, use_cache=True)
+    service.open()
+    try:
+        results: dict[str, Any] = {
+            "cache_load": summarize([timed(
+                lambda: service.get_tasks_page_service(limit=1)
+            )]),
+        }
+        assert service.cache is not None and service.cache.loaded
+        middle_id = ids[len(ids) // 2]
+        results["get_tasks_page_service_cached"] = _repeat(
+            lambda: service.get_tasks_page_service(
+                after_id=middle_id, limit=PAGE_LIMIT
+            ),
+            repeat
+        )
+        results["filter_tasks_service_cached"] = {
+            name: _repeat(
+                partial(service.filter_tasks_service, task_filter=task_filter),
+                repeat
+            )
+            for name, task_filter in FILTER_SHAPES.items()
+            if task_filter.sorted_by_id()
+        }
+    finally:
+        service.close()
+    return results
+
+
+def benchmark_size(
+        db_path: Path,
+        size: int,
+        seed: int,
+        repeat: int,
+        sample: int
+) -> dict[str, Any]:
+    """Crea una tabla de `size` tareas y mide todas las operaciones.
+
+    Args:
+        db_path (Path): Base de datos a crear (no debe existir).
+        size (int): Número de tareas de la carga inicial.
+        seed (int): Semilla de los datos y de los IDs elegidos.
+        repeat (int): Ejecuciones de cada lectura y de cada lote.
+        sample (int): Llamadas sueltas de cada operación por ID.
+
+    Returns:
+        dict[str, Any]: Resumen por operación; los filtros, por forma.
+    """
+    rng = random.Random(seed)
+    results: dict[str, Any] = {}
+    repository = RepositoryDB(db_path)
+    repository.create_table()
+    try:
+        ids: list[int] = []
+        results["new_tasks_many"] = summarize([timed(
+            lambda: ids.extend(repository.new_tasks_many(
+                generate_tasks(size, seed)
+            ))
+        )])
+
+        # .. Lecturas, con la tabla completa.
+        results["get_all_tasks"] = _repeat(repository.get_all_tasks, repeat)
+        results["filter_tasks"] = {
+            name: _repeat(
+                partial(repository.filter_tasks, task_filter=task_filter),
+                repeat
+            )
+            for name, task_filter in FILTER_SHAPES.items()
+        }
+        service = TaskService(db_path=db_path, use_cache=False)
+        service.open()
+        results["get_tasks_for_ui"] = _repeat(service.get_tasks_for_ui, repeat)
+        service.close()
+        results.update(_benchmark_cache(db_path, ids, repeat))
+
+        # .. Escrituras sueltas y por lotes, sobre IDs aleatorios.
+        sampled = rng.sample(ids, sample * 3 + BATCH_SIZE * repeat * 2)
+        single, sampled = sampled[:sample * 3], sampled[sample * 3:]
+        new_tasks = list(generate_tasks(sample, seed + 1))
+        results["new_task"] = summarize([
+            timed(lambda: repository.new_task(task)) for task in new_tasks
+        ])
+        priorities = list(PRIORITY_WEIGHTS)
+        results["update_task"] = _each(
+            lambda task_id: repository.update_task(
+                task_id, {"priority": rng.choice(priorities)}
+            ),
+            single[:sample]
+        )
+        results["check_or_uncheck_task"] = _each(
+            repository.check_or_uncheck_task, single[sample:sample * 2]
+        )
+        results["delete_task"] = _each(
+            repository.delete_task, single[sample * 2:]
+        )
+        batches = [
+            sampled[start:start + BATCH_SIZE]
+            for start in range(0, len(sampled), BATCH_SIZE)
+        ]
+        results["check_or_uncheck_tasks"] = summarize([
+            timed(lambda: repository.check_or_uncheck_tasks(batch))
+            for batch in batches[:repeat]
+        ])
+        results["delete_tasks"] = summarize([
+            timed(lambda: repository.delete_tasks(batch))
+            for batch in batches[repeat:]
+        ])
+    finally:
+        repository.close()
+    return results
+
+
+# .. ........................................................ Comparación ..󰌠
+def _medians(results: dict[str, Any]) -> dict[tuple[str, str], float]:
+    """Aplana los resultados a `(tamaño, operación) -> mediana`.
+
+    Args:
+        results (dict[str, Any]): Resultados de `run`.
+
+    Returns:
+        dict[tuple[str, str], float]: Medianas en milisegundos; los filtros
+            aparecen como `"filter_tasks.<forma>"`.
+    """
+    medians = {}
+    for size, operations in results["sizes"].items():
+        for name, summary in operations.items():
+            if "median_ms" in summary:
+                medians[size, name] = summary["median_ms"]
+                continue
+            for shape, shape_summary in summary.items():
+                medians[size, f"{name}.{shape}"] = shape_summary["median_ms"]
+    return medians
+
+
+def compare(previous: dict[str, Any], current: dict[str, Any]) -> str:
+    """Compara dos ejecuciones operación por operación.
+
+    Args:
+        previous (dict[str, Any]): Resultados anteriores.
+        current (dict[str, Any]): Resultados nuevos.
+
+    Returns:
+        str: Tabla de texto con las medianas y el cociente nuevo/anterior
+            (menor que 1 es más rápido) de las operaciones comunes.
+    """
+    before, after = _medians(previous), _medians(current)
+    lines = [
+        f"{'tamaño':>9}  {'operación':<36} {'antes ms':>11} "
+        f"{'después ms':>11} {'x':>6}"
+    ]
+    for key in after:
+        if key not in before:
+            continue
+        size, name = key
+        ratio = after[key] / before[key] if before[key] else float("inf")
+        lines.append(
+            f"{size:>9}  {name:<36} {before[key]:>11.3f} "
+            f"{after[key]:>11.3f} {ratio:>6.2f}"
+        )
+    return "\n".join(lines)
+
+
+# .. ................................................................ main ..󰌠
+def run(
+        sizes: tuple[int, ...],
+        seed: int,
+        repeat: int,
+        sample: int
+) -> dict[str, Any]:
+    """Mide todas las operaciones para cada tamaño.
+
+    Args:
+        sizes (tuple[int, ...]): Tamaños de tabla.
+        seed (int): Semilla de los datos.
+        repeat (int): Ejecuciones de cada lectura y de cada lote.
+        sample (int): Llamadas sueltas de cada operación por ID.
+
+    Returns:
+        dict[str, Any]: Entorno, parámetros y resultados por tamaño.
+    """
+    results: dict[str, Any] = {
+        "environment": environment(),
+        "parameters": {
+            "seed": seed, "repeat": repeat, "sample": sample,
+            "batch_size": BATCH_SIZE,
+        },
+        "sizes": {},
+    }
+    for size in sizes:
+        print(f"Midiendo {size} tareas...", file=sys.stderr)
+        with tempfile.TemporaryDirectory() as directory:
+            results["sizes"][str(size)] = benchmark_size(
+                Path(directory) / "benchmark.db", size, seed, repeat, sample
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ejecuta el benchmark desde la línea de comandos.
+
+    Args:
+        argv (list[str] | None, optional): Argumentos; por defecto,
+            `sys.argv[1:]`.
+
+    Returns:
+        int: Código de salida.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.operations",
+        description="Mide las operaciones de RepositoryDB y TaskService."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES)
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sample", type=int, default=100)
+    parser.add_argument("--output", type=Path, help="Archivo JSON.")
+    parser.add_argument(
+        "--compare", type=Path, help="Resultados anteriores a comparar."
+    )
+    args = parser.parse_args(argv)
+    minimum = args.sample * 3 + BATCH_SIZE * args.repeat * 2
+    if args.repeat < 1 or args.sample < 1 or min(args.sizes) < minimum:
+        parser.error(
+            f"--repeat y --sample deben ser al menos 1 y cada tamaño, al "
+            f"menos {minimum} (sample * 3 + {BATCH_SIZE} * repeat * 2)."
+        )
+
+    results = run(tuple(args.sizes), args.seed, args.repeat, args.sample)
+    if args.output is not None:
+        save(args.output, results)
+    if args.compare is not None:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(compare(previous, results))
+    else:
+        print(json.dumps(results["sizes"], indent=2))
+    return 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+# MODULO: benchmarks
+# .. ......................................................... render_probe ..󰌠
+"""Proceso medido por `benchmarks.startup` para el tiempo de primer dibujo.
+
+Abre la interfaz sin terminal sobre la base de datos indicada y escribe en
+la salida estándar una lista JSON con los instantes (`time.time()`) del
+evento `Ready` y de la primera ventana de filas (o del final de la espera,
+`ROWS_TIMEOUT`, si no llegan):
+
+    python -m benchmarks.render_probe ruta/a/tareas.db
+
+Está separado de `benchmarks.startup` e importa sólo lo imprescindible,
+para que el propio benchmark no sume tiempo de importación a lo medido.
+"""
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+
+# Segundos máximos de espera a que la tabla muestre filas.
+ROWS_TIMEOUT: float = 10.0
+
+
+def main(db_path: Path) -> None:
+    """Abre la interfaz, espera a las primeras filas y escribe los tiempos.
+
+    Args:
+        db_path (Path): Base de datos que abre la interfaz.
+    """
+    from controllers.interface import Interface
+    from controllers.task_table import TaskTable
+    from services.task_service import TaskService
+
+    class ProbeInterface(Interface):
+        """Interfaz que se cierra tras dibujar las primeras filas."""
+
+        # Textual resuelve las rutas relativas desde el módulo de la
+        # subclase; se fija la misma hoja de estilos que `Interface`.
+        CSS_PATH = str(
+            Path(__file__).resolve().parent.parent / "config" / "styles.css"
+        )
+
+        async def on_ready(self) -> None:
+            """Anota el primer frame, espera a la tabla y cierra la app."""
+            ready = time.time()
+            table = self.query_one(TaskTable)
+            while not table.row_count and time.time() - ready < ROWS_TIMEOUT:
+                await asyncio.sleep(0.001)
+            rows = time.time()
+            self.exit((ready, rows))
+
+    app = ProbeInterface(TaskService(db_path=db_path))
+    print(json.dumps(app.run(headless=True)))
+
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]))
@@ -0,0 +1,94 @@
+# MODULO: benchmarks
+# .. .............................................................. results ..󰌠
+"""Utilidades comunes para medir y guardar resultados de los benchmarks.
+
+Los resultados se guardan en JSON junto con el entorno en que se midieron
+(versiones de Python y SQLite, plataforma y commit de git), para que al
+comparar dos archivos se sepa si la diferencia viene del código o de la
+máquina.
+"""
+import json
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+
+# Raíz del proyecto.
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+
+def environment() -> dict[str, Any]:
+    """Describe el entorno de la medición.
+
+    Returns:
+        dict[str, Any]: Fecha (UTC), versiones de Python y SQLite,
+            plataforma y commit de git (`None` fuera de un repositorio).
+    """
+    try:
+        commit: str | None = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "commit": commit,
+    }
+
+
+def summarize(samples: list[float]) -> dict[str, float | int]:
+    """Resume los tiempos de varias ejecuciones.
+
+    Args:
+        samples (list[float]): Duraciones en segundos.
+
+    Returns:
+        dict[str, float | int]: Mediana, mínimo y máximo en milisegundos y
+            número de ejecuciones.
+    """
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 4),
+        "min_ms": round(min(samples) * 1000, 4),
+        "max_ms": round(max(samples) * 1000, 4),
+        "runs": len(samples),
+    }
+
+
+def timed(func: Callable[[], Any]) -> float:
+    """Ejecuta una función y devuelve su duración.
+
+    El resultado de la función se descarta antes de volver, para que listas
+    grandes no se acumulen entre repeticiones.
+
+    Args:
+        func (Callable[[], Any]): Función sin argumentos.
+
+    Returns:
+        float: Duración en segundos.
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def save(path: Path, results: dict[str, Any]) -> None:
+    """Guarda los resultados en un archivo JSON.
+
+    Args:
+        path (Path): Archivo de destino.
+        results (dict[str, Any]): Resultados serializables.
+    """
+    path.write_text(
+        json.dumps(results, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8"
+    )
@@ -0,0 +1,247 @@
+# MODULO: benchmarks
+# .. .............................................................. startup ..󰌠
+"""Mide el tiempo de arranque de la aplicación.
+
+Ejecuta cada medición en un proceso nuevo (arranque en frío del intérprete)
+y guarda los resultados en JSON:
+
+    - Importación: `python -X importtime` de la interfaz
+      (`controllers.interface`) y de los subcomandos (`controllers.cli`),
+      con el total y el tiempo propio acumulado por paquete (textual, rich,
+      pydantic...), para ver qué dependencia creció.
+    - Primer dibujo: tiempo desde que se lanza el proceso hasta que Textual
+      envía `Ready` (primer frame en pantalla) y hasta que la tabla muestra
+      sus primeras filas, sobre una base de datos temporal con
+      `--tasks` tareas.
+
+También comprueba que ciertos módulos no se importen al arrancar (Textual en
+los subcomandos, `markdown_it` y las pantallas de detalle en la interfaz).
+Con `--max-import-ms` / `--max-render-ms` el proceso termina con código 1 si
+se superan, para detectar regresiones en CI:
+
+    python -m benchmarks.startup --runs 5 --output startup.json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from benchmarks.results import ROOT, environment, save
+
+
+# Módulo a importar por cada punto de entrada medido.
+ENTRY_POINTS: dict[str, str] = {
+    "tui": "controllers.interface",
+    "cli": "controllers.cli",
+}
+
+# Paquetes con más tiempo de importación que se guardan en los resultados.
+TOP_PACKAGES: int = 15
+
+# Módulos que un punto de entrada no debe importar al arrancar.
+FORBIDDEN_IMPORTS: dict[str, tuple[str, ...]] = {
+    "tui": ("markdown_it", "controllers.detail_screens"),
+    "cli": ("textual", "rich"),
+}
+
+
+# .. ......................................................... Importación ..󰌠
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Interpreta la salida de `python -X importtime`.
+
+    Args:
+        stderr (str): Salida de error del proceso.
+
+    Returns:
+        list[tuple[str, int, int]]: `(módulo, propio_us, acumulado_us)` por
+            cada módulo importado.
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def measure_import(entry_point: str) -> dict[str, Any]:
+    """Importa un punto de entrada en un proceso nuevo y desglosa su costo.
+
+    Args:
+        entry_point (str): Clave de `ENTRY_POINTS`, ej. `"cli"`.
+
+    Returns:
+        dict[str, Any]: `total_ms`, `packages` (ms de tiempo propio de los
+            `TOP_PACKAGES` paquetes de primer nivel más caros, de mayor a
+            menor) y `forbidden` (módulos de `FORBIDDEN_IMPORTS` que sí se
+            importaron).
+    """
+    module = ENTRY_POINTS[entry_point]
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    modules = parse_importtime(process.stderr)
+
+    packages: dict[str, int] = {}
+    for name, self_us, _ in modules:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    total_us = next(
+        cumulative for name, _, cumulative in modules if name == module
+    )
+    imported = {name for name, _, _ in modules}
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "total_ms": total_us / 1000,
+        "packages": {
+            package: round(self_us / 1000, 2)
+            for package, self_us in slowest[:TOP_PACKAGES]
+        },
+        "forbidden": sorted(
+            name for name in imported
+            if name.split(".")[0] in FORBIDDEN_IMPORTS[entry_point]
+            or name in FORBIDDEN_IMPORTS[entry_point]
+        ),
+    }
+
+
+# .. ....................................................... Primer dibujo ..󰌠
+def measure_first_render(db_path: Path) -> dict[str, float]:
+    """Lanza la interfaz sin terminal y mide cuándo se dibuja.
+
+    Args:
+        db_path (Path): Base de datos que abre la interfaz.
+
+    Returns:
+        dict[str, float]: `ready_ms` (primer frame) y `rows_ms` (primeras
+            filas de la tabla), medidos desde que se lanza el proceso.
+    """
+    started = time.time()
+    process = subprocess.run(
+        [sys.executable, "-m", "benchmarks.render_probe", str(db_path)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    ready, rows = json.loads(process.stdout.splitlines()[-1])
+    return {
+        "ready_ms": (ready - started) * 1000,
+        "rows_ms": (rows - started) * 1000,
+    }
+
+
+def _create_database(db_path: Path, tasks: int) -> None:
+    """Crea una base de datos con tareas de ejemplo.
+
+    Args:
+        db_path (Path): Ruta del archivo a crear.
+        tasks (int): Número de tareas.
+    """
+    from models.model_task import Task
+    from services.task_service import TaskService
+
+    with TaskService(db_path=db_path, use_cache=False) as service:
+        service.new_tasks_many_service(
+            Task(content=f"Tarea de arranque {index}")
+            for index in range(tasks)
+        )
+
+
+# .. ................................................................ main ..󰌠
+def run(runs: int, tasks: int) -> dict[str, Any]:
+    """Repite todas las mediciones y resume cada una con su mediana.
+
+    Args:
+        runs (int): Repeticiones de cada medición.
+        tasks (int): Tareas de la base de datos de la interfaz.
+
+    Returns:
+        dict[str, Any]: Resultados listos para guardar en JSON.
+    """
+    results: dict[str, Any] = {
+        "environment": environment(),
+        "runs": runs,
+        "tasks": tasks,
+        "import": {},
+    }
+    for entry_point in ENTRY_POINTS:
+        samples = [measure_import(entry_point) for _ in range(runs)]
+        median = statistics.median(sample["total_ms"] for sample in samples)
+        # Se guarda el desglose de la muestra más cercana a la mediana.
+        closest = min(
+            samples, key=lambda sample: abs(sample["total_ms"] - median)
+        )
+        results["import"][entry_point] = {
+            **closest, "total_ms": round(median, 2)
+        }
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = Path(directory) / "startup.db"
+        _create_database(db_path, tasks)
+        samples = [measure_first_render(db_path) for _ in range(runs)]
+    results["first_render"] = {
+        key: round(statistics.median(sample[key] for sample in samples), 2)
+        for key in ("ready_ms", "rows_ms")
+    }
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Ejecuta el benchmark de arranque desde la línea de comandos.
+
+    Args:
+        argv (list[str] | None, optional): Argumentos; por defecto,
+            `sys.argv[1:]`.
+
+    Returns:
+        int: 0 si no hay regresiones, 1 si se superó algún límite o se
+            importó un módulo prohibido.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Mide la importación y el primer dibujo de tasks-cli."
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--output", type=Path, help="Archivo JSON.")
+    parser.add_argument(
+        "--max-import-ms", type=float,
+        help="Límite para la importación de la interfaz."
+    )
+    parser.add_argument(
+        "--max-render-ms", type=float,
+        help="Límite para ver las primeras filas."
+    )
+    args = parser.parse_args(argv)
+
+    if args.runs < 1 or args.tasks < 1:
+        parser.error("--runs y --tasks deben ser al menos 1.")
+
+    results = run(args.runs, args.tasks)
+    if args.output is not None:
+        save(args.output, results)
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+    failures = [
+        f"{entry_point}: importa {', '.join(measured['forbidden'])}"
+        for entry_point, measured in results["import"].items()
+        if measured["forbidden"]
+    ]
+    import_ms = results["import"]["tui"]["total_ms"]
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        failures.append(f"importación {import_ms} ms > {args.max_import_ms}")
+    rows_ms = results["first_render"]["rows_ms"]
+    if args.max_render_ms is not None and rows_ms > args.max_render_ms:
+        failures.append(f"primeras filas {rows_ms} ms > {args.max_render_ms}")
+    for failure in failures:
+        print(f"REGRESIÓN: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,8 +5,13 @@
 El módulo se encarga de leer el archivo 'settings.toml' y extraer los datos de
 él, dando la posibilidad de usar esos datos para establecer la configuración de
 la aplicación facilitando la importación desde otros módulos.
+
+El archivo no se lee al importar el módulo, sino la primera vez que se pide
+uno de sus valores (ej. `config_loader.CACHE_ENABLED` o
+`from config.config_loader import UI_ICONS`); a partir de ahí cada valor
+queda guardado como un atributo normal del módulo.
 """
-import tomllib
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -14,14 +19,72 @@ from typing import Any
 # Ruta al archivo de configuración, construida de forma relativa al script.
 _CONFIG_FILE_PATH = Path(__file__).parent / "settings.toml"
 
-# Carga el contenido del archivo .toml en un diccionario.
-_config_data: dict[str, Any]
-with open(_CONFIG_FILE_PATH, "rb") as f:
-    _config_data = tomllib.load(f)
-
 
 # .. .................................... Carga de valores de configuración ..󰌠
-# Expone las configuraciones de la interfaz de usuario (colores e íconos).
-_ui_config = _config_data.get("ui", {})
-UI_COLORS = _ui_config.get("colors", {})
-UI_ICONS = _ui_config.get("icons", {})
+# Cada valor expuesto: ruta de claves dentro del archivo y valor por defecto.
+_SETTINGS: dict[str, tuple[tuple[str, ...], Any]] = {
+    # Configuraciones de la interfaz de usuario (colores e íconos).
+    "UI_COLORS": (("ui", "colors"), {}),
+    "UI_ICONS": (("ui", "icons"), {}),
+    # Pausa (debounce) de la barra de filtro en vivo, en milisegundos.
+    "FILTER_DEBOUNCE_MS": (("ui", "filter", "debounce_ms"), 150),
+    # PRAGMAs de rendimiento que se aplican al abrir cada conexión.
+    "DB_PRAGMAS": (("database", "pragmas"), {}),
+    # Compresión de los detalles largos: tamaño mínimo en bytes (0 la
+    # desactiva) y método.
+    "DETAILS_COMPRESS_THRESHOLD": (
+        ("database", "details", "compress_threshold"), 0
+    ),
+    "DETAILS_COMPRESSION": (("database", "details", "method"), "zlib"),
+    # Si las filas leídas de la base de datos se validan con Pydantic.
+    "VALIDATE_READS": (("database", "reads", "validate"), False),
+    # Si el servicio mantiene una caché en memoria de las tareas.
+    "CACHE_ENABLED": (("cache", "enabled"), False),
+}
+
+UI_COLORS: dict[str, str]
+UI_ICONS: dict[str, str]
+FILTER_DEBOUNCE_MS: int
+DB_PRAGMAS: dict[str, Any]
+DETAILS_COMPRESS_THRESHOLD: int
+DETAILS_COMPRESSION: str
+VALIDATE_READS: bool
+CACHE_ENABLED: bool
+
+
+@cache
+def load_settings() -> dict[str, Any]:
+    """Lee 'settings.toml' una única vez.
+
+    Returns:
+        dict[str, Any]: Contenido del archivo.
+    """
+    import tomllib
+
+    with open(_CONFIG_FILE_PATH, "rb") as f:
+        return tomllib.load(f)
+
+
+def __getattr__(name: str) -> Any:
+    """Resuelve un valor de configuración la primera vez que se pide.
+
+    Args:
+        name (str): Nombre del valor, ej. `"CACHE_ENABLED"`.
+
+    Raises:
+        AttributeError: Si el nombre no es un valor de configuración.
+
+    Returns:
+        Any: Valor del archivo, o su valor por defecto si no está.
+    """
+    if name not in _SETTINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    keys, default = _SETTINGS[name]
+    value: Any = load_settings()
+    for key in keys:
+        if not isinstance(value, dict) or key not in value:
+            value = default
+            break
+        value = value[key]
+    globals()[name] = value
+    return value
@@ -0,0 +1,294 @@
+# MODULO: controllers
+# .. .................................................................. cli ..󰌠
+"""Subcomandos de línea de comandos sin interfaz gráfica.
+
+Este módulo permite usar la aplicación desde scripts, tareas programadas
+(cron) o el prompt de la shell sin abrir la interfaz de Textual:
+
+    tasks-cli add "Comprar pan" --tag personal --priority alta
+    tasks-cli list --limit 20
+    tasks-cli done 3-5,9
+    tasks-cli rm 12
+    tasks-cli filter --status pending --tag trabajo reun --json
+
+Cada subcomando llama directamente a `TaskService` (sin caché: el proceso
+sólo hace una operación) y termina. No importa nada de Textual ni de Rich,
+por lo que arrancar cuesta lo mismo que importar la capa de servicios.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Iterator, TextIO, get_args
+from controllers.decorators import parse_id_list
+from models.model_task import Priority, Status, Tag, Task, TaskSummary
+from services.task_service import TaskService
+
+
+# Tareas que se piden a la base de datos en cada página al listar.
+PAGE_SIZE: int = 500
+
+
+def _positive_int(value: str) -> int:
+    """Convierte un argumento en un entero mayor que cero.
+
+    Args:
+        value (str): Texto del argumento, ej. `"20"`.
+
+    Raises:
+        argparse.ArgumentTypeError: Si no es un entero positivo; `argparse`
+            lo muestra como error de uso.
+
+    Returns:
+        int: El entero.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"'{value}' no es un entero positivo."
+        )
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construye el analizador de argumentos de los subcomandos.
+
+    Returns:
+        argparse.ArgumentParser: Analizador con un subcomando por acción.
+    """
+    # Opción común a todos los subcomandos, aceptada después de su nombre.
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument(
+        "--json", action="store_true",
+        help="Escribe el resultado en JSON en lugar de texto."
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="tasks-cli",
+        description="Lista de tareas en la terminal. Sin subcomando, abre "
+                    "la interfaz interactiva."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser(
+        "add", parents=[output], help="Crea una tarea nueva."
+    )
+    add.add_argument("content", help="Descripción de la tarea.")
+    add.add_argument("--tag", choices=get_args(Tag), default="personal")
+    add.add_argument(
+        "--priority", choices=get_args(Priority), default="baja"
+    )
+    add.add_argument("--status", choices=get_args(Status), default="pending")
+    add.add_argument("--details", help="Notas adicionales (Markdown).")
+
+    list_ = commands.add_parser(
+        "list", parents=[output], help="Lista las tareas por ID."
+    )
+    list_.add_argument(
+        "--limit", type=_positive_int,
+        help="Número máximo de tareas a mostrar."
+    )
+
+    done = commands.add_parser(
+        "done", parents=[output], help="Marca tareas como completadas."
+    )
+    done.add_argument("ids", help="IDs y rangos, ej. '3-5,9'.")
+
+    rm = commands.add_parser(
+        "rm", parents=[output], help="Elimina tareas."
+    )
+    rm.add_argument("ids", help="IDs y rangos, ej. '3-5,9'.")
+
+    filter_ = commands.add_parser(
+        "filter", parents=[output],
+        help="Lista las tareas que cumplen los filtros."
+    )
+    filter_.add_argument(
+        "--status", action="append", choices=get_args(Status),
+        help="Estado; se puede repetir (OR)."
+    )
+    filter_.add_argument(
+        "--tag", action="append", choices=get_args(Tag),
+        help="Etiqueta; se puede repetir (OR)."
+    )
+    filter_.add_argument(
+        "--priority", action="append", choices=get_args(Priority),
+        help="Prioridad; se puede repetir (OR)."
+    )
+    filter_.add_argument(
+        "--limit", type=_positive_int,
+        help="Número máximo de tareas a mostrar."
+    )
+    filter_.add_argument(
+        "words", nargs="*",
+        help="Palabras con las que debe empezar alguna palabra del "
+             "contenido."
+    )
+    return parser
+
+
+def run(argv: list[str], out: TextIO | None = None) -> int:
+    """Ejecuta un subcomando y devuelve el código de salida.
+
+    Args:
+        argv (list[str]): Argumentos sin el nombre del programa, ej.
+            `["done", "3-5"]`.
+        out (TextIO | None, optional): Salida del resultado. Por defecto,
+            `sys.stdout`.
+
+    Returns:
+        int: 0 si la operación se hizo; 1 si no afectó a ninguna tarea o
+            falló la base de datos.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    out = out or sys.stdout
+
+    task_ids: list[int] = []
+    if args.command in ("done", "rm"):
+        try:
+            task_ids = parse_id_list(args.ids)
+        except ValueError as error:
+            parser.error(str(error))
+
+    with TaskService(use_cache=False) as service:
+        if args.command == "add":
+            return _add(service, args, out)
+        if args.command == "done":
+            updated = service.update_tasks_service(
+                task_ids, {"status": "completed"}
+            )
+            return _report(out, args.json, "completed", updated)
+        if args.command == "rm":
+            deleted = service.delete_tasks_service(task_ids)
+            return _report(out, args.json, "deleted", deleted)
+
+        filters: dict[str, Any] = {}
+        if args.command == "filter":
+            filters = {
+                "status": args.status and tuple(args.status),
+                "tag": args.tag and tuple(args.tag),
+                "priority": args.priority and tuple(args.priority),
+                "text": " ".join(args.words) or None,
+            }
+        tasks = _iter_tasks(service, args.limit, filters)
+        _write_tasks(out, args.json, tasks)
+        return 0
+
+
+# .. ........................................................ Subcomandos ..󰌠
+def _add(service: TaskService, args: argparse.Namespace, out: TextIO) -> int:
+    """Crea la tarea descrita por los argumentos de `add`.
+
+    Args:
+        service (TaskService): Servicio abierto.
+        args (argparse.Namespace): Argumentos del subcomando.
+        out (TextIO): Salida del resultado.
+
+    Returns:
+        int: 0 si la tarea se guardó, 1 si no.
+    """
+    task_id = service.new_task_service(
+        Task(
+            content=args.content,
+            tag=args.tag,
+            priority=args.priority,
+            status=args.status,
+            details=args.details,
+        )
+    )
+    if task_id is None:
+        print("No se pudo guardar la tarea.", file=sys.stderr)
+        return 1
+    if args.json:
+        json.dump({"id": task_id}, out)
+        out.write("\n")
+    else:
+        out.write(f"{task_id}\n")
+    return 0
+
+
+def _report(out: TextIO, as_json: bool, action: str, count: int) -> int:
+    """Escribe cuántas tareas afectó `done` o `rm`.
+
+    Args:
+        out (TextIO): Salida del resultado.
+        as_json (bool): Si se escribe en JSON.
+        action (str): Clave del resultado, ej. `"deleted"`.
+        count (int): Número de tareas afectadas.
+
+    Returns:
+        int: 0 si se afectó alguna tarea, 1 si ninguna.
+    """
+    if as_json:
+        json.dump({action: count}, out)
+        out.write("\n")
+    else:
+        out.write(f"{count}\n")
+    return 0 if count else 1
+
+
+def _iter_tasks(
+        service: TaskService,
+        limit: int | None,
+        filters: dict[str, Any]
+) -> Iterator[TaskSummary]:
+    """Recorre las tareas que cumplen los filtros, por páginas de ID.
+
+    Args:
+        service (TaskService): Servicio abierto.
+        limit (int | None): Número máximo de tareas, o `None` sin límite.
+        filters (dict[str, Any]): Argumentos de filtrado de
+            `get_tasks_page_service` (`status`, `tag`, `priority`, `text`).
+
+    Yields:
+        Iterator[TaskSummary]: Tareas en orden ascendente de ID.
+    """
+    after_id = 0
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = PAGE_SIZE if remaining is None else min(PAGE_SIZE, remaining)
+        page = service.get_tasks_page_service(
+            after_id=after_id, limit=size, **filters
+        )
+        yield from page
+        if len(page) < size:
+            return
+        after_id = page[-1].id
+        if remaining is not None:
+            remaining -= len(page)
+
+
+def _write_tasks(
+        out: TextIO,
+        as_json: bool,
+        tasks: Iterator[TaskSummary]
+) -> None:
+    """Escribe las tareas a medida que se leen.
+
+    En texto, una línea por tarea con columnas separadas por tabuladores
+    (ID, status, tag, prioridad, contenido), fácil de procesar con `cut` o
+    `awk`. En JSON, una lista de objetos con los campos de `TaskSummary`.
+
+    Args:
+        out (TextIO): Salida del resultado.
+        as_json (bool): Si se escribe en JSON.
+        tasks (Iterator[TaskSummary]): Tareas a escribir.
+    """
+    if not as_json:
+        for task in tasks:
+            out.write(
+                f"{task.id}\t{task.status}\t{task.tag}\t{task.priority}\t"
+                f"{task.content}\n"
+            )
+        return
+
+    separator = ""
+    out.write("[")
+    for task in tasks:
+        out.write(separator)
+        out.write(json.dumps(task.model_dump(), ensure_ascii=False))
+        separator = ",\n "
+    out.write("]\n")
@@ -3,9 +3,53 @@
 """
 Contiene los decoradores personalizados para la aplicación.
 """
+import re
 from functools import wraps
+from inspect import isawaitable
 from typing import Callable, Any
-from services.task_service import TaskService
+
+
+# Número máximo de IDs que acepta una lista de IDs, para que un rango mal
+# escrito (ej. "1-1000000000") no genere una lista enorme.
+MAX_IDS: int = 10000
+
+# Un elemento de la lista: un ID ("52") o un rango inclusivo ("3-40").
+_ID_ITEM = re.compile(r"^(\d+)(?:-(\d+))?$")
+
+
+def parse_id_list(text: str) -> list[int]:
+    """Convierte una lista de IDs y rangos en una lista de IDs.
+
+    Los elementos se separan con comas o espacios; los rangos son
+    inclusivos. Ej: `"3-5, 9"` -> `[3, 4, 5, 9]`.
+
+    Args:
+        text (str): Texto introducido por el usuario.
+
+    Raises:
+        ValueError: Si algún elemento no es un ID o un rango válido, o si la
+            lista supera `MAX_IDS`.
+
+    Returns:
+        list[int]: IDs sin repetir, en el orden en que se escribieron.
+    """
+    task_ids: dict[int, None] = {}
+    # Se unen los rangos escritos con espacios ("3 - 40") antes de separar.
+    text = re.sub(r"\s*-\s*", "-", text)
+    for item in re.split(r"[,\s]+", text.strip()):
+        if not item:
+            continue
+        match = _ID_ITEM.match(item)
+        if match is None:
+            raise ValueError(f"'{item}' no es un ID ni un rango válido.")
+        start = int(match.group(1))
+        end = int(match.group(2) or start)
+        if start > end:
+            start, end = end, start
+        if len(task_ids) + end - start + 1 > MAX_IDS:
+            raise ValueError(f"No se pueden indicar más de {MAX_IDS} IDs.")
+        task_ids.update(dict.fromkeys(range(start, end + 1)))
+    return list(task_ids)
 
 
 def require_valid_id(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -16,11 +60,16 @@ def require_valid_id(func: Callable[..., Any]) -> Callable[..., Any]:
         2. Que el ID sea un número entero.
         3. Que el ID exista en la base de datos.
 
+    La consulta de existencia usa el servicio asíncrono de la aplicación
+    (`self.service`), sin abrir un servicio nuevo en cada validación. Por eso
+    la función decorada pasa a ser una corrutina; si la función original
+    también lo es, se espera su resultado.
+
     Si alguna falla, muestra una notificación y detiene la ejecución.
     Si todo es correcto, llama a la función original con el ID (int).
     """
     @wraps(func)
-    def wrapper(self, task_id_str: str):
+    async def wrapper(self, task_id_str: str):
 
         # 1. Comprobar si el string está vacío
         if not task_id_str:
@@ -44,9 +93,8 @@ def require_valid_id(func: Callable[..., Any]) -> Callable[..., Any]:
             )
             return
 
-        # 3. Comprobar si el ID existe en la BD
-        service = TaskService()
-        if service.get_task_by_id_service(task_id_int) is None:
+        # 3. Comprobar si el ID existe (sin leer sus detalles)
+        if not await self.service.get_tasks_by_ids_service([task_id_int]):
             self.app.notify(
                 f"La tarea con el ID '{task_id_int}' no existe.",
                 title="Error de operación",
@@ -56,6 +104,77 @@ def require_valid_id(func: Callable[..., Any]) -> Callable[..., Any]:
             return
 
         # Si todas las comprobaciones pasan, ejecuta la función original
-        return func(self, task_id_int)
+        result = func(self, task_id_int)
+        if isawaitable(result):
+            result = await result
+        return result
+
+    return wrapper
+
+
+def require_valid_ids(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorador que valida una lista de IDs (ej. "3-40,52").
+
+    Convierte el texto con `parse_id_list` y comprueba con una sola consulta
+    qué tareas existen. Si ninguna existe, o el texto no es válido, muestra
+    una notificación y detiene la ejecución. Si sólo faltan algunas, avisa y
+    continúa con las existentes.
+
+    La función decorada recibe la lista de IDs (list[int]) y pasa a ser una
+    corrutina, igual que con `require_valid_id`.
+    """
+    @wraps(func)
+    async def wrapper(self, task_ids_str: str):
+
+        # 1. Comprobar si el string está vacío
+        if not task_ids_str or not task_ids_str.strip():
+            self.app.notify(
+                "No se introdujo ningún ID.",
+                title="Acción cancelada",
+                severity="warning",
+                timeout=3
+            )
+            return
+
+        # 2. Comprobar que la lista y sus rangos son válidos
+        try:
+            task_ids = parse_id_list(task_ids_str)
+        except ValueError as error:
+            self.app.notify(
+                str(error),
+                title="Error de entrada",
+                severity="error",
+                timeout=3
+            )
+            return
+
+        # 3. Comprobar qué IDs existen en la BD
+        found = await self.service.get_tasks_by_ids_service(task_ids)
+        found_ids = {task.id for task in found}
+        if not found_ids:
+            self.app.notify(
+                "Ninguna de las tareas indicadas existe.",
+                title="Error de operación",
+                severity="error",
+                timeout=3
+            )
+            return
+        missing = [task_id for task_id in task_ids if task_id not in found_ids]
+        if missing:
+            shown = ", ".join(str(task_id) for task_id in missing[:10])
+            self.app.notify(
+                f"Se omiten {len(missing)} IDs inexistentes: {shown}"
+                + ("..." if len(missing) > 10 else ""),
+                title="IDs omitidos",
+                severity="warning",
+                timeout=3
+            )
+
+        result = func(
+            self, [task_id for task_id in task_ids if task_id in found_ids]
+        )
+        if isawaitable(result):
+            result = await result
+        return result
 
     return wrapper
@@ -0,0 +1,110 @@
+# MODULO: controllers
+# .. ....................................................... detail_screens ..󰌠
+"""Define las pantallas modales para editar una tarea y ver sus detalles.
+
+Se usan con mucha menos frecuencia que las de `controllers.screens` y el
+widget `Markdown` de `ViewDetailsScreen` es caro de importar (arrastra
+`markdown_it`), por lo que `Interface` importa este módulo sólo la primera
+vez que abre una de estas pantallas y no al arrancar.
+"""
+from typing import Any
+from textual.screen import ModalScreen
+from textual.app import ComposeResult
+from textual.widgets import Button, Input, Label, Markdown, TextArea
+from textual.containers import Vertical, Horizontal
+from models.model_task import Task
+
+
+class AskTaskEdit(ModalScreen):
+    """Pantalla modal para EDITAR una tarea existente."""
+
+    def __init__(self, task_to_edit: Task):
+        """Inicializa la pantalla de edición con los datos de una tarea
+        existente.
+
+        Args:
+            task_to_edit (Task): Objeto de la tarea que se va a editar.
+                Sus datos se usarán para pre-rellenar los campos de la pantalla.
+        """
+        super().__init__()
+        self.task_to_edit = task_to_edit
+
+
+    def compose(self) -> ComposeResult:
+        """Compone la UI de la pantalla."""
+        with Vertical(classes="dialog"):
+            yield Label(f"Editando Tarea ID: {self.task_to_edit.id}")
+            yield Label("Contenido de la tarea:")
+            yield Input(id="content_input", value=self.task_to_edit.content)
+            yield Label("Tag (personal, proyecto, trabajo, calendario):")
+            yield Input(id="tag_input", value=self.task_to_edit.tag)
+            yield Label("Prioridad (baja, media, alta):")
+            yield Input(id="priority_input", value=self.task_to_edit.priority)
+            yield Label("Detalles (opcional):")
+            initial_text = self.task_to_edit.details if self.task_to_edit.details else ""
+            yield TextArea(initial_text, id="details_input")
+
+            with Horizontal(classes="buttons"):
+                yield Button("Guardar Cambios", variant="primary", id="submit")
+                yield Button("Cancelar", id="cancel")
+
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Gestiona los botones 'Guardar Cambios' y 'Cancelar'.
+
+        Si se presiona 'submit', recopila los datos actualizados, añade el ID
+        de la tarea al diccionario y lo devuelve al cerrar la pantalla.
+        Si se presiona 'cancel', cierra la pantalla devolviendo `None`.
+
+        Args:
+            event (Button.Pressed): Evento que identifica botón presionado.
+        """
+        if event.button.id == "submit":
+            updated_data: dict[str, Any] = {
+                "content": self.query_one("#content_input", Input).value,
+                "tag": self.query_one("#tag_input", Input).value,
+                "priority": self.query_one("#priority_input", Input).value,
+                "details": self.query_one("#details_input", TextArea).text,
+            }
+            if self.task_to_edit:
+                updated_data["id"] = self.task_to_edit.id
+            self.dismiss(updated_data)
+        else:
+            self.dismiss(None)
+
+
+
+class ViewDetailsScreen(ModalScreen):
+    """Pantalla modal para mostrar los detalles de una tarea en Markdown."""
+
+    def __init__(self, details_content: str, task_id: int):
+        """Inicializa la pantalla de visualización de detalles.
+
+        Args:
+            details_content (str): Contenido de los detalles de la tarea,
+                que puede contener formato Markdown.
+            task_id (int): ID de la tarea, usado para mostrarlo en el título.
+        """
+        super().__init__()
+        self.details_content = details_content
+        self.task_id = task_id
+
+
+    def compose(self) -> ComposeResult:
+        """Compone la UI de la pantalla."""
+        with Vertical(classes="dialog"):
+            yield Label(f"Detalles de la Tarea ID: {self.task_id}")
+
+            # El widget de Markdown renderizará el texto.
+            # Si no hay detalles, muestra un mensaje por defecto.
+            markdown_text = self.details_content or "*No hay detalles para esta tarea.*"
+            with Vertical(id="markdown_container"):
+                yield Markdown(markdown_text)
+
+            with Horizontal(classes="buttons"):
+                yield Button("Cerrar", variant="primary", id="close_details")
+
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Cierra la pantalla modal cuando se presiona el botón 'Cerrar'."""
+        self.dismiss()
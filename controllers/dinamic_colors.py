@@ -7,27 +7,38 @@ Este módulo centraliza la creación de objetos `Text` de la librería Rich,
 combinando los íconos y  colores definidos en la configuración para representar
 visualmente diferentes estados de la aplicación (status, prioridad, etc.).
 """
+from typing import get_args
 from rich.text import Text
 from config.config_loader import UI_COLORS, UI_ICONS
+from models.model_task import Tag
+from services.task_counts import TaskCounts
 
 
 # Diccionario que mapea el estado de una tarea a un objeto Text estilizado.
 STATUS_STYLES: dict[str, Text] = {
-    "pending": Text(UI_ICONS.get('pendiente', ' '), style=UI_COLORS.get('red')),
-    "in_progress": Text(UI_ICONS.get('en_proceso', ' '), style=UI_COLORS.get('blue')),
-    "completed": Text(UI_ICONS.get('completada', ' '), style=UI_COLORS.get('green'))
+    "pending": Text(
+        UI_ICONS.get('pendiente', ' '), style=UI_COLORS.get('red', '')
+    ),
+    "in_progress": Text(
+        UI_ICONS.get('en_proceso', ' '), style=UI_COLORS.get('blue', '')
+    ),
+    "completed": Text(
+        UI_ICONS.get('completada', ' '), style=UI_COLORS.get('green', '')
+    ),
 }
 
 # Diccionario que mapea la prioridad de una tarea a un objeto Text estilizado.
 PRIORITY_STYLES: dict[str, Text] = {
-    "alta": Text(UI_ICONS.get('alta', ' '), style=UI_COLORS.get('red')),
-    "media": Text(UI_ICONS.get('media', ' '), style=UI_COLORS.get('orange')),
-    "baja": Text(UI_ICONS.get('baja', ' '), style=UI_COLORS.get('green'))
+    "alta": Text(UI_ICONS.get('alta', ' '), style=UI_COLORS.get('red', '')),
+    "media": Text(
+        UI_ICONS.get('media', ' '), style=UI_COLORS.get('orange', '')
+    ),
+    "baja": Text(UI_ICONS.get('baja', ' '), style=UI_COLORS.get('green', '')),
 }
 
 # Estilo para el ícono de nota.
 NOTE_STYLE: Text = Text(
-    UI_ICONS.get('nota', '>'), style=UI_COLORS.get('green')
+    UI_ICONS.get('nota', '>'), style=UI_COLORS.get('green', '')
 )
 
 
@@ -83,17 +94,17 @@ def dinamic_status_colors(legend_text: Text) -> Text:
     legend_text.append("Status:    ")
     legend_text.append(
         f"{UI_ICONS.get('pendiente', ' ')} pendiente",
-        style=UI_COLORS.get('red')
+        style=UI_COLORS.get('red', '')
     )
     legend_text.append(" | ", style="dim")
     legend_text.append(
         f"{UI_ICONS.get('en_proceso', ' ')} en proceso",
-        style=UI_COLORS.get('blue')
+        style=UI_COLORS.get('blue', '')
     )
     legend_text.append(" | ", style="dim")
     legend_text.append(
         f"{UI_ICONS.get('completada', ' ')} completada",
-        style=UI_COLORS.get('green')
+        style=UI_COLORS.get('green', '')
     )
 
     return legend_text
@@ -113,17 +124,17 @@ def dinamic_priority_colors(legend_text: Text) -> Text:
     legend_text.append("Prioridad: ")
     legend_text.append(
         f"{UI_ICONS.get('alta', ' ')} alta",
-        style=UI_COLORS.get('red')
+        style=UI_COLORS.get('red', '')
     )
     legend_text.append(" | ", style="dim")
     legend_text.append(
         f"{UI_ICONS.get('media', ' ')} media",
-        style=UI_COLORS.get('orange')
+        style=UI_COLORS.get('orange', '')
     )
     legend_text.append(" | ", style="dim")
     legend_text.append(
         f"{UI_ICONS.get('baja', ' ')} baja",
-        style=UI_COLORS.get('green')
+        style=UI_COLORS.get('green', '')
     )
 
     return legend_text
@@ -143,8 +154,50 @@ def dinamic_notes_leyend(legend_text: Text) -> Text:
     legend_text.append("Notas:     ")
     legend_text.append(
         f"{UI_ICONS.get('nota', '>')}",
-        style=UI_COLORS.get('green')
+        style=UI_COLORS.get('green', '')
     )
     legend_text.append(" -> Presiona 'v' para ver detalles.")
 
     return legend_text
+
+
+def dinamic_stats_panel(stats_text: Text, counts: TaskCounts) -> Text:
+    """Construye el panel de totales de tareas en un objeto Text.
+
+    Usa los mismos íconos y colores que `dinamic_status_colors` y
+    `dinamic_priority_colors`, para que cada total quede junto a su leyenda.
+
+    Nota: Esta función modifica el objeto `stats_text` que se le pasa.
+
+    Args:
+        - stats_text: Objeto Text al que se le añadirá el panel.
+        - counts: Totales de tareas por status, tag y prioridad.
+
+    Returns:
+        Objeto Text modificado con el panel de totales.
+    """
+    by_status = counts.by_field("status")
+    by_priority = counts.by_field("priority")
+    by_tag = counts.by_field("tag")
+
+    stats_text.append(f"Total:     {counts.total()} tareas\n")
+    stats_text.append("Status:    ")
+    for position, (status, style) in enumerate(STATUS_STYLES.items()):
+        if position:
+            stats_text.append(" | ", style="dim")
+        stats_text.append(
+            f"{style.plain} {by_status.get(status, 0)}", style=style.style
+        )
+    stats_text.append("\nPrioridad: ")
+    for position, (priority, style) in enumerate(PRIORITY_STYLES.items()):
+        if position:
+            stats_text.append(" | ", style="dim")
+        stats_text.append(
+            f"{style.plain} {by_priority.get(priority, 0)}", style=style.style
+        )
+    stats_text.append("\nTags:      ")
+    stats_text.append(" | ".join(
+        f"{tag} {by_tag.get(tag, 0)}" for tag in get_args(Tag)
+    ))
+
+    return stats_text
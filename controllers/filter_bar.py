@@ -0,0 +1,179 @@
+# MODULO: controllers
+# .. ........................................................... filter_bar ..󰌠
+"""Define la barra de filtro en vivo de la pantalla principal.
+
+La clase `FilterBar` es un `Input` que interpreta lo que escribe el usuario
+como un filtro y, tras una breve pausa sin teclear (debounce), avisa a la app
+con un mensaje `FilterBar.FiltersChanged`. Así cada pulsación no lanza una
+consulta: sólo la última de una ráfaga.
+
+Sintaxis del texto (las partes se combinan con AND):
+    - `status:pen`, `tag:tra,per`, `prioridad:alta`: valores de un campo,
+      separados por comas (OR). Cada valor puede escribirse a medias; se
+      usan todos los valores que empiezan así.
+    - Cualquier otra palabra: el contenido debe tener una palabra que
+      empiece así (búsqueda por prefijo en el índice FTS).
+"""
+from typing import Any
+from textual.binding import Binding
+from textual.message import Message
+from textual.timer import Timer
+from textual.widgets import Input
+from config.config_loader import FILTER_DEBOUNCE_MS
+from models.model_task import FIELD_CODES
+
+
+# Claves aceptadas antes de ":" y el campo de la tarea al que se refieren.
+FIELD_KEYS: dict[str, str] = {
+    "status": "status",
+    "estado": "status",
+    "tag": "tag",
+    "priority": "priority",
+    "prioridad": "priority",
+}
+
+
+def _expand_values(field: str, typed: str) -> tuple[str, ...]:
+    """Completa los valores escritos (quizá a medias) de un campo.
+
+    Args:
+        field (str): Campo de la tarea, ej. `"status"`.
+        typed (str): Valores separados por comas, ej. `"pen,in"`.
+
+    Returns:
+        tuple[str, ...]: Valores del modelo que empiezan por alguno de los
+            escritos. Un valor sin coincidencias se conserva tal cual, para
+            que el filtro no devuelva tareas.
+    """
+    known = tuple(FIELD_CODES[field])
+    values: dict[str, None] = {}
+    for prefix in typed.lower().split(","):
+        if not prefix:
+            continue
+        matches = [value for value in known if value.startswith(prefix)]
+        values.update(dict.fromkeys(matches or [prefix]))
+    return tuple(values)
+
+
+def parse_filter_text(text: str) -> dict[str, Any]:
+    """Convierte el texto de la barra en argumentos de filtrado.
+
+    Args:
+        text (str): Texto escrito, ej. `"status:pen reuni"`.
+
+    Returns:
+        dict[str, Any]: Argumentos para `get_tasks_page_service` y
+            `count_tasks_service`: `status`, `tag`, `priority` (tuplas de
+            valores o `None`) y `text` (palabras del contenido o `None`).
+    """
+    filters: dict[str, Any] = {
+        "status": None, "tag": None, "priority": None, "text": None
+    }
+    words = []
+    for word in text.split():
+        key, separator, typed = word.partition(":")
+        field = FIELD_KEYS.get(key.lower()) if separator else None
+        if field is None:
+            words.append(word)
+            continue
+        values = _expand_values(field, typed)
+        if values:
+            filters[field] = (filters[field] or ()) + values
+    if words:
+        filters["text"] = " ".join(words)
+    return filters
+
+
+class FilterBar(Input):
+    """Campo de filtro en vivo con debounce.
+
+    Cada cambio reinicia un temporizador de `FILTER_DEBOUNCE_MS`; cuando
+    vence sin nuevos cambios se publica `FiltersChanged` con el filtro ya
+    interpretado por `parse_filter_text`. Enter publica el filtro al
+    momento; Enter y Escape devuelven el foco a la tabla.
+    """
+
+    BINDINGS = [
+        Binding("escape", "leave", "Volver a la tabla", show=False),
+    ]
+
+    class FiltersChanged(Message):
+        """El usuario dejó de escribir un filtro nuevo.
+
+        Attributes:
+            - filters (dict[str, Any]): Resultado de `parse_filter_text`.
+        """
+
+        def __init__(self, filters: dict[str, Any]):
+            """Inicializa el mensaje.
+
+            Args:
+                filters (dict[str, Any]): Filtro interpretado.
+            """
+            super().__init__()
+            self.filters = filters
+
+
+    def __init__(self, **kwargs: Any):
+        """Inicializa la barra sin texto.
+
+        Args:
+            **kwargs: Argumentos adicionales para `Input`.
+        """
+        super().__init__(
+            placeholder="/ Filtrar: status:pen tag:tra prioridad:alta texto",
+            **kwargs
+        )
+        self._debounce: Timer | None = None
+
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Reinicia el temporizador de debounce con el texto actual.
+
+        Args:
+            event (Input.Changed): Evento de cambio del propio campo.
+        """
+        event.stop()
+        if self._debounce is not None:
+            self._debounce.stop()
+        self._debounce = self.set_timer(
+            FILTER_DEBOUNCE_MS / 1000, self._publish
+        )
+
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Publica el filtro sin esperar al debounce y vuelve a la tabla.
+
+        Args:
+            event (Input.Submitted): Evento de Enter del propio campo.
+        """
+        event.stop()
+        if self._debounce is not None:
+            self._publish()
+        self.action_leave()
+
+
+    def action_leave(self) -> None:
+        """Devuelve el foco al siguiente widget (la tabla de tareas)."""
+        self.screen.focus_next()
+
+
+    def _publish(self) -> None:
+        """Publica el filtro actual al vencer el debounce."""
+        if self._debounce is not None:
+            self._debounce.stop()
+            self._debounce = None
+        self.post_message(self.FiltersChanged(parse_filter_text(self.value)))
+
+
+    def reset(self) -> None:
+        """Vacía la barra sin publicar un filtro nuevo.
+
+        Se usa cuando otra acción (ej. refrescar o el filtro modal) ya
+        recarga la tabla.
+        """
+        if self._debounce is not None:
+            self._debounce.stop()
+            self._debounce = None
+        with self.prevent(Input.Changed):
+            self.value = ""
@@ -6,32 +6,34 @@ Este módulo define la clase `Interface`, que hereda de `textual.app.App`.
 Define la composición de la UI, gestiona los eventos del usuario (bindings)
 y coordina las diferentes pantallas (modales) de la aplicación.
 """
-from typing import Any
+from functools import partial
+from typing import get_args
 from rich.text import Text
 from textual.app import App, ComposeResult
+from textual.containers import Horizontal, Vertical
 from textual.widgets import (
-    DataTable,
     Footer,
     Header,
     Static
 )
-from .decorators import require_valid_id
+from .decorators import require_valid_id, require_valid_ids
+from .filter_bar import FilterBar
 from .dinamic_colors import (
     dinamic_priority_colors,
     dinamic_status_colors,
     dinamic_notes_leyend,
-    get_priority_style,
-    get_status_style
+    dinamic_stats_panel
 )
 from .screens import (
     AskIdScreen,
     AddTaskScreen,
-    AskTaskEdit,
     FilterTasksScreen,
-    ViewDetailsScreen
+    RetagTasksScreen,
+    SearchTasksScreen
 )
-from config.config_loader import UI_COLORS
-from models.model_task import Task
+from .task_table import PageSource, TaskTable
+from models.model_task import Priority, Tag, Task, TaskSummary
+from services.async_task_service import AsyncTaskService
 from services.task_service import TaskService
 
 
@@ -40,12 +42,18 @@ class Interface(App):
     de tareas.
 
     Como clase principal, se encarga de:
-    - Componer la layout inicial con widgets (Header, DataTable, Footer).
+    - Componer la layout inicial con widgets (Header, TaskTable, Footer).
     - Definir los atajos de teclado globales (BINDINGS).
     - Lanzar acciones (`action_*`) que muestran pantallas modales para la
       interacción con el usuario.
     - Recibir los resultados de las pantallas modales y ejecutar la lógica
       de negocio correspondiente a través de `TaskService`.
+
+    La app es dueña de una única instancia de `TaskService`, envuelta en un
+    `AsyncTaskService` (`self.service`) que se abre al montar la app y se
+    cierra al desmontarla; acciones y decoradores la reutilizan. Las consultas
+    se ejecutan en un hilo aparte y se esperan con `await`, de modo que la
+    interfaz sigue respondiendo mientras SQLite trabaja.
     """
 
     BINDINGS = [
@@ -53,20 +61,39 @@ class Interface(App):
         ("n", "add_task", "Nueva Tarea"),
         ("e", "edit_task", "Editar Tarea"),
         ("f", "filter_tasks", "Filtrar Tareas"),
+        ("s", "search_tasks", "Buscar"),
         ("d", "delete_task", "Eliminar Tarea"),
         ("m", "check_or_uncheck_task", "Marcar/Desmarcar"),
+        ("t", "retag_tasks", "Cambiar Tag"),
         ("r", "reset_filters", "Refrescar tareas"),
-        ("v", "view_details", "Ver Detalles")
+        ("v", "view_details", "Ver Detalles"),
+        ("slash", "focus_filter", "Filtro en vivo")
     ]
     CSS_PATH = "../config/styles.css"
     TITLE = "TASKS CLI - Lista de Tareas  "
 
 
+    def __init__(self, service: TaskService | None = None):
+        """Inicializa la app con el servicio de tareas que usará.
+
+        Args:
+            service (TaskService | None): Servicio a usar. Si es `None`, se
+                crea uno sobre la base de datos de producción.
+        """
+        super().__init__()
+        self.service = AsyncTaskService(
+            service if service is not None else TaskService()
+        )
+
+
     def compose(self) -> ComposeResult:
         """Compone el layout inicial de la aplicación.
 
         Este método de Textual se llama una vez al iniciar la app para
-        renderizar los widgets estáticos como el Header, Footer y DataTable.
+        renderizar los widgets estáticos como el Header, Footer y TaskTable.
+        Junto a las leyendas se muestra el panel de totales, que se rellena
+        al montar la app (`_refresh_stats`), y sobre la tabla la barra de
+        filtro en vivo (`FilterBar`).
         """
         leyenda_texto_status = Text()
         leyenda_texto_priority = Text()
@@ -75,66 +102,129 @@ class Interface(App):
         dinamic_priority_colors(leyenda_texto_priority)
         dinamic_notes_leyend(leyenda_texto_notas)
         yield Header()
-        yield Static(leyenda_texto_status, id="leyenda")
-        yield Static(leyenda_texto_priority, id="prioridad")
-        yield Static(leyenda_texto_notas, id="notas")
-        yield DataTable()
+        with Horizontal(id="cabecera"):
+            with Vertical(id="leyendas"):
+                yield Static(leyenda_texto_status, id="leyenda")
+                yield Static(leyenda_texto_priority, id="prioridad")
+                yield Static(leyenda_texto_notas, id="notas")
+            yield Static(id="estadisticas")
+        yield FilterBar(id="filter_bar")
+        yield TaskTable()
         yield Footer()
 
 
+    def _load_table(self, source: PageSource) -> None:
+        """Carga la tabla desde una fuente paginada en un worker.
+
+        Los workers del grupo "table" son exclusivos: si llega otra carga
+        (ej. un filtro nuevo) antes de que termine la anterior, la anterior
+        se cancela y su resultado nunca se dibuja.
+
+        Args:
+            source (PageSource): Fuente paginada para `TaskTable.load`.
+        """
+        table = self.query_one(TaskTable)
+        self.run_worker(table.load(source), group="table", exclusive=True)
+
+
+    def _clear_live_filter(self) -> None:
+        """Vacía la barra de filtro en vivo y el conteo del subtítulo.
+
+        Se llama antes de que otra acción (filtro modal, búsqueda o
+        refresco) reemplace el contenido de la tabla.
+        """
+        self.query_one(FilterBar).reset()
+        self.sub_title = ""
+
+
     def _update_table(self) -> None:
-        """Refresca el contenido del widget DataTable.
-
-        El método se encarga de limpiar la tabla, obtener la lista
-        actualizada de tareas desde el `TaskService`, aplicar estilos dinámicos
-        y volver a poblar las filas.
-        """
-        table = self.query_one(DataTable)
-        service = TaskService()
-        table.clear()
-        tareas = service.get_tasks_for_ui()
-
-        for row_data in tareas[1:]:
-            styled_row = list(row_data)
-            status_texto = styled_row[1]
-            prioridad_texto = styled_row[4]
-            styled_status = get_status_style(status_texto)
-            if isinstance(styled_status, Text):
-                styled_status.justify = "center"
-            styled_priority = get_priority_style(prioridad_texto)
-            if isinstance(styled_priority, Text):
-                styled_priority.justify = "center"
-            notes_indicator = Text(
-                styled_row[5], 
-                justify="center", 
-                style=UI_COLORS['green']
-            )
-            styled_row[1] = styled_status
-            styled_row[4] = styled_priority
-            styled_row[5] = notes_indicator
-            table.add_row(*styled_row)
+        """Refresca el contenido de la tabla de tareas.
+
+        La tabla (`TaskTable`) se vuelve a cargar desde el `TaskService`
+        pidiendo sólo la primera ventana de filas; el resto se pide por
+        páginas a medida que el usuario se desplaza.
+        """
+        self._load_table(self.service.get_tasks_page_service)
+
 
+    async def _refresh_stats(self) -> None:
+        """Vuelve a dibujar el panel de totales por status y prioridad.
+
+        Los totales los mantiene el servicio (ver
+        `TaskService.task_counts_service`), por lo que el refresco no cuenta
+        la tabla ni lee sus filas.
+        """
+        counts = await self.service.task_counts_service()
+        self.query_one("#estadisticas", Static).update(
+            dinamic_stats_panel(Text(), counts)
+        )
+
+
+    async def _refresh_task_rows(self, task_ids: list[int]) -> None:
+        """Actualiza la tabla tras una operación sobre varias tareas.
+
+        Se hace una sola lectura: la tabla vuelve a pedir su ventana a la
+        fuente, o, si muestra una lista fija (resultados de búsqueda), se
+        leen las tareas modificadas con una consulta y se redibujan sus
+        filas. Las marcas de selección se quitan y se refresca el panel de
+        totales.
+
+        Args:
+            task_ids (list[int]): IDs de las tareas modificadas o eliminadas.
+        """
+        table = self.query_one(TaskTable)
+        table.clear_marks()
+        await self._refresh_stats()
+        if await table.reload_window():
+            return
 
-    def on_mount(self) -> None:
+        tasks = await self.service.get_tasks_by_ids_service(task_ids)
+        found_ids = {task.id for task in tasks}
+        for task_id in task_ids:
+            if task_id not in found_ids:
+                table.remove_task_row(task_id)
+        for task in tasks:
+            await table.update_task_row(task)
+
+
+    async def _refresh_task_row(self, task_id: int) -> None:
+        """Vuelve a leer una tarea modificada y actualiza sólo su fila.
+
+        Evita recargar la tabla completa tras editar o cambiar el status de
+        una tarea: el costo no depende del número de filas. También refresca
+        el panel de totales.
+
+        Args:
+            task_id (int): ID de la tarea modificada.
+        """
+        await self._refresh_stats()
+        found = await self.service.get_tasks_by_ids_service([task_id])
+        table = self.query_one(TaskTable)
+        if not found:
+            table.remove_task_row(task_id)
+        else:
+            await table.update_task_row(found[0])
+
+
+    async def on_mount(self) -> None:
         """Se ejecuta cuando la app se monta en el DOM.
 
         Este método de Textual se usa para realizar configuraciones iniciales,
-        como definir las cabeceras de la tabla y cargar los datos por primera vez.
-        """
-        table = self.query_one(DataTable)
-        table.cursor_type = "row"
-        headers = ("ID", "Status", "Tag", "Contenido", "Prioridad", "Notas")
-
-        for label in headers:
-            if label == "Contenido":
-                table.add_column(label, width=90)
-            elif label == "Tag":
-                table.add_column(label, width=20)
-            elif label == "Nota":
-                table.add_column(label, width=10)
-            else:
-                table.add_column(label)
+        como abrir el servicio (creación y migración del esquema, una sola
+        vez por sesión) y cargar los datos y el panel de totales por primera
+        vez. Las columnas de la tabla las define `TaskTable`.
+        """
+        await self.service.open()
+        # El foco empieza en la tabla (no en la barra de filtro, el primer
+        # widget enfocable) para que los atajos de una letra funcionen.
+        self.set_focus(self.query_one(TaskTable))
         self._update_table()
+        await self._refresh_stats()
+
+
+    async def on_unmount(self) -> None:
+        """Se ejecuta al cerrar la app: libera las conexiones del servicio."""
+        await self.service.close()
 
 
     # .. ................... Acciones y Notificaciones .................... ..󰌠
@@ -152,13 +242,13 @@ class Interface(App):
             self.notification_add_task
         )
 
-    def notification_add_task(self, new_task_data: dict | None) -> None:
+    async def notification_add_task(self, new_task_data: dict | None) -> None:
         """Callback que procesa los datos recibidos de `AddTaskScreen`.
 
         Este método es llamado por Textual cuando la pantalla `AddTaskScreen`
         se cierra.
-        Valida los datos, utiliza `TaskService` para crear la tarea y actualiza
-        la tabla visual.
+        Valida los datos, utiliza `TaskService` para crear la tarea y añade su
+        fila a la tabla (sólo si es visible en la ventana actual).
 
         Args:
             new_task_data (dict | None): Diccionario con los datos de la
@@ -173,75 +263,177 @@ class Interface(App):
                     severity="error"
                 )
                 return
-            service = TaskService()
-            service.new_task_service(Task(**new_task_data))
+            new_task = Task(**new_task_data)
+            new_id = await self.service.new_task_service(new_task)
             self.app.notify(
                 f"Tarea '{new_task_data['content']}' agregada.",
                 title="Nueva Tarea"
             )
-            self._update_table()
+            if new_id is not None:
+                await self._refresh_stats()
+                await self.query_one(TaskTable).add_task_row(
+                    TaskSummary.from_task(
+                        new_task.model_copy(update={"id": new_id})
+                    )
+                )
 
 
     # .. ................................................ check_or_uncheck_task
     def action_check_or_uncheck_task(self) -> None:
-        """Maneja el atajo 'm' para marcar/desmarcar una tarea (cambiar status)
+        """Maneja el atajo 'm' para marcar/desmarcar tareas (cambiar status)
 
-        Abre la pantalla modal `AskIdScreen` para solicitar el ID de la tarea
-        y asigna `notification_check_or_uncheck_task` como callback.
+        Si hay filas seleccionadas en la tabla, cambia el estado de todas
+        ellas. Si no, abre la pantalla modal `AskIdScreen` para solicitar los
+        IDs de las tareas (admite listas y rangos) y asigna
+        `notification_check_or_uncheck_task` como callback.
         """
+        marked_ids = self.query_one(TaskTable).marked_ids()
+        if marked_ids:
+            self.run_worker(self._check_or_uncheck_tasks(marked_ids))
+            return
         self.push_screen(
-            AskIdScreen(),
+            AskIdScreen(multiple=True),
             self.notification_check_or_uncheck_task
         )
 
-    @require_valid_id
-    def notification_check_or_uncheck_task(self, task_id: int) -> None:
-        """Callback que cambia el estado de la tarea.
+    @require_valid_ids
+    async def notification_check_or_uncheck_task(
+            self,
+            task_ids: list[int]
+    ) -> None:
+        """Callback que cambia el estado de las tareas.
 
-        Es llamado por Textual al cerrar `AskIdScreen`. Utiliza `TaskService`
-        para cambiar el estado de la tarea y refresca la tabla.
+        Es llamado por Textual al cerrar `AskIdScreen`.
 
         Args:
-            task_id (int): ID de la tarea a modificar, validado por el
-                decorador `@require_valid_id`.
+            task_ids (list[int]): IDs de las tareas a modificar, validados
+                por el decorador `@require_valid_ids`.
         """
-        service = TaskService()
-        service.check_or_uncheck_task_service(task_id)
-        self.app.notify(
-            f"Tarea ID: {task_id} ha cambiado de estado.",
-            title="Status Actualizado"
-        )
-        self._update_table()
+        await self._check_or_uncheck_tasks(task_ids)
+
+    async def _check_or_uncheck_tasks(self, task_ids: list[int]) -> None:
+        """Cambia el estado de las tareas en una transacción y actualiza la
+        tabla con una sola lectura.
+
+        Args:
+            task_ids (list[int]): IDs de las tareas a modificar.
+        """
+        await self.service.check_or_uncheck_tasks_service(task_ids)
+        if len(task_ids) == 1:
+            message = f"Tarea ID: {task_ids[0]} ha cambiado de estado."
+        else:
+            message = f"{len(task_ids)} tareas han cambiado de estado."
+        self.app.notify(message, title="Status Actualizado")
+        await self._refresh_task_rows(task_ids)
 
 
     # .. .......................................................... delete_task
     def action_delete_task(self) -> None:
-        """Maneja el atajo 'd' para eliminar una tarea.
+        """Maneja el atajo 'd' para eliminar tareas.
 
-        Abre la pantalla modal `AskIdScreen` para solicitar el ID y asigna
-        `notification_delete_task` como callback.
+        Si hay filas seleccionadas en la tabla, las elimina. Si no, abre la
+        pantalla modal `AskIdScreen` para solicitar los IDs (admite listas y
+        rangos) y asigna `notification_delete_task` como callback.
         """
-        self.push_screen(AskIdScreen(), self.notification_delete_task)
+        marked_ids = self.query_one(TaskTable).marked_ids()
+        if marked_ids:
+            self.run_worker(self._delete_tasks(marked_ids))
+            return
+        self.push_screen(
+            AskIdScreen(multiple=True),
+            self.notification_delete_task
+        )
 
-    @require_valid_id
-    def notification_delete_task(self, task_id: int) -> None:
-        """Callback que elimina la tarea especificada.
+    @require_valid_ids
+    async def notification_delete_task(self, task_ids: list[int]) -> None:
+        """Callback que elimina las tareas especificadas.
+
+        Es llamado por Textual al cerrar `AskIdScreen`.
+
+        Args:
+            task_ids (list[int]): IDs de las tareas a eliminar, validados
+                por el decorador `@require_valid_ids`.
+        """
+        await self._delete_tasks(task_ids)
 
-        Es llamado por Textual al cerrar `AskIdScreen`. Emplea `TaskService`
-        para eliminar la tarea y actualiza la tabla.
+    async def _delete_tasks(self, task_ids: list[int]) -> None:
+        """Elimina las tareas en una transacción y actualiza la tabla con
+        una sola lectura.
 
         Args:
-            task_id (int): ID de la tarea a eliminar, validado por el
-                 decorador `@require_valid_id`.
+            task_ids (list[int]): IDs de las tareas a eliminar.
         """
-        service = TaskService()
-        service.delete_task_service(task_id)
+        await self.service.delete_tasks_service(task_ids)
+        if len(task_ids) == 1:
+            message = f"Tarea ID: {task_ids[0]} Eliminada."
+        else:
+            message = f"{len(task_ids)} tareas eliminadas."
         self.app.notify(
-            f"Tarea ID: {task_id} Eliminada.", 
+            message,
             title="Tarea Eliminada", 
             severity="warning"
         )
-        self._update_table()
+        await self._refresh_task_rows(task_ids)
+
+
+    # .. .......................................................... retag_tasks
+    def action_retag_tasks(self) -> None:
+        """Maneja el atajo 't' para cambiar el tag de varias tareas.
+
+        Si hay filas seleccionadas en la tabla, pide el nuevo tag para todas
+        ellas. Si no, abre `AskIdScreen` para solicitar primero los IDs.
+        """
+        marked_ids = self.query_one(TaskTable).marked_ids()
+        if marked_ids:
+            self.push_screen(
+                RetagTasksScreen(len(marked_ids)),
+                partial(self._retag_tasks, marked_ids)
+            )
+            return
+        self.push_screen(
+            AskIdScreen(multiple=True),
+            self._ask_new_tag
+        )
+
+    @require_valid_ids
+    async def _ask_new_tag(self, task_ids: list[int]) -> None:
+        """Callback que pide el nuevo tag para las tareas indicadas.
+
+        Args:
+            task_ids (list[int]): IDs de las tareas, validados por el
+                decorador `@require_valid_ids`.
+        """
+        self.push_screen(
+            RetagTasksScreen(len(task_ids)),
+            partial(self._retag_tasks, task_ids)
+        )
+
+    async def _retag_tasks(self, task_ids: list[int], tag: str | None) -> None:
+        """Callback que asigna el nuevo tag a las tareas en una transacción
+        y actualiza la tabla con una sola lectura.
+
+        Args:
+            task_ids (list[int]): IDs de las tareas a modificar.
+            tag (str | None): Nuevo tag. `None` o vacío si el usuario
+                canceló.
+        """
+        if not tag or not tag.strip():
+            return
+        tag = tag.strip()
+        if tag not in get_args(Tag):
+            self.app.notify(
+                f"El tag '{tag}' no es válido.",
+                title="Error",
+                severity="error"
+            )
+            return
+
+        await self.service.update_tasks_service(task_ids, {"tag": tag})
+        self.app.notify(
+            f"{len(task_ids)} tareas con tag '{tag}'.",
+            title="Tag Actualizado"
+        )
+        await self._refresh_task_rows(task_ids)
 
 
     # .. ......................................................... filter_tasks
@@ -256,12 +448,15 @@ class Interface(App):
             self.notification_filter_tasks
         )
 
-    def notification_filter_tasks(self, filter_data: dict | None) -> None:
+    async def notification_filter_tasks(
+            self,
+            filter_data: dict | None
+    ) -> None:
         """Callback que recibe los criterios de filtro y actualiza la tabla.
 
-        Limpia y estandariza los datos del filtro, llama al servicio para
-        obtener las tareas filtradas y actualiza el `DataTable` con los
-        resultados.
+        Limpia y estandariza los datos del filtro y carga la tabla con una
+        fuente paginada de las tareas filtradas, que sólo pide las filas
+        cercanas a la vista.
 
         Args:
             filter_data (dict | None): Diccionario con los filtros a aplicar.
@@ -269,6 +464,7 @@ class Interface(App):
                 Es `None` si el usuario canceló la pantalla de filtros.
         """
         if filter_data:
+            self._clear_live_filter()
             # 1. formato para el diccionario: si un valor está vacío se
             # convierte a None para que el servicio no lo use como filtro.
             filters = {
@@ -276,47 +472,49 @@ class Interface(App):
                 for key, value in filter_data.items()
             }
 
-            # 2. Llamada al servicio con los filtros desempaquetados.
-            service = TaskService()
-            filtered_tasks_objects = service.filter_tasks_service(**filters)
-
-            # 3. Formateo de los resultados para la tabla
-            # (incluyendo cabeceras).
-            headers = ("ID", "Status", "Tag", "Contenido", "Prioridad")
-            results_for_ui: list[Any] = [headers]
-            for task in filtered_tasks_objects:
-                results_for_ui.append(
-                    (task.id,
-                     task.status,
-                     task.tag,
-                     task.content,
-                     task.priority
-                     )
-                )
+            # 2. Carga de la tabla con una fuente paginada que aplica los
+            # filtros, y conteo de las tareas que coinciden.
+            self._load_table(
+                partial(self.service.get_tasks_page_service, **filters)
+            )
+            total = await self.service.count_tasks_service(**filters)
 
-            # 4. Actualización de la tabla con los datos filtrados.
-            table = self.query_one(DataTable)
-            # Limpia las filas anteriores.
-            table.clear()
-
-            # Añadimos solo las filas filtradas
-            for row_data in results_for_ui[1:]:
-                styled_row = list(row_data)
-                status_texto = styled_row[1]
-                prioridad_texto = styled_row[4]
-                styled_status = get_status_style(status_texto)
-                if isinstance(styled_status, Text):
-                    styled_status.justify = "center"
-                styled_priority = get_priority_style(prioridad_texto)
-                if isinstance(styled_priority, Text):
-                    styled_priority.justify = "center"
-                styled_row[1] = styled_status
-                styled_row[4] = styled_priority
-                table.add_row(*styled_row)
+            self.app.notify(f"Mostrando {total} tareas filtradas.")
 
-            self.app.notify(
-                f"Mostrando {len(filtered_tasks_objects)} tareas filtradas."
-            )
+
+    # .. ......................................................... search_tasks
+    def action_search_tasks(self) -> None:
+        """Maneja el atajo 's' para buscar tareas por texto.
+
+        Abre la pantalla modal `SearchTasksScreen` y asigna
+        `notification_search_tasks` como callback.
+        """
+        self.push_screen(
+            SearchTasksScreen(),
+            self.notification_search_tasks
+        )
+
+    async def notification_search_tasks(self, query: str | None) -> None:
+        """Callback que busca tareas por texto y muestra los resultados.
+
+        Los resultados se muestran en la tabla ordenados por relevancia.
+
+        Args:
+            query (str | None): Texto a buscar. Vacío o `None` si el usuario
+                no escribió nada.
+        """
+        if not query or not query.strip():
+            return
+
+        # Cancela una carga de la tabla en curso para que no pise los
+        # resultados de la búsqueda.
+        self.workers.cancel_group(self, "table")
+        self._clear_live_filter()
+        found_tasks = await self.service.search_tasks_service(query)
+        self.query_one(TaskTable).show_tasks(found_tasks)
+        self.app.notify(
+            f"{len(found_tasks)} tareas coinciden con '{query}'."
+        )
 
 
     # .. ............................................................ edit_task
@@ -332,7 +530,7 @@ class Interface(App):
         )
 
     @require_valid_id
-    def _start_edit_process(self, task_id: int) -> None:
+    async def _start_edit_process(self, task_id: int) -> None:
         """Callback que obtiene la tarea y muestra la pantalla de edición.
 
         Es llamado al cerrar `AskIdScreen`. Obtiene el objeto de la tarea
@@ -343,19 +541,24 @@ class Interface(App):
             task_id (int): ID de la tarea a editar, validado por
                 `@require_valid_id`.
         """
-        service = TaskService()
-        task_to_edit = service.get_task_by_id_service(task_id)
+        task_to_edit = await self.service.get_task_by_id_service(task_id)
         if task_to_edit:
+            # Pantalla de uso ocasional: se importa al abrirla por primera vez.
+            from .detail_screens import AskTaskEdit
+
             self.push_screen(
                 AskTaskEdit(task_to_edit),
                 self._save_edit_changes
             )
 
-    def _save_edit_changes(self, updated_data: dict | None) -> None:
+    async def _save_edit_changes(self, updated_data: dict | None) -> None:
         """Callback final que guarda los cambios de la edición.
 
         Es llamado al cerrar `AskTaskEdit`. Si hay datos, extrae el ID,
-        llama al servicio para actualizar la tarea y refresca la tabla.
+        llama al servicio para actualizar la tarea y actualiza su fila. El
+        tag y la prioridad se escriben a mano, así que se comprueban contra
+        los valores del modelo antes de guardar; si no son válidos se avisa
+        y la tarea no cambia.
 
         Args:
             updated_data (dict | None): Diccionario con datos actualizados.
@@ -365,13 +568,28 @@ class Interface(App):
         if updated_data:
             task_id = updated_data.pop("id")
             new_data = updated_data
-            service = TaskService()
-            service.update_task_service(task_id, new_data)
+            new_data["tag"] = new_data["tag"].strip()
+            new_data["priority"] = new_data["priority"].strip()
+            if not new_data["content"].strip():
+                error = "El contenido no puede estar vacío."
+            elif new_data["tag"] not in get_args(Tag):
+                error = f"El tag '{new_data['tag']}' no es válido."
+            elif new_data["priority"] not in get_args(Priority):
+                error = (
+                    f"La prioridad '{new_data['priority']}' no es válida."
+                )
+            else:
+                error = None
+            if error is not None:
+                self.app.notify(error, title="Error", severity="error")
+                return
+
+            await self.service.update_task_service(task_id, new_data)
             self.app.notify(
                 f"Tarea ID: '{task_id}' ha sido actualizada.",
                 title="Tarea Editada"
             )
-            self._update_table()
+            await self._refresh_task_row(task_id)
 
 
     # .. ......................................................... view_details
@@ -388,7 +606,7 @@ class Interface(App):
 
 
     @require_valid_id
-    def _show_details_screen(self, task_id: int) -> None:
+    async def _show_details_screen(self, task_id: int) -> None:
         """Callback que obtiene la tarea y muestra la pantalla de detalles.
 
         Es llamado al cerrar `AskIdScreen`. Obtiene la tarea completa y
@@ -398,15 +616,18 @@ class Interface(App):
             task_id (int): ID de la tarea a consultar, validado por
                 `@require_valid_id`.
         """
-        service = TaskService()
-        task = service.get_task_by_id_service(task_id)
+        task = await self.service.get_task_by_id_service(task_id)
+
+        # Comprobación de que la tarea existe. Sin detalles (`None`), la
+        # pantalla muestra un aviso en lugar del Markdown.
+        if task and task.id is not None:
+            # Mostrar la pantalla de detalles con la tarea extraída. Su módulo
+            # (y el widget Markdown) se importa al abrirla por primera vez.
+            from .detail_screens import ViewDetailsScreen
 
-        # Comprobación de que la tarea y sus atributos requeridos no son nulos.
-        if task and task.id is not None and task.details is not None:
-            # Mostrar la pantalla de detalles con la tarea extraída.
             self.push_screen(
                 ViewDetailsScreen(
-                    details_content=task.details,
+                    details_content=task.details or "",
                     task_id=task.id
                 )
             )
@@ -417,9 +638,55 @@ class Interface(App):
         """Maneja el atajo 'r' para limpiar filtros y refrescar la tabla.
 
         Llama directamente a `_update_table()` para recargar la lista
-        completa de tareas.
+        completa de tareas y refresca el panel de totales. También vacía la
+        barra de filtro en vivo.
         """
+        self._clear_live_filter()
         self._update_table()
+        self.run_worker(self._refresh_stats())
         self.app.notify(
             "Filtros limpiados. Mostrando todas las tareas."
         )
+
+
+    # .. ........................................................ live_filter
+    def action_focus_filter(self) -> None:
+        """Maneja el atajo '/' para escribir en la barra de filtro en vivo."""
+        self.query_one(FilterBar).focus()
+
+    def on_filter_bar_filters_changed(
+            self,
+            message: FilterBar.FiltersChanged
+    ) -> None:
+        """Aplica el filtro de la barra cuando el usuario deja de escribir.
+
+        La carga se lanza como worker exclusivo del grupo "table": si llega
+        otro filtro antes de que termine, la carga anterior se cancela (y sus
+        consultas pendientes no llegan a ejecutarse).
+
+        Args:
+            message (FilterBar.FiltersChanged): Filtro ya interpretado.
+        """
+        self.run_worker(
+            self._live_filter(message.filters),
+            group="table",
+            exclusive=True
+        )
+
+    async def _live_filter(self, filters: dict) -> None:
+        """Carga la tabla con el filtro de la barra y muestra el conteo.
+
+        Sólo se pide la primera ventana de filas, y las filas anteriores se
+        mantienen hasta que las nuevas se dibujan de una vez. El número de
+        tareas que coinciden se muestra en el subtítulo.
+
+        Args:
+            filters (dict): Argumentos de `parse_filter_text`.
+        """
+        source = partial(self.service.get_tasks_page_service, **filters)
+        await self.query_one(TaskTable).load(source, show_loading=False)
+        if not any(filters.values()):
+            self.sub_title = ""
+            return
+        total = await self.service.count_tasks_service(**filters)
+        self.sub_title = f"{total} tareas filtradas"
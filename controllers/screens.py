@@ -4,14 +4,16 @@
 
 Cada clase en este módulo representa una pantalla modal (un pop-up) con un
 propósito específico, como solicitar un ID, pedir datos para una nueva tarea
-o mostrar detalles. Heredan de `textual.screen.ModalScreen`.
+o filtrar tareas. Heredan de `textual.screen.ModalScreen`.
+
+Las pantallas de uso ocasional que trabajan con una sola tarea completa
+(editarla o ver sus detalles) están en `controllers.detail_screens`, que se
+importa sólo al abrirlas.
 """
-from typing import Any
 from textual.screen import ModalScreen
 from textual.app import ComposeResult
-from textual.widgets import Button, Input, Label, Markdown, TextArea
+from textual.widgets import Button, Input, Label, TextArea
 from textual.containers import Vertical, Horizontal
-from models.model_task import Task
 
 
 class AskIdScreen(ModalScreen):
@@ -21,8 +23,20 @@ class AskIdScreen(ModalScreen):
         - check_uncheck_task: cambiar estatus de tarea.
         - edita_task: editar tarea.
         - delete_task: eliminar tarea.
+
+    Con `multiple=True` pide una lista de IDs y rangos (ej. "3-40,52").
     """
 
+    def __init__(self, multiple: bool = False):
+        """Inicializa la pantalla.
+
+        Args:
+            multiple (bool): Si se aceptan varios IDs y rangos.
+        """
+        super().__init__()
+        self.multiple = multiple
+
+
     def compose(self) -> ComposeResult:
         """Compone la UI de la pantalla.
 
@@ -35,10 +49,16 @@ class AskIdScreen(ModalScreen):
                 Textual renderizará.
         """
         with Vertical(classes="dialog"):
-            yield Label(
-                "Introduce el ID de la tarea y presiona Enter:", 
-                classes="label"
-            )
+            if self.multiple:
+                yield Label(
+                    "Introduce los IDs (ej. 3-40,52) y presiona Enter:",
+                    classes="label"
+                )
+            else:
+                yield Label(
+                    "Introduce el ID de la tarea y presiona Enter:", 
+                    classes="label"
+                )
             yield Input(id="id_input")
 
 
@@ -105,65 +125,6 @@ class AddTaskScreen(ModalScreen):
 
 
 
-class AskTaskEdit(ModalScreen):
-    """Pantalla modal para EDITAR una tarea existente."""
-
-    def __init__(self, task_to_edit: Task):
-        """Inicializa la pantalla de edición con los datos de una tarea
-        existente.
-
-        Args:
-            task_to_edit (Task): Objeto de la tarea que se va a editar.
-                Sus datos se usarán para pre-rellenar los campos de la pantalla.
-        """
-        super().__init__()
-        self.task_to_edit = task_to_edit
-
-
-    def compose(self) -> ComposeResult:
-        """Compone la UI de la pantalla."""
-        with Vertical(classes="dialog"):
-            yield Label(f"Editando Tarea ID: {self.task_to_edit.id}")
-            yield Label("Contenido de la tarea:")
-            yield Input(id="content_input", value=self.task_to_edit.content)
-            yield Label("Tag (personal, proyecto, trabajo, calendario):")
-            yield Input(id="tag_input", value=self.task_to_edit.tag)
-            yield Label("Prioridad (baja, media, alta):")
-            yield Input(id="priority_input", value=self.task_to_edit.priority)
-            yield Label("Detalles (opcional):")
-            initial_text = self.task_to_edit.details if self.task_to_edit.details else ""
-            yield TextArea(initial_text, id="details_input")
-
-            with Horizontal(classes="buttons"):
-                yield Button("Guardar Cambios", variant="primary", id="submit")
-                yield Button("Cancelar", id="cancel")
-
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Gestiona los botones 'Guardar Cambios' y 'Cancelar'.
-
-        Si se presiona 'submit', recopila los datos actualizados, añade el ID
-        de la tarea al diccionario y lo devuelve al cerrar la pantalla.
-        Si se presiona 'cancel', cierra la pantalla devolviendo `None`.
-
-        Args:
-            event (Button.Pressed): Evento que identifica botón presionado.
-        """
-        if event.button.id == "submit":
-            updated_data: dict[str, Any] = {
-                "content": self.query_one("#content_input", Input).value,
-                "tag": self.query_one("#tag_input", Input).value,
-                "priority": self.query_one("#priority_input", Input).value,
-                "details": self.query_one("#details_input", TextArea).text,
-            }
-            if self.task_to_edit:
-                updated_data["id"] = self.task_to_edit.id
-            self.dismiss(updated_data)
-        else:
-            self.dismiss(None)
-
-
-
 class FilterTasksScreen(ModalScreen):
     """Pantalla modal para filtrar tareas."""
 
@@ -217,37 +178,61 @@ class FilterTasksScreen(ModalScreen):
 
 
 
-class ViewDetailsScreen(ModalScreen):
-    """Pantalla modal para mostrar los detalles de una tarea en Markdown."""
+class SearchTasksScreen(ModalScreen):
+    """Pantalla modal para buscar tareas por texto.
+
+    La búsqueda se realiza sobre el contenido y los detalles de las tareas.
+    """
+
+    def compose(self) -> ComposeResult:
+        """Compone la UI de la pantalla."""
+        with Vertical(classes="dialog"):
+            yield Label(
+                "Buscar en contenido y detalles, presiona Enter:",
+                classes="label"
+            )
+            yield Input(id="search_input", placeholder="E.g., reunión equipo")
+
 
-    def __init__(self, details_content: str, task_id: int):
-        """Inicializa la pantalla de visualización de detalles.
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Cierra la pantalla devolviendo el texto de búsqueda ingresado.
 
         Args:
-            details_content (str): Contenido de los detalles de la tarea,
-                que puede contener formato Markdown.
-            task_id (int): ID de la tarea, usado para mostrarlo en el título.
+            event (Input.Submitted): Evento que contiene el valor del Input.
+        """
+        self.dismiss(event.value)
+
+
+
+class RetagTasksScreen(ModalScreen):
+    """Pantalla modal para pedir el nuevo tag de varias tareas."""
+
+    def __init__(self, task_count: int):
+        """Inicializa la pantalla.
+
+        Args:
+            task_count (int): Número de tareas a las que se aplicará el tag,
+                mostrado en el título.
         """
         super().__init__()
-        self.details_content = details_content
-        self.task_id = task_id
+        self.task_count = task_count
 
 
     def compose(self) -> ComposeResult:
         """Compone la UI de la pantalla."""
         with Vertical(classes="dialog"):
-            yield Label(f"Detalles de la Tarea ID: {self.task_id}")
-
-            # El widget de Markdown renderizará el texto.
-            # Si no hay detalles, muestra un mensaje por defecto.
-            markdown_text = self.details_content or "*No hay detalles para esta tarea.*"
-            with Vertical(id="markdown_container"):
-                yield Markdown(markdown_text)
+            yield Label(
+                f"Nuevo tag para {self.task_count} tareas "
+                "(personal, proyecto, trabajo, calendario):",
+                classes="label"
+            )
+            yield Input(id="tag_input", placeholder="E.g., trabajo")
 
-            with Horizontal(classes="buttons"):
-                yield Button("Cerrar", variant="primary", id="close_details")
 
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Cierra la pantalla devolviendo el tag ingresado.
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Cierra la pantalla modal cuando se presiona el botón 'Cerrar'."""
-        self.dismiss()
+        Args:
+            event (Input.Submitted): Evento que contiene el valor del Input.
+        """
+        self.dismiss(event.value)
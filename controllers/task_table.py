@@ -0,0 +1,541 @@
+# MODULO: controllers
+# .. ........................................................... task_table ..󰌠
+"""Define la tabla de tareas virtualizada de la interfaz.
+
+La clase `TaskTable` extiende el `DataTable` de Textual para mantener en
+pantalla sólo una ventana de filas alrededor del cursor. Las filas se piden a
+una fuente paginada asíncrona (ver `AsyncTaskService.get_tasks_page_service`)
+a medida que el usuario se desplaza, de modo que el costo de dibujar la tabla
+no depende del número total de tareas y la interfaz no espera a SQLite.
+"""
+import asyncio
+from typing import Awaitable, Callable
+from rich.text import Text
+from textual import events
+from textual.binding import Binding
+from textual.widgets import DataTable
+from .dinamic_colors import get_priority_style, get_status_style
+from config.config_loader import UI_COLORS, UI_ICONS
+from models.model_task import TaskSummary
+
+
+# Fuente de páginas: recibe `after_id`, `before_id` y `limit` como argumentos
+# de palabra clave y devuelve (de forma asíncrona) las tareas en orden
+# ascendente de ID.
+PageSource = Callable[..., Awaitable[list[TaskSummary]]]
+
+# ID mayor que cualquier ID real; sirve para pedir la última página.
+_MAX_ID = 2**63 - 1
+
+
+class TaskTable(DataTable):
+    """Tabla de tareas que carga sólo la ventana de filas visible.
+
+    Mantiene como máximo `window_size` filas. Al llegar al borde inferior (o
+    superior) de la ventana, desplaza la ventana media página pidiendo a la
+    fuente las filas siguientes (o anteriores) por ID.
+
+    También puede mostrar una lista fija de tareas (ej. resultados de una
+    búsqueda ordenados por relevancia) con `show_tasks`; en ese caso no hay
+    paginación.
+
+    Mientras se espera una página se muestra el indicador de carga. Sólo se
+    pide una página a la vez, y si la fuente cambia mientras tanto (nuevo
+    filtro o recarga) la página obsoleta se descarta.
+
+    Las filas pueden marcarse (espacio, o Mayús+flechas para marcar un rango)
+    para aplicar una acción a todas a la vez; las marcas se guardan por ID y
+    se conservan al desplazar la ventana, pero se quitan al cambiar de fuente
+    (`load` o `show_tasks`), para que una acción no alcance tareas marcadas
+    en un filtro o búsqueda que ya no se ve.
+    """
+
+    BINDINGS = [
+        Binding("space", "toggle_mark", "Marcar"),
+        Binding("shift+down", "mark_down", "Marcar rango", show=False),
+        Binding("shift+up", "mark_up", "Marcar rango", show=False),
+        Binding("escape", "clear_marks", "Desmarcar", show=False),
+    ]
+
+    # (cabecera, clave de columna, ancho)
+    COLUMNS: tuple[tuple[str, str, int | None], ...] = (
+        ("ID", "id", None),
+        ("Status", "status", None),
+        ("Tag", "tag", 20),
+        ("Contenido", "content", 90),
+        ("Prioridad", "priority", None),
+        ("Notas", "notes", None),
+    )
+
+    def __init__(self, window_size: int = 200, **kwargs):
+        """Inicializa la tabla sin fuente de datos.
+
+        Args:
+            window_size (int): Número máximo de filas cargadas a la vez.
+            **kwargs: Argumentos adicionales para `DataTable`.
+        """
+        super().__init__(**kwargs)
+        self.window_size = window_size
+        self._source: PageSource | None = None
+        self._window: list[TaskSummary] = []
+        self._paging = asyncio.Lock()
+        self.marked: set[int] = set()
+
+
+    def on_mount(self) -> None:
+        """Configura el cursor por filas y las columnas de la tabla."""
+        self.cursor_type = "row"
+        for label, key, width in self.COLUMNS:
+            self.add_column(label, key=key, width=width)
+
+
+    # .. ................................................. Formato de filas ..󰌠
+    @staticmethod
+    def task_cells(task: TaskSummary) -> tuple:
+        """Convierte una tarea en las celdas estilizadas de una fila.
+
+        Args:
+            task (TaskSummary): Tarea a mostrar.
+
+        Returns:
+            tuple: Celdas en el orden de `COLUMNS`.
+        """
+        styled_status = get_status_style(task.status)
+        if isinstance(styled_status, Text):
+            styled_status.justify = "center"
+        styled_priority = get_priority_style(task.priority)
+        if isinstance(styled_priority, Text):
+            styled_priority.justify = "center"
+        notes_indicator = Text(
+            UI_ICONS['nota'] if task.has_details else "",
+            justify="center",
+            style=UI_COLORS['green']
+        )
+        return (
+            task.id,
+            styled_status,
+            task.tag,
+            task.content,
+            styled_priority,
+            notes_indicator
+        )
+
+
+    def _row_cells(self, task: TaskSummary) -> tuple:
+        """Devuelve las celdas de una fila, resaltando el ID si está marcada.
+
+        Args:
+            task (TaskSummary): Tarea a mostrar.
+
+        Returns:
+            tuple: Celdas en el orden de `COLUMNS`.
+        """
+        cells = self.task_cells(task)
+        if task.id not in self.marked:
+            return cells
+        marked_id = Text(
+            f"{UI_ICONS.get('marcada', '● ')}{task.id}",
+            style=f"bold {UI_COLORS['orange']}"
+        )
+        return (marked_id, *cells[1:])
+
+
+    def _render_window(
+            self,
+            tasks: list[TaskSummary],
+            cursor_id: int | None = None
+    ) -> None:
+        """Reemplaza las filas de la tabla por la ventana indicada.
+
+        Args:
+            tasks (list[TaskSummary]): Tareas de la nueva ventana.
+            cursor_id (int | None): ID de la tarea donde dejar el cursor. Si
+                no está en la ventana, el cursor queda en la primera fila.
+        """
+        self._window = tasks
+        self.clear()
+        for task in tasks:
+            self.add_row(*self._row_cells(task), key=str(task.id))
+
+        if cursor_id is not None and any(t.id == cursor_id for t in tasks):
+            self.move_cursor(row=self.get_row_index(str(cursor_id)))
+
+
+    # .. ................................................... Carga de datos ..󰌠
+    async def load(
+            self,
+            source: PageSource,
+            show_loading: bool = True
+    ) -> None:
+        """Muestra la primera ventana de una fuente paginada.
+
+        Args:
+            source (PageSource): Función asíncrona que devuelve páginas de
+                tareas, ej. `service.get_tasks_page_service` (o un `partial`
+                con filtros aplicados).
+            show_loading (bool): Si se muestra el indicador de carga mientras
+                llega la ventana. El filtro en vivo lo desactiva: las filas
+                anteriores se mantienen hasta que las nuevas se dibujan de
+                una vez, sin parpadeo entre pulsaciones.
+        """
+        self._source = source
+        self.marked.clear()
+        # Mientras carga, la tabla no puede tener el foco y Textual lo pasa
+        # al siguiente widget (la barra de filtro); se recupera al terminar.
+        had_focus = self.has_focus
+        self.loading = show_loading
+        try:
+            tasks = await source(after_id=0, limit=self.window_size)
+        finally:
+            self.loading = False
+            if had_focus and show_loading:
+                self.focus()
+        if self._source is source:
+            self._render_window(tasks)
+
+
+    def show_tasks(self, tasks: list[TaskSummary]) -> None:
+        """Muestra una lista fija de tareas, sin paginación.
+
+        Args:
+            tasks (list[TaskSummary]): Tareas a mostrar, en el orden deseado.
+        """
+        self._source = None
+        self.marked.clear()
+        self._render_window(tasks)
+
+
+    async def reload_window(self) -> bool:
+        """Vuelve a leer de la fuente la ventana actual con una consulta.
+
+        Se usa tras una operación por lotes: en lugar de actualizar fila a
+        fila, se pide de nuevo la ventana desde su primer ID. El cursor se
+        conserva en la misma tarea o, si ya no está, en la misma posición.
+
+        Returns:
+            bool: `False` si no hay fuente (lista fija) y no se recargó nada.
+        """
+        source = self._source
+        if source is None:
+            return False
+        first_id = self._window[0].id if self._window else 1
+        cursor_id, cursor_row = self._current_id(), self.cursor_row
+        tasks = await source(after_id=first_id - 1, limit=self.window_size)
+        if self._source is source:
+            self._render_window(tasks, cursor_id=cursor_id)
+            if cursor_id not in {task.id for task in tasks} and tasks:
+                self.move_cursor(row=min(cursor_row, len(tasks) - 1))
+        return True
+
+
+    # .. ......................................... Actualizaciones por fila ..󰌠
+    def _window_position(self, task_id: int) -> int | None:
+        """Devuelve la posición de una tarea en la ventana, si está cargada.
+
+        Args:
+            task_id (int): ID de la tarea.
+
+        Returns:
+            int | None: Índice en la ventana, o `None` si no está cargada.
+        """
+        for position, task in enumerate(self._window):
+            if task.id == task_id:
+                return position
+        return None
+
+
+    async def _in_source(self, task_id: int) -> bool:
+        """Comprueba si una tarea pertenece a la fuente actual.
+
+        Se pide a la fuente una página de una fila a partir del ID: si la
+        primera tarea devuelta es la buscada, cumple los filtros de la fuente.
+        Sin fuente (lista fija) se considera que sí pertenece.
+
+        Args:
+            task_id (int): ID de la tarea.
+
+        Returns:
+            bool: `True` si la tarea forma parte de la fuente.
+        """
+        if self._source is None:
+            return True
+        page = await self._source(after_id=task_id - 1, limit=1)
+        return bool(page) and page[0].id == task_id
+
+
+    async def update_task_row(self, task: TaskSummary) -> None:
+        """Actualiza en sitio la fila de una tarea modificada.
+
+        Si la tarea ya no cumple los filtros de la fuente (ej. cambió de
+        status en una vista filtrada por status), su fila se elimina. Si la
+        tarea no está en la ventana cargada, no hay nada que redibujar.
+
+        Args:
+            task (TaskSummary): Tarea con sus datos actualizados.
+        """
+        if self._window_position(task.id) is None:
+            return
+        if not await self._in_source(task.id):
+            self.remove_task_row(task.id)
+            return
+
+        # La ventana pudo cambiar mientras se consultaba la fuente.
+        position = self._window_position(task.id)
+        if position is None:
+            return
+        self._window[position] = task
+        row_key = str(task.id)
+        for (_, column_key, _), cell in zip(self.COLUMNS, self._row_cells(task)):
+            self.update_cell(row_key, column_key, cell)
+
+
+    async def add_task_row(self, task: TaskSummary) -> None:
+        """Añade la fila de una tarea recién creada, si es visible.
+
+        Las tareas nuevas tienen el ID más alto, así que sólo se añaden si la
+        ventana está mostrando el final de la fuente y la tarea cumple sus
+        filtros. Si la ventana supera `window_size`, se descarta la primera
+        fila.
+
+        Args:
+            task (TaskSummary): Tarea recién creada, con su ID.
+        """
+        if self._source is None:
+            return
+        last_id = self._window[-1].id if self._window else 0
+        next_page = await self._source(after_id=last_id, limit=1)
+        if not next_page or next_page[0].id != task.id:
+            return
+        if self._window_position(task.id) is not None:
+            return
+
+        self._window.append(task)
+        self.add_row(*self._row_cells(task), key=str(task.id))
+        if len(self._window) > self.window_size:
+            self.remove_task_row(self._window[0].id)
+
+
+    def remove_task_row(self, task_id: int | None) -> None:
+        """Elimina la fila de una tarea, si está en la ventana cargada.
+
+        Args:
+            task_id (int | None): ID de la tarea eliminada.
+        """
+        if task_id is None:
+            return
+        position = self._window_position(task_id)
+        if position is None:
+            return
+        del self._window[position]
+        self.remove_row(str(task_id))
+
+
+    # .. ............................................... Selección de filas ..󰌠
+    def marked_ids(self) -> list[int]:
+        """Devuelve los IDs de las tareas marcadas, en orden ascendente."""
+        return sorted(self.marked)
+
+
+    def _set_mark(self, task_id: int, marked: bool) -> None:
+        """Marca o desmarca una tarea y redibuja su celda de ID si está en
+        la ventana.
+
+        Args:
+            task_id (int): ID de la tarea.
+            marked (bool): `True` para marcarla, `False` para desmarcarla.
+        """
+        if marked:
+            self.marked.add(task_id)
+        else:
+            self.marked.discard(task_id)
+        position = self._window_position(task_id)
+        if position is not None:
+            cells = self._row_cells(self._window[position])
+            self.update_cell(str(task_id), "id", cells[0])
+
+
+    def clear_marks(self) -> None:
+        """Quita todas las marcas."""
+        for task_id in list(self.marked):
+            self._set_mark(task_id, False)
+
+
+    def action_toggle_mark(self) -> None:
+        """Marca o desmarca la fila bajo el cursor."""
+        task_id = self._current_id()
+        if task_id is not None:
+            self._set_mark(task_id, task_id not in self.marked)
+
+
+    async def action_mark_down(self) -> None:
+        """Marca la fila actual y la siguiente, bajando el cursor."""
+        self._mark_current()
+        await self._cursor_down()
+        self._mark_current()
+
+
+    async def action_mark_up(self) -> None:
+        """Marca la fila actual y la anterior, subiendo el cursor."""
+        self._mark_current()
+        await self._cursor_up()
+        self._mark_current()
+
+
+    def action_clear_marks(self) -> None:
+        """Quita todas las marcas."""
+        self.clear_marks()
+
+
+    def _mark_current(self) -> None:
+        """Marca la fila bajo el cursor, si la hay."""
+        task_id = self._current_id()
+        if task_id is not None:
+            self._set_mark(task_id, True)
+
+
+    # .. ....................................................... Paginación ..󰌠
+    def _current_id(self) -> int | None:
+        """Devuelve el ID de la tarea bajo el cursor, si la hay."""
+        if not self._window or not self.is_valid_row_index(self.cursor_row):
+            return None
+        return self._window[self.cursor_row].id
+
+
+    async def _slide(self, forward: bool) -> bool:
+        """Desplaza la ventana media página hacia IDs mayores o menores.
+
+        Si ya hay una página en camino, no se pide otra.
+
+        Args:
+            forward (bool): `True` para avanzar, `False` para retroceder.
+
+        Returns:
+            bool: `True` si se cargaron filas nuevas.
+        """
+        source = self._source
+        if source is None or not self._window or self._paging.locked():
+            return False
+
+        async with self._paging:
+            edge_id = self._window[-1 if forward else 0].id
+            half = max(self.window_size // 2, 1)
+            if forward:
+                more = await source(after_id=edge_id, limit=half)
+            else:
+                more = await source(before_id=edge_id, limit=half)
+
+            # Página obsoleta: cambió la fuente o el borde de la ventana.
+            current_edge = self._window[-1 if forward else 0].id \
+                if self._window else None
+            if not more or self._source is not source or current_edge != edge_id:
+                return False
+
+            keep = max(self.window_size - len(more), 0)
+            if forward:
+                new_window = self._window[len(self._window) - keep:] + more
+            else:
+                new_window = more + self._window[:keep]
+            self._render_window(new_window, cursor_id=self._current_id())
+            return True
+
+
+    async def _jump(self, to_end: bool) -> None:
+        """Carga la primera o la última ventana de la fuente.
+
+        Args:
+            to_end (bool): `True` para saltar al final, `False` al inicio.
+        """
+        source = self._source
+        if source is None:
+            return
+        if to_end:
+            tasks = await source(before_id=_MAX_ID, limit=self.window_size)
+        else:
+            tasks = await source(after_id=0, limit=self.window_size)
+        if self._source is source:
+            self._render_window(tasks)
+
+
+    # .. ....................................................... Navegación ..󰌠
+    # Las acciones de `DataTable` son síncronas; las que pueden tener que
+    # pedir una página delegan en una corrutina que se ejecuta como worker.
+    async def _cursor_down(self) -> None:
+        """Baja el cursor, cargando más filas al llegar al final."""
+        if self.cursor_row >= self.row_count - 1:
+            await self._slide(forward=True)
+        super().action_cursor_down()
+
+
+    async def _cursor_up(self) -> None:
+        """Sube el cursor, cargando filas previas al llegar al inicio."""
+        if self.cursor_row <= 0:
+            await self._slide(forward=False)
+        super().action_cursor_up()
+
+
+    async def _page_down(self) -> None:
+        """Avanza una página, cargando más filas si la página no cabe."""
+        if self.cursor_row + self.size.height >= self.row_count - 1:
+            await self._slide(forward=True)
+        super().action_page_down()
+
+
+    async def _page_up(self) -> None:
+        """Retrocede una página, cargando filas previas si hace falta."""
+        if self.cursor_row - self.size.height <= 0:
+            await self._slide(forward=False)
+        super().action_page_up()
+
+
+    async def _scroll_top(self) -> None:
+        """Salta a la primera tarea de la fuente."""
+        await self._jump(to_end=False)
+        super().action_scroll_top()
+
+
+    async def _scroll_bottom(self) -> None:
+        """Salta a la última tarea de la fuente."""
+        await self._jump(to_end=True)
+        super().action_scroll_bottom()
+
+
+    def action_cursor_down(self) -> None:
+        """Ver `_cursor_down`."""
+        self.run_worker(self._cursor_down(), group="navigation")
+
+
+    def action_cursor_up(self) -> None:
+        """Ver `_cursor_up`."""
+        self.run_worker(self._cursor_up(), group="navigation")
+
+
+    def action_page_down(self) -> None:
+        """Ver `_page_down`."""
+        self.run_worker(self._page_down(), group="navigation")
+
+
+    def action_page_up(self) -> None:
+        """Ver `_page_up`."""
+        self.run_worker(self._page_up(), group="navigation")
+
+
+    def action_scroll_top(self) -> None:
+        """Ver `_scroll_top`."""
+        self.run_worker(self._scroll_top(), group="navigation")
+
+
+    def action_scroll_bottom(self) -> None:
+        """Ver `_scroll_bottom`."""
+        self.run_worker(self._scroll_bottom(), group="navigation")
+
+
+    async def on_mouse_scroll_down(self, event: events.MouseScrollDown) -> None:
+        """Carga más filas al desplazar con la rueda más allá del final."""
+        if self.scroll_y >= self.max_scroll_y:
+            await self._slide(forward=True)
+
+
+    async def on_mouse_scroll_up(self, event: events.MouseScrollUp) -> None:
+        """Carga filas previas al desplazar con la rueda antes del inicio."""
+        if self.scroll_y <= 0:
+            await self._slide(forward=False)
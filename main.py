@@ -3,17 +3,34 @@
 """Punto de entrada principal para la aplicación de Tareas-cli.
 
 Este script es el responsable de inicializar y ejecutar la interfaz de
-usuario de la aplicación.
+usuario de la aplicación. Con argumentos (ej. `tasks-cli list --json`)
+ejecuta el subcomando de `controllers.cli` sin cargar la interfaz.
 """
-from controllers.interface import Interface
+import sys
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """Inicializa y ejecuta la aplicación.
 
-    Crea una instancia de la clase Interface y llama a su método de ejecución
-    principal para poner en marcha el bucle de la aplicación.
+    Sin argumentos, crea una instancia de la clase Interface y llama a su
+    método de ejecución principal para poner en marcha el bucle de la
+    aplicación. Con argumentos, ejecuta el subcomando indicado y sale con su
+    código de salida.
+
+    La interfaz (Textual, Rich y todas las pantallas) se importa sólo cuando
+    se va a mostrar: un subcomando no paga ese costo de arranque.
+
+    Args:
+        argv (list[str] | None, optional): Argumentos sin el nombre del
+            programa. Por defecto, `sys.argv[1:]`.
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv:
+        from controllers.cli import run
+        sys.exit(run(argv))
+
+    from controllers.interface import Interface
     app = Interface()
     app.run()
 
@@ -3,10 +3,12 @@
 """Define el modelo de datos principal para una Tarea.
 
 Este módulo contiene la clase `Task`, que actúa como un Data Transfer Object
-(DTO) y modelo de validación usando Pydantic. También define los tipos 
-`Literal` para restringir los valores permitidos en los campos de la tarea.
+(DTO) y modelo de validación usando Pydantic, y su versión resumida
+`TaskSummary`, usada en listas y tablas. También define los tipos 
+`Literal` para restringir los valores permitidos en los campos de la tarea y
+los códigos enteros con los que esos valores se guardan en la base de datos.
 """
-from typing import Optional, Literal
+from typing import Any, Optional, Literal, TypeVar
 from pydantic import BaseModel
 
 
@@ -14,6 +16,29 @@ Status = Literal["pending", "in_progress", "completed"]
 Tag = Literal["personal", "proyecto", "trabajo", "calendario"]
 Priority = Literal["baja", "media", "alta"]
 
+# Códigos enteros con los que se guardan status, tag y prioridad en la base
+# de datos (tablas 'task_statuses', 'task_tags' y 'task_priorities'). Son
+# fijos: un valor nuevo recibe el siguiente código libre y nunca se reasigna
+# uno existente. El orden de los códigos es el orden al ordenar por columna.
+STATUS_CODES: dict[str, int] = {"pending": 0, "in_progress": 1, "completed": 2}
+TAG_CODES: dict[str, int] = {
+    "personal": 0, "proyecto": 1, "trabajo": 2, "calendario": 3
+}
+PRIORITY_CODES: dict[str, int] = {"baja": 0, "media": 1, "alta": 2}
+
+# Campo -> (valor -> código), y su inversa campo -> (código -> valor).
+FIELD_CODES: dict[str, dict[str, int]] = {
+    "status": STATUS_CODES,
+    "tag": TAG_CODES,
+    "priority": PRIORITY_CODES,
+}
+FIELD_VALUES: dict[str, dict[int, str]] = {
+    field: {code: value for value, code in codes.items()}
+    for field, codes in FIELD_CODES.items()
+}
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class Task(BaseModel):
     """Representa una única tarea y define su esquema de datos.
@@ -47,3 +72,81 @@ class Task(BaseModel):
             str: Cadena de caracteres con la información de la tarea.
         """
         return f"{self.status} - {self.tag} | {self.content} | {self.priority}"
+
+
+
+class TaskSummary(BaseModel):
+    """Versión resumida de una tarea guardada, sin sus detalles.
+
+    Las consultas de listas (tabla, filtros, búsquedas, caché) devuelven
+    este modelo: en lugar del texto de `details`, que puede ocupar varios KB
+    de Markdown, sólo indican si la tarea tiene detalles. El texto completo
+    se pide con `get_task_by_id` cuando hace falta mostrarlo o editarlo.
+
+    Attributes:
+        - id (int): Identificador único de la tarea.
+        - status (Status): Estado actual de la tarea.
+        - tag (Tag): La categoría o etiqueta de la tarea.
+        - content (str): Descripción principal de lo que se debe hacer.
+        - priority (Priority): Nivel de prioridad de la tarea.
+        - has_details (bool): `True` si la tarea tiene detalles no vacíos.
+    """
+    id: int
+    status: Status = "pending"
+    tag: Tag = "personal"
+    content: str
+    priority: Priority = "baja"
+    has_details: bool = False
+
+    @classmethod
+    def from_task(cls, task: Task) -> "TaskSummary":
+        """Crea el resumen de una tarea completa.
+
+        Args:
+            task (Task): Tarea con ID.
+
+        Returns:
+            TaskSummary: Resumen de la tarea.
+        """
+        assert task.id is not None, "Sólo se resumen tareas con ID."
+        return cls(
+            id=task.id,
+            status=task.status,
+            tag=task.tag,
+            content=task.content,
+            priority=task.priority,
+            has_details=bool(task.details),
+        )
+
+    def __str__(self) -> str:
+        """Devuelve una representación en cadena del resumen, igual que la
+        de `Task`.
+
+        Returns:
+            str: Cadena de caracteres con la información de la tarea.
+        """
+        return f"{self.status} - {self.tag} | {self.content} | {self.priority}"
+
+
+def construct_trusted(model: type[ModelT], values: dict[str, Any]) -> ModelT:
+    """Crea una instancia de un modelo sin validar sus datos.
+
+    Sólo debe usarse con datos ya validados, como las filas leídas de la base
+    de datos de la aplicación (se validaron al escribirse). Equivale a
+    `model.model_construct(**values)` pero sin rellenar valores por defecto,
+    por lo que `values` debe incluir todos los campos. Para listas grandes
+    es bastante más rápido que validar cada fila.
+
+    Args:
+        model (type[ModelT]): Clase del modelo, ej. `TaskSummary`.
+        values (dict[str, Any]): Valor de cada campo del modelo.
+
+    Returns:
+        ModelT: Instancia del modelo con esos valores.
+    """
+    instance = object.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
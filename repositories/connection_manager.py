@@ -3,11 +3,12 @@
 """Define un decorador para la gestión automática de conexiones a SQLite.
 
 Este módulo proporciona el decorador `connection_manager`, que abstrae el
-ciclo de vida de la conexión (apertura, commit/rollback, cierre) para
-los métodos que interactúan con la base de datos.
+ciclo de vida de la conexión (préstamo desde el pool, commit/rollback,
+devolución) para los métodos que interactúan con la base de datos.
 """
 import sqlite3
 import logging
+from functools import wraps
 from typing import Callable, Any
 
 
@@ -23,16 +24,17 @@ def connection_manager(func: Callable[..., Any]) -> Callable[..., Any]:
 
     Este decorador está diseñado para envolver métodos de una clase que
     necesitan interactuar con la base de datos. Se asume que la instancia de la
-    clase (`self`) tiene un atributo `db_path` con la ruta al archivo de la
-    base de datos.
+    clase (`self`) tiene un atributo `pool` (`ConnectionPool`) del que tomar
+    prestada la conexión.
 
     El decorador se encarga de:
-    1. Abrir una conexión a la base de datos usando `sqlite3.connect`.
+    1. Tomar prestada una conexión del pool (`self.pool.connection()`).
     2. Crear un cursor.
     3. Ejecutar el método decorado, inyectándole el `cursor` como un argumento
        de palabra clave (keyword argument).
     4. Cerrar el cursor de forma segura.
-    5. Hacer commit de la transacción si tiene éxito (implícito en `with`).
+    5. Hacer commit de la transacción si tiene éxito, o rollback si falla, y
+       devolver la conexión al pool (gestionado por el pool).
     6. Capturar y registrar cualquier `sqlite3.Error`, evitando que el programa
        se detenga.
 
@@ -45,9 +47,10 @@ def connection_manager(func: Callable[..., Any]) -> Callable[..., Any]:
         Callable: El nuevo método envuelto con la gestión de conexión.
     """
 
+    @wraps(func)
     def db_decorator(self, *args: Any, **kwargs: Any) -> Any:
         try:
-            with sqlite3.connect(self.db_path) as db_connect:
+            with self.pool.connection() as db_connect:
                 cursor = db_connect.cursor()
                 try:
                     # El cursos debe pasar como argumento de palabra clave.
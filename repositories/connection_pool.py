@@ -0,0 +1,218 @@
+# MODULO: repositories/
+# .. ...................................................... connection_pool ..󰌠
+"""Define un pool de conexiones reutilizables a SQLite.
+
+Este módulo proporciona la clase `ConnectionPool`, que mantiene abiertas las
+conexiones a la base de datos entre llamadas del repositorio. Así se evita el
+costo de abrir y cerrar un archivo SQLite en cada operación.
+"""
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+
+# PRAGMAs que el pool acepta desde la configuración, en el orden en que se
+# aplican. `busy_timeout` va primero para que el cambio de `journal_mode`
+# espere si otro proceso tiene bloqueada la base de datos.
+ALLOWED_PRAGMAS: tuple[str, ...] = (
+    "busy_timeout",
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+    "foreign_keys",
+)
+
+
+class ConnectionPool:
+    """Gestiona un conjunto de conexiones SQLite reutilizables.
+
+    Las conexiones se prestan de forma exclusiva: mientras un hilo usa una
+    conexión, ningún otro hilo la recibe. Si el mismo hilo vuelve a pedir una
+    conexión dentro de un préstamo activo (llamadas anidadas), recibe la misma
+    conexión y participa en la misma transacción.
+
+    Attributes:
+        - db_path (Path): Ruta al archivo de la base de datos.
+        - pragmas (dict[str, Any]): PRAGMAs aplicados a cada conexión nueva.
+        - max_idle (int): Número máximo de conexiones inactivas conservadas.
+              Las conexiones sobrantes se cierran al ser devueltas.
+        - functions (dict[str, Callable]): Funciones SQL de un argumento
+              registradas en cada conexión nueva.
+    """
+
+    def __init__(
+            self,
+            db_path: Path,
+            pragmas: dict[str, Any] | None = None,
+            max_idle: int = 4,
+            functions: dict[str, Callable[[Any], Any]] | None = None
+    ):
+        """Inicializa el pool sin abrir ninguna conexión.
+
+        Las conexiones se crean bajo demanda la primera vez que se necesitan.
+
+        Args:
+            db_path (Path): Ruta al archivo de la base de datos.
+            pragmas (dict[str, Any] | None): PRAGMAs a aplicar al abrir cada
+                conexión. Ej: `{"journal_mode": "WAL", "cache_size": -16000}`.
+            max_idle (int): Número máximo de conexiones inactivas a conservar.
+            functions (dict[str, Callable] | None): Funciones SQL
+                deterministas de un argumento, por nombre. Deben estar
+                registradas si el esquema las usa (ej. en triggers o vistas).
+        """
+        self.db_path = db_path
+        self.pragmas = pragmas or {}
+        self.max_idle = max_idle
+        self.functions = functions or {}
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._closed = False
+
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre una nueva conexión, aplica los PRAGMAs y registra las
+        funciones SQL.
+
+        Se desactiva `check_same_thread` porque el pool garantiza que una
+        conexión sólo es usada por un hilo a la vez.
+
+        Returns:
+            sqlite3.Connection: Conexión recién abierta.
+        """
+        db_connect = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._apply_pragmas(db_connect)
+        for name, function in self.functions.items():
+            db_connect.create_function(name, 1, function, deterministic=True)
+        return db_connect
+
+
+    def _apply_pragmas(self, db_connect: sqlite3.Connection) -> None:
+        """Aplica a la conexión los PRAGMAs configurados.
+
+        Los PRAGMAs no admiten parámetros `?`, por lo que sólo se aceptan los
+        nombres de `ALLOWED_PRAGMAS` y valores enteros o alfanuméricos. Los
+        valores no válidos se registran y se ignoran.
+
+        Args:
+            db_connect (sqlite3.Connection): Conexión recién abierta.
+        """
+        for name in ALLOWED_PRAGMAS:
+            if name not in self.pragmas:
+                continue
+            value = self.pragmas[name]
+            if isinstance(value, bool) or not (
+                isinstance(value, int)
+                or (isinstance(value, str) and value.isalnum())
+            ):
+                logging.error(f"Valor no válido para PRAGMA {name}: {value!r}")
+                continue
+            db_connect.execute(f"PRAGMA {name} = {value};").fetchall()
+
+        unknown = set(self.pragmas) - set(ALLOWED_PRAGMAS)
+        if unknown:
+            logging.error(f"PRAGMAs no soportados ignorados: {sorted(unknown)}")
+
+
+    @staticmethod
+    def _is_healthy(db_connect: sqlite3.Connection) -> bool:
+        """Comprueba que una conexión inactiva siga siendo utilizable.
+
+        Args:
+            db_connect (sqlite3.Connection): Conexión a comprobar.
+
+        Returns:
+            bool: `True` si la conexión responde a una consulta trivial.
+        """
+        try:
+            db_connect.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Toma una conexión sana del pool o abre una nueva.
+
+        Raises:
+            sqlite3.ProgrammingError: Si el pool ya fue cerrado.
+
+        Returns:
+            sqlite3.Connection: Conexión lista para usarse.
+        """
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise sqlite3.ProgrammingError(
+                        "El pool de conexiones está cerrado."
+                    )
+                db_connect = self._idle.pop() if self._idle else None
+
+            if db_connect is None:
+                return self._connect()
+            if self._is_healthy(db_connect):
+                return db_connect
+            # Conexión dañada: se descarta y se intenta con la siguiente.
+            db_connect.close()
+
+
+    def _release(self, db_connect: sqlite3.Connection) -> None:
+        """Devuelve una conexión al pool, o la cierra si sobra.
+
+        Args:
+            db_connect (sqlite3.Connection): Conexión a devolver.
+        """
+        if db_connect.in_transaction:
+            db_connect.rollback()
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(db_connect)
+                return
+        db_connect.close()
+
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Presta una conexión durante el bloque `with`.
+
+        En el préstamo más externo se hace commit si el bloque termina sin
+        errores y rollback si se lanza una excepción. Los préstamos anidados
+        del mismo hilo reutilizan la conexión y dejan la transacción en manos
+        del préstamo externo.
+
+        Yields:
+            sqlite3.Connection: Conexión prestada.
+        """
+        current = getattr(self._local, "connection", None)
+        if current is not None:
+            yield current
+            return
+
+        db_connect = self._acquire()
+        self._local.connection = db_connect
+        try:
+            yield db_connect
+            db_connect.commit()
+        except BaseException:
+            db_connect.rollback()
+            raise
+        finally:
+            self._local.connection = None
+            self._release(db_connect)
+
+
+    def close(self) -> None:
+        """Cierra todas las conexiones inactivas y desactiva el pool.
+
+        Las conexiones prestadas en ese momento se cierran al ser devueltas.
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for db_connect in idle:
+            db_connect.close()
@@ -5,21 +5,59 @@
 Utiliza la biblioteca `platformdirs` para determinar la ruta apropiada para
 almacenar los datos de la aplicación, asegurando que sea persistente y esté
 en la ubicación correcta según el sistema operativo.
+
+La ruta se calcula (y el directorio se crea) la primera vez que se pide,
+con `data_dir()` o al leer `DATABASE_PATH` / `TEST_DATABASE_PATH`, y no al
+importar el módulo.
 """
+from functools import cache
 from pathlib import Path
-from platformdirs import PlatformDirs
 
 
-# Se utiliza el nombre del autor y de la aplicación para crear un directorio
-# único y evitar conflictos con otras aplicaciones.
-_dirs = PlatformDirs(appname="tasks-cli", appauthor="GUScode")
+# Nombre de cada archivo de base de datos dentro del directorio de datos.
+_DATABASE_FILES: dict[str, str] = {
+    # Base de datos de producción.
+    "DATABASE_PATH": "tasks-cli.db",
+    # Base de datos para las pruebas.
+    "TEST_DATABASE_PATH": "tasks-cli-tests.db",
+}
+
+DATABASE_PATH: Path
+TEST_DATABASE_PATH: Path
+
+
+@cache
+def data_dir() -> Path:
+    """Devuelve el directorio de datos del usuario, creándolo si no existe.
+
+    Se utiliza el nombre del autor y de la aplicación para crear un
+    directorio único y evitar conflictos con otras aplicaciones.
+
+    Returns:
+        Path: Directorio donde se guardan las bases de datos.
+    """
+    from platformdirs import PlatformDirs
+
+    dirs = PlatformDirs(appname="tasks-cli", appauthor="GUScode")
+    path = dirs.user_data_path
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def __getattr__(name: str) -> Path:
+    """Resuelve `DATABASE_PATH` y `TEST_DATABASE_PATH` la primera vez.
+
+    Args:
+        name (str): Nombre de la ruta.
 
-# Se construye la ruta completa a la base de datos, asegurando que el
-# directorio de datos del usuario exista.
-_data_dir = _dirs.user_data_path
-_data_dir.mkdir(parents=True, exist_ok=True)
+    Raises:
+        AttributeError: Si el nombre no es una de las rutas.
 
-# Se define la ruta de la base de datos de producción.
-DATABASE_PATH = _data_dir / "tasks-cli.db"
-# Se define la ruta de la base de datos para las pruebas.
-TEST_DATABASE_PATH = _data_dir / "tasks-cli-tests.db"
\ No newline at end of file
+    Returns:
+        Path: Ruta completa al archivo de la base de datos.
+    """
+    if name not in _DATABASE_FILES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    path = data_dir() / _DATABASE_FILES[name]
+    globals()[name] = path
+    return path
@@ -0,0 +1,112 @@
+# MODULO: repositories
+# .. ........................................................ details_codec ..󰌠
+"""Comprime y descomprime el texto de los detalles de las tareas.
+
+Los detalles largos (registros, especificaciones pegadas) se guardan en
+`task_details.body` comprimidos con `zlib` o `lzma`, como BLOB precedido de
+una cabecera que indica el método. Los detalles cortos, y las filas escritas
+antes de existir la compresión, se guardan como texto y se leen sin cambios.
+
+`decompress_details` se registra además como la función SQL `details_text`
+en las conexiones del repositorio, para que el índice FTS indexe el texto y
+no los bytes comprimidos. Los triggers del índice la usan, así que cualquier
+otro programa que modifique o elimine tareas con detalles debe registrarla
+antes con `register_sql_function`.
+"""
+import lzma
+import sqlite3
+import zlib
+from typing import Callable
+
+
+# Cabecera de un valor comprimido: prefijo fijo seguido de un byte con el
+# método. Un valor de tipo TEXT nunca se interpreta como comprimido.
+HEADER_PREFIX: bytes = b"TZ"
+
+# Método -> (byte de la cabecera, función de compresión).
+COMPRESSORS: dict[str, tuple[bytes, Callable[[bytes], bytes]]] = {
+    "zlib": (b"z", zlib.compress),
+    "lzma": (b"x", lzma.compress),
+}
+
+# Byte de la cabecera -> función de descompresión.
+DECOMPRESSORS: dict[bytes, Callable[[bytes], bytes]] = {
+    b"z": zlib.decompress,
+    b"x": lzma.decompress,
+}
+
+# Nombre de la función SQL que devuelve el texto de un valor guardado.
+SQL_FUNCTION_NAME: str = "details_text"
+
+
+def compress_details(
+        text: str,
+        threshold: int,
+        method: str = "zlib"
+) -> str | bytes:
+    """Prepara el texto de unos detalles para guardarlo.
+
+    Args:
+        text (str): Texto de los detalles.
+        threshold (int): Tamaño mínimo, en bytes UTF-8, a partir del cual se
+            comprime. 0 o negativo desactiva la compresión.
+        method (str): Método de compresión, una clave de `COMPRESSORS`.
+
+    Raises:
+        ValueError: Si `method` no es un método conocido.
+
+    Returns:
+        str | bytes: El mismo texto si es corto o no se reduce al
+            comprimirlo; si no, la cabecera seguida de los bytes comprimidos.
+    """
+    if method not in COMPRESSORS:
+        raise ValueError(f"Método de compresión no válido: {method!r}")
+    data = text.encode("utf-8")
+    if threshold <= 0 or len(data) < threshold:
+        return text
+
+    marker, compress = COMPRESSORS[method]
+    packed = HEADER_PREFIX + marker + compress(data)
+    return packed if len(packed) < len(data) else text
+
+
+def decompress_details(value: str | bytes | None) -> str | None:
+    """Devuelve el texto de unos detalles tal como se guardaron.
+
+    Args:
+        value (str | bytes | None): Valor de `task_details.body`.
+
+    Raises:
+        ValueError: Si el valor tiene cabecera de compresión con un método
+            desconocido.
+
+    Returns:
+        str | None: Texto de los detalles, o `None` si no hay.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if not value.startswith(HEADER_PREFIX):
+        return value.decode("utf-8")
+
+    marker = value[len(HEADER_PREFIX):len(HEADER_PREFIX) + 1]
+    if marker not in DECOMPRESSORS:
+        raise ValueError(f"Cabecera de compresión no válida: {marker!r}")
+    data = DECOMPRESSORS[marker](value[len(HEADER_PREFIX) + 1:])
+    return data.decode("utf-8")
+
+
+def register_sql_function(db_connect: sqlite3.Connection) -> None:
+    """Registra `details_text` en una conexión abierta fuera del repositorio.
+
+    Desde la migración 5, los triggers del índice FTS llaman a
+    `details_text`; sin ella, SQLite rechaza con "no such function" el
+    UPDATE o DELETE de una tarea con detalles. Los scripts de copia o
+    mantenimiento que usen `sqlite3` directamente deben llamar a esta
+    función tras conectar.
+
+    Args:
+        db_connect (sqlite3.Connection): Conexión a la base de datos.
+    """
+    db_connect.create_function(
+        SQL_FUNCTION_NAME, 1, decompress_details, deterministic=True
+    )
@@ -0,0 +1,184 @@
+# MODULO: repositories
+# .. ........................................................... migrations ..󰌠
+"""Define las migraciones versionadas del esquema de la base de datos.
+
+La versión del esquema se guarda en `PRAGMA user_version`. Al iniciar, el
+repositorio aplica en orden las migraciones cuya versión sea mayor que la
+guardada, cada una dentro de su propia transacción. Una base de datos ya
+actualizada sólo cuesta la lectura de la versión.
+
+Para añadir un cambio de esquema se agrega una nueva entrada al final de
+`MIGRATIONS` con la siguiente versión; nunca se modifican las existentes.
+"""
+import sqlite3
+import repositories.querys as sql
+from typing import NamedTuple
+
+
+class Migration(NamedTuple):
+    """Un paso de migración del esquema.
+
+    Attributes:
+        - version (int): Versión del esquema tras aplicar la migración.
+        - description (str): Resumen del cambio, usado en los registros.
+        - statements (tuple[str, ...]): Sentencias SQL a ejecutar en orden.
+    """
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+# Lista ordenada de migraciones. La versión 0 corresponde al esquema base
+# creado por `querys.CREATE_TABLE`.
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        description="Índices compuestos para status, tag y prioridad",
+        statements=(
+            sql.CREATE_INDEX_STATUS_TAG_PRIORITY,
+            sql.CREATE_INDEX_TAG_PRIORITY,
+            sql.CREATE_INDEX_PRIORITY_STATUS,
+        ),
+    ),
+    Migration(
+        version=2,
+        description="Búsqueda de texto completo (FTS5) en content y details",
+        statements=(
+            sql.CREATE_FTS_TABLE,
+            sql.CREATE_FTS_TRIGGER_INSERT,
+            sql.CREATE_FTS_TRIGGER_DELETE,
+            sql.CREATE_FTS_TRIGGER_UPDATE,
+            sql.REBUILD_FTS,
+        ),
+    ),
+    Migration(
+        version=3,
+        description="Detalles vacíos guardados como NULL",
+        statements=(
+            sql.NULL_EMPTY_DETAILS,
+        ),
+    ),
+    Migration(
+        version=4,
+        description="Detalles en la tabla task_details",
+        statements=(
+            sql.CREATE_DETAILS_TABLE,
+            sql.MOVE_DETAILS,
+            sql.DROP_FTS_TRIGGER_INSERT,
+            sql.DROP_FTS_TRIGGER_DELETE,
+            sql.DROP_FTS_TRIGGER_UPDATE,
+            sql.DROP_FTS_TABLE,
+            sql.DROP_DETAILS_COLUMN,
+            sql.CREATE_FTS_SOURCE_VIEW,
+            sql.CREATE_FTS_TABLE_SPLIT,
+            sql.CREATE_FTS_TRIGGER_TASK_INSERT,
+            sql.CREATE_FTS_TRIGGER_TASK_DELETE,
+            sql.CREATE_FTS_TRIGGER_TASK_UPDATE,
+            sql.CREATE_FTS_TRIGGER_DETAILS_INSERT,
+            sql.CREATE_FTS_TRIGGER_DETAILS_DELETE,
+            sql.CREATE_FTS_TRIGGER_DETAILS_UPDATE,
+            sql.REBUILD_FTS,
+        ),
+    ),
+    # A partir de aquí, modificar o eliminar tareas con detalles requiere la
+    # función SQL `details_text` (ver `details_codec.register_sql_function`).
+    Migration(
+        version=5,
+        description="Índice FTS sobre el texto de los detalles comprimidos",
+        statements=(
+            sql.DROP_FTS_TRIGGER_DELETE,
+            sql.DROP_FTS_TRIGGER_UPDATE,
+            sql.DROP_FTS_TRIGGER_DETAILS_INSERT,
+            sql.DROP_FTS_TRIGGER_DETAILS_DELETE,
+            sql.DROP_FTS_TRIGGER_DETAILS_UPDATE,
+            sql.DROP_FTS_SOURCE_VIEW,
+            sql.CREATE_FTS_SOURCE_VIEW_TEXT,
+            sql.CREATE_FTS_TRIGGER_TASK_DELETE_TEXT,
+            sql.CREATE_FTS_TRIGGER_TASK_UPDATE_TEXT,
+            sql.CREATE_FTS_TRIGGER_DETAILS_INSERT_TEXT,
+            sql.CREATE_FTS_TRIGGER_DETAILS_DELETE_TEXT,
+            sql.CREATE_FTS_TRIGGER_DETAILS_UPDATE_TEXT,
+        ),
+    ),
+    Migration(
+        version=6,
+        description="Status, tag y prioridad como códigos enteros",
+        statements=(
+            sql.CREATE_STATUS_CODES_TABLE,
+            sql.CREATE_TAG_CODES_TABLE,
+            sql.CREATE_PRIORITY_CODES_TABLE,
+            sql.SEED_STATUS_CODES,
+            sql.SEED_TAG_CODES,
+            sql.SEED_PRIORITY_CODES,
+            sql.ADD_STATUS_CODE_COLUMN,
+            sql.ADD_TAG_CODE_COLUMN,
+            sql.ADD_PRIORITY_CODE_COLUMN,
+            sql.FILL_CODE_COLUMNS,
+            sql.DROP_INDEX_STATUS_TAG_PRIORITY,
+            sql.DROP_INDEX_TAG_PRIORITY,
+            sql.DROP_INDEX_PRIORITY_STATUS,
+            sql.DROP_STATUS_TEXT_COLUMN,
+            sql.DROP_TAG_TEXT_COLUMN,
+            sql.DROP_PRIORITY_TEXT_COLUMN,
+            sql.RENAME_STATUS_CODE_COLUMN,
+            sql.RENAME_TAG_CODE_COLUMN,
+            sql.RENAME_PRIORITY_CODE_COLUMN,
+            sql.CREATE_INDEX_STATUS_TAG_PRIORITY,
+            sql.CREATE_INDEX_TAG_PRIORITY,
+            sql.CREATE_INDEX_PRIORITY_STATUS,
+        ),
+    ),
+)
+
+# Versión del esquema que espera la aplicación.
+LATEST_VERSION: int = MIGRATIONS[-1].version
+
+
+def get_schema_version(cursor: sqlite3.Cursor) -> int:
+    """Devuelve la versión del esquema guardada en la base de datos.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor de la base de datos.
+
+    Returns:
+        int: Valor de `PRAGMA user_version` (0 en una base de datos nueva).
+    """
+    return cursor.execute(sql.GET_SCHEMA_VERSION).fetchone()[0]
+
+
+def apply_migrations(cursor: sqlite3.Cursor) -> int:
+    """Aplica las migraciones pendientes en orden.
+
+    Cada migración y la actualización de `user_version` se ejecutan en una
+    única transacción: si alguna sentencia falla se revierte la migración
+    completa y se propaga el error.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor de la base de datos.
+
+    Returns:
+        int: Versión del esquema tras aplicar las migraciones.
+    """
+    current_version = get_schema_version(cursor)
+    db_connect = cursor.connection
+
+    for migration in MIGRATIONS:
+        if migration.version <= current_version:
+            continue
+        db_connect.commit()
+        cursor.execute("BEGIN IMMEDIATE;")
+        try:
+            # Otro proceso pudo aplicarla mientras se esperaba el bloqueo.
+            if get_schema_version(cursor) < migration.version:
+                for statement in migration.statements:
+                    cursor.execute(statement)
+                cursor.execute(
+                    sql.SET_SCHEMA_VERSION.format(version=migration.version)
+                )
+            cursor.execute("COMMIT;")
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK;")
+            raise
+        current_version = migration.version
+
+    return current_version
@@ -6,6 +6,7 @@ Este módulo actúa como una única fuente de consultas SQL, lo que facilita su
 mantenimiento y lectura. Previene la dispersión de sentencias SQL a través de
 la lógica de la aplicación.
 """
+from models.model_task import FIELD_CODES
 
 # .. ......................................................... create_table ..󰌠
 # Crea la tabla 'tasks_table' si no existe, definiendo su estructura.
@@ -21,80 +22,584 @@ CREATE_TABLE: str = """
 """
 
 
+# .. ........................................................... migrations ..󰌠
+# Lee y escribe la versión del esquema guardada en la cabecera del archivo.
+GET_SCHEMA_VERSION: str = "PRAGMA user_version;"
+SET_SCHEMA_VERSION: str = "PRAGMA user_version = {version};"
+
+# --- Migración 1: índices para los filtros ---
+# Cada combinación de filtros de `RepositoryDB.filter_tasks` (por igualdad
+# o IN) se resuelve con el prefijo izquierdo de uno de estos índices:
+#   status | status+tag | status+tag+priority -> (status, tag, priority)
+#   tag    | tag+priority                      -> (tag, priority)
+#   priority | status+priority                 -> (priority, status)
+CREATE_INDEX_STATUS_TAG_PRIORITY: str = """
+    CREATE INDEX IF NOT EXISTS idx_tasks_status_tag_priority
+    ON tasks_table (status, tag, priority);
+"""
+
+CREATE_INDEX_TAG_PRIORITY: str = """
+    CREATE INDEX IF NOT EXISTS idx_tasks_tag_priority
+    ON tasks_table (tag, priority);
+"""
+
+CREATE_INDEX_PRIORITY_STATUS: str = """
+    CREATE INDEX IF NOT EXISTS idx_tasks_priority_status
+    ON tasks_table (priority, status);
+"""
+
+
+# --- Migración 2: búsqueda de texto completo (FTS5) ---
+# Tabla virtual FTS5 de contenido externo: indexa 'content' y 'details' de
+# 'tasks_table' sin duplicar el texto. Los índices de prefijo aceleran las
+# búsquedas de tipo "palabra*".
+CREATE_FTS_TABLE: str = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        content,
+        details,
+        content='tasks_table',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    );
+"""
+
+# Triggers que mantienen el índice sincronizado con 'tasks_table'.
+CREATE_FTS_TRIGGER_INSERT: str = """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks_table
+    BEGIN
+        INSERT INTO tasks_fts (rowid, content, details)
+        VALUES (new.id, new.content, new.details);
+    END;
+"""
+
+CREATE_FTS_TRIGGER_DELETE: str = """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks_table
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        VALUES ('delete', old.id, old.content, old.details);
+    END;
+"""
+
+CREATE_FTS_TRIGGER_UPDATE: str = """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au
+    AFTER UPDATE OF content, details ON tasks_table
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        VALUES ('delete', old.id, old.content, old.details);
+        INSERT INTO tasks_fts (rowid, content, details)
+        VALUES (new.id, new.content, new.details);
+    END;
+"""
+
+# Indexa las tareas que ya existían antes de crear la tabla FTS.
+REBUILD_FTS: str = "INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild');"
+
+# --- Migración 3: detalles vacíos como NULL ---
+# Permite saber si una tarea tiene detalles con "details IS NOT NULL", sin
+# leer el texto.
+NULL_EMPTY_DETAILS: str = """
+    UPDATE tasks_table SET details = NULL WHERE details = '';
+"""
+
+# --- Migración 4: detalles en una tabla aparte ---
+# Los detalles pasan a 'task_details' (una fila por tarea con detalles, la
+# clave es el ID de la tarea) y la columna se elimina de 'tasks_table', cuyas
+# filas quedan pequeñas: los recorridos de status/tag/priority leen muchas
+# menos páginas. Sólo GET_TASK_BY_ID une ambas tablas.
+CREATE_DETAILS_TABLE: str = """
+    CREATE TABLE IF NOT EXISTS task_details (
+        task_id INTEGER PRIMARY KEY REFERENCES tasks_table (id),
+        body TEXT NOT NULL
+    );
+"""
+
+MOVE_DETAILS: str = """
+    INSERT INTO task_details (task_id, body)
+    SELECT id, details FROM tasks_table WHERE details IS NOT NULL;
+"""
+
+# El índice FTS de la migración 2 lee 'details' de 'tasks_table': se elimina
+# antes de quitar la columna y se vuelve a crear sobre una vista.
+DROP_FTS_TRIGGER_INSERT: str = "DROP TRIGGER IF EXISTS tasks_fts_ai;"
+DROP_FTS_TRIGGER_DELETE: str = "DROP TRIGGER IF EXISTS tasks_fts_ad;"
+DROP_FTS_TRIGGER_UPDATE: str = "DROP TRIGGER IF EXISTS tasks_fts_au;"
+DROP_FTS_TABLE: str = "DROP TABLE IF EXISTS tasks_fts;"
+
+# Reescribe cada fila de 'tasks_table' sin el texto de los detalles.
+DROP_DETAILS_COLUMN: str = "ALTER TABLE tasks_table DROP COLUMN details;"
+
+# Vista con el texto indexado de cada tarea, usada como contenido externo
+# del índice FTS (FTS5 la lee al reconstruir el índice).
+CREATE_FTS_SOURCE_VIEW: str = """
+    CREATE VIEW IF NOT EXISTS tasks_fts_source AS
+    SELECT t.id, t.content, d.body AS details
+    FROM tasks_table AS t
+    LEFT JOIN task_details AS d ON d.task_id = t.id;
+"""
+
+CREATE_FTS_TABLE_SPLIT: str = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        content,
+        details,
+        content='tasks_fts_source',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    );
+"""
+
+# Triggers del índice FTS sobre las dos tablas. Para borrar una entrada del
+# índice hay que pasarle exactamente el texto que se indexó, por eso cada
+# trigger lee de la otra tabla el valor que no cambia. Los triggers de
+# 'task_details' toman el contenido de 'tasks_table': si la tarea ya no
+# existe (se está eliminando) no hacen nada.
+CREATE_FTS_TRIGGER_TASK_INSERT: str = """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks_table
+    BEGIN
+        INSERT INTO tasks_fts (rowid, content, details)
+        VALUES (
+            new.id,
+            new.content,
+            (SELECT body FROM task_details WHERE task_id = new.id)
+        );
+    END;
+"""
+
+# Al eliminar una tarea también se eliminan sus detalles.
+CREATE_FTS_TRIGGER_TASK_DELETE: str = """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks_table
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        VALUES (
+            'delete',
+            old.id,
+            old.content,
+            (SELECT body FROM task_details WHERE task_id = old.id)
+        );
+        DELETE FROM task_details WHERE task_id = old.id;
+    END;
+"""
+
+CREATE_FTS_TRIGGER_TASK_UPDATE: str = """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au
+    AFTER UPDATE OF content ON tasks_table
+    WHEN old.content IS NOT new.content
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        VALUES (
+            'delete',
+            old.id,
+            old.content,
+            (SELECT body FROM task_details WHERE task_id = old.id)
+        );
+        INSERT INTO tasks_fts (rowid, content, details)
+        VALUES (
+            new.id,
+            new.content,
+            (SELECT body FROM task_details WHERE task_id = new.id)
+        );
+    END;
+"""
+
+CREATE_FTS_TRIGGER_DETAILS_INSERT: str = """
+    CREATE TRIGGER IF NOT EXISTS task_details_fts_ai
+    AFTER INSERT ON task_details
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        SELECT 'delete', id, content, NULL
+        FROM tasks_table WHERE id = new.task_id;
+        INSERT INTO tasks_fts (rowid, content, details)
+        SELECT id, content, new.body
+        FROM tasks_table WHERE id = new.task_id;
+    END;
+"""
+
+CREATE_FTS_TRIGGER_DETAILS_DELETE: str = """
+    CREATE TRIGGER IF NOT EXISTS task_details_fts_ad
+    AFTER DELETE ON task_details
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        SELECT 'delete', id, content, old.body
+        FROM tasks_table WHERE id = old.task_id;
+        INSERT INTO tasks_fts (rowid, content, details)
+        SELECT id, content, NULL
+        FROM tasks_table WHERE id = old.task_id;
+    END;
+"""
+
+CREATE_FTS_TRIGGER_DETAILS_UPDATE: str = """
+    CREATE TRIGGER IF NOT EXISTS task_details_fts_au
+    AFTER UPDATE OF body ON task_details
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        SELECT 'delete', id, content, old.body
+        FROM tasks_table WHERE id = old.task_id;
+        INSERT INTO tasks_fts (rowid, content, details)
+        SELECT id, content, new.body
+        FROM tasks_table WHERE id = new.task_id;
+    END;
+"""
+
+# --- Migración 5: detalles comprimidos ---
+# 'task_details.body' puede guardar los detalles largos comprimidos (ver
+# `repositories.details_codec`). El índice FTS debe recibir siempre el texto,
+# así que la vista y los triggers pasan 'body' por la función SQL
+# 'details_text', que el repositorio registra en cada conexión. Sólo el
+# trigger de inserción de tareas no la usa (una tarea nueva aún no tiene
+# detalles), así que otros programas pueden añadir tareas sin registrarla.
+# En cambio, editar el contenido o eliminar una tarea con detalles, o tocar
+# 'task_details', falla con "no such function: details_text" en una conexión
+# que no la registró (ej. el shell `sqlite3`): los scripts en Python deben
+# llamar a `details_codec.register_sql_function`. No hay alternativa sin la
+# función: para borrar del índice externo hay que pasarle el texto indexado,
+# y ese texto sólo se obtiene descomprimiendo.
+DROP_FTS_SOURCE_VIEW: str = "DROP VIEW IF EXISTS tasks_fts_source;"
+DROP_FTS_TRIGGER_DETAILS_INSERT: str = (
+    "DROP TRIGGER IF EXISTS task_details_fts_ai;"
+)
+DROP_FTS_TRIGGER_DETAILS_DELETE: str = (
+    "DROP TRIGGER IF EXISTS task_details_fts_ad;"
+)
+DROP_FTS_TRIGGER_DETAILS_UPDATE: str = (
+    "DROP TRIGGER IF EXISTS task_details_fts_au;"
+)
+
+CREATE_FTS_SOURCE_VIEW_TEXT: str = """
+    CREATE VIEW IF NOT EXISTS tasks_fts_source AS
+    SELECT t.id, t.content, details_text(d.body) AS details
+    FROM tasks_table AS t
+    LEFT JOIN task_details AS d ON d.task_id = t.id;
+"""
+
+CREATE_FTS_TRIGGER_TASK_DELETE_TEXT: str = """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks_table
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        VALUES (
+            'delete',
+            old.id,
+            old.content,
+            (SELECT details_text(body) FROM task_details
+             WHERE task_id = old.id)
+        );
+        DELETE FROM task_details WHERE task_id = old.id;
+    END;
+"""
+
+CREATE_FTS_TRIGGER_TASK_UPDATE_TEXT: str = """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au
+    AFTER UPDATE OF content ON tasks_table
+    WHEN old.content IS NOT new.content
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        VALUES (
+            'delete',
+            old.id,
+            old.content,
+            (SELECT details_text(body) FROM task_details
+             WHERE task_id = old.id)
+        );
+        INSERT INTO tasks_fts (rowid, content, details)
+        VALUES (
+            new.id,
+            new.content,
+            (SELECT details_text(body) FROM task_details
+             WHERE task_id = new.id)
+        );
+    END;
+"""
+
+CREATE_FTS_TRIGGER_DETAILS_INSERT_TEXT: str = """
+    CREATE TRIGGER IF NOT EXISTS task_details_fts_ai
+    AFTER INSERT ON task_details
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        SELECT 'delete', id, content, NULL
+        FROM tasks_table WHERE id = new.task_id;
+        INSERT INTO tasks_fts (rowid, content, details)
+        SELECT id, content, details_text(new.body)
+        FROM tasks_table WHERE id = new.task_id;
+    END;
+"""
+
+CREATE_FTS_TRIGGER_DETAILS_DELETE_TEXT: str = """
+    CREATE TRIGGER IF NOT EXISTS task_details_fts_ad
+    AFTER DELETE ON task_details
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        SELECT 'delete', id, content, details_text(old.body)
+        FROM tasks_table WHERE id = old.task_id;
+        INSERT INTO tasks_fts (rowid, content, details)
+        SELECT id, content, NULL
+        FROM tasks_table WHERE id = old.task_id;
+    END;
+"""
+
+CREATE_FTS_TRIGGER_DETAILS_UPDATE_TEXT: str = """
+    CREATE TRIGGER IF NOT EXISTS task_details_fts_au
+    AFTER UPDATE OF body ON task_details
+    BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, content, details)
+        SELECT 'delete', id, content, details_text(old.body)
+        FROM tasks_table WHERE id = old.task_id;
+        INSERT INTO tasks_fts (rowid, content, details)
+        SELECT id, content, details_text(new.body)
+        FROM tasks_table WHERE id = new.task_id;
+    END;
+"""
+
+
+# --- Migración 6: status, tag y prioridad como códigos enteros ---
+# Tablas de consulta con el nombre de cada código. Los códigos coinciden con
+# `models.model_task.FIELD_CODES`, que es el que usa el repositorio.
+CREATE_STATUS_CODES_TABLE: str = """
+    CREATE TABLE IF NOT EXISTS task_statuses (
+        code INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    );
+"""
+
+CREATE_TAG_CODES_TABLE: str = """
+    CREATE TABLE IF NOT EXISTS task_tags (
+        code INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    );
+"""
+
+CREATE_PRIORITY_CODES_TABLE: str = """
+    CREATE TABLE IF NOT EXISTS task_priorities (
+        code INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    );
+"""
+
+def _seed_codes(table: str, field: str) -> str:
+    """Construye el INSERT que llena una tabla de códigos.
+
+    Las filas salen de `FIELD_CODES`, la misma tabla que usa el repositorio
+    para codificar, de modo que no hay una segunda lista que mantener.
+
+    Args:
+        table (str): Tabla de consulta, ej. `"task_tags"`.
+        field (str): Campo del modelo, ej. `"tag"`.
+
+    Returns:
+        str: Sentencia `INSERT OR IGNORE` con una fila por valor.
+    """
+    rows = ", ".join(
+        f"({code}, '{name}')" for name, code in FIELD_CODES[field].items()
+    )
+    return f"INSERT OR IGNORE INTO {table} (code, name) VALUES {rows};"
+
+
+SEED_STATUS_CODES: str = _seed_codes("task_statuses", "status")
+SEED_TAG_CODES: str = _seed_codes("task_tags", "tag")
+SEED_PRIORITY_CODES: str = _seed_codes("task_priorities", "priority")
+
+# Los índices de la migración 1 se eliminan para poder quitar las columnas
+# de texto y se vuelven a crear sobre las columnas enteras.
+DROP_INDEX_STATUS_TAG_PRIORITY: str = (
+    "DROP INDEX IF EXISTS idx_tasks_status_tag_priority;"
+)
+DROP_INDEX_TAG_PRIORITY: str = "DROP INDEX IF EXISTS idx_tasks_tag_priority;"
+DROP_INDEX_PRIORITY_STATUS: str = (
+    "DROP INDEX IF EXISTS idx_tasks_priority_status;"
+)
+
+# Cada columna se convierte sin reconstruir la tabla (lo que obligaría a
+# desactivar las claves foráneas de 'task_details'): se añade la columna
+# entera, se rellena desde la tabla de consulta, se elimina la de texto y se
+# renombra la nueva. Un valor desconocido recibe el código 0, el valor por
+# defecto del modelo.
+ADD_STATUS_CODE_COLUMN: str = """
+    ALTER TABLE tasks_table ADD COLUMN status_code INTEGER NOT NULL DEFAULT 0;
+"""
+ADD_TAG_CODE_COLUMN: str = """
+    ALTER TABLE tasks_table ADD COLUMN tag_code INTEGER NOT NULL DEFAULT 0;
+"""
+ADD_PRIORITY_CODE_COLUMN: str = """
+    ALTER TABLE tasks_table
+    ADD COLUMN priority_code INTEGER NOT NULL DEFAULT 0;
+"""
+
+FILL_CODE_COLUMNS: str = """
+    UPDATE tasks_table SET
+        status_code = COALESCE(
+            (SELECT code FROM task_statuses WHERE name = tasks_table.status),
+            0
+        ),
+        tag_code = COALESCE(
+            (SELECT code FROM task_tags WHERE name = tasks_table.tag),
+            0
+        ),
+        priority_code = COALESCE(
+            (SELECT code FROM task_priorities
+             WHERE name = tasks_table.priority),
+            0
+        );
+"""
+
+DROP_STATUS_TEXT_COLUMN: str = "ALTER TABLE tasks_table DROP COLUMN status;"
+DROP_TAG_TEXT_COLUMN: str = "ALTER TABLE tasks_table DROP COLUMN tag;"
+DROP_PRIORITY_TEXT_COLUMN: str = (
+    "ALTER TABLE tasks_table DROP COLUMN priority;"
+)
+
+RENAME_STATUS_CODE_COLUMN: str = (
+    "ALTER TABLE tasks_table RENAME COLUMN status_code TO status;"
+)
+RENAME_TAG_CODE_COLUMN: str = (
+    "ALTER TABLE tasks_table RENAME COLUMN tag_code TO tag;"
+)
+RENAME_PRIORITY_CODE_COLUMN: str = (
+    "ALTER TABLE tasks_table RENAME COLUMN priority_code TO priority;"
+)
+
+
+# .. ......................................................... data_version ..󰌠
+# Contador que cambia cuando otra conexión confirma cambios en el archivo.
+# Se usa para invalidar cachés cuando otro proceso modifica la base de datos.
+GET_DATA_VERSION: str = "PRAGMA data_version;"
+
+
 # .. ........................................................ get_all_tasks ..󰌠
+# Las consultas de listas no leen el texto de los detalles, que puede ser
+# largo: devuelven en su lugar 'has_details', que sólo busca la clave en
+# 'task_details' (las tareas sin detalles no tienen fila). El texto sólo lo
+# lee GET_TASK_BY_ID.
 # Obtiene todas las tareas de la base de datos.
 GET_ALL_TASKS = """
-    SELECT id, status, tag, content, priority, details
+    SELECT id, status, tag, content, priority,
+        EXISTS (
+            SELECT 1 FROM task_details WHERE task_id = tasks_table.id
+        ) AS has_details
     FROM tasks_table;
 """
 
 
-# .. ............................................................. new_task ..󰌠
-# Inserta una nueva tarea en la tabla.
-# Placeholders: status, tag, content, priority, details
-NEW_TASK: str = """
-    INSERT INTO tasks_table (
-        status, tag, content, priority, details
-    ) VALUES (?, ?, ?, ?, ?);
+# .. ....................................................... get_tasks_page ..󰌠
+# Página de tareas con paginación por clave (keyset): en lugar de OFFSET,
+# se continúa desde el último ID visto, por lo que el costo de cada página
+# no crece con su posición. '{filters}' se completa con las condiciones de
+# `TaskFilter.where` (igual que en FILTER_TASKS).
+# Placeholders: último ID visto, [valores de filtros], tamaño de página.
+GET_TASKS_PAGE: str = """
+    SELECT id, status, tag, content, priority,
+        EXISTS (
+            SELECT 1 FROM task_details WHERE task_id = tasks_table.id
+        ) AS has_details
+    FROM tasks_table
+    WHERE id > ?{filters}
+    ORDER BY id
+    LIMIT ?;
 """
 
-
-# .. ......................................................... filter_tasks ..󰌠
-# --- Filtrado por 1 Criterio ---
-# Selecciona tareas que coincidan con un 'status' específico.
-FILTER_TASK_STATUS: str = """
-    SELECT id, status, tag, content, priority, details
+# Página anterior: las tareas con ID menor que el primero visto, leídas en
+# orden descendente (el repositorio las devuelve en orden ascendente).
+# Placeholders: primer ID visto, [valores de filtros], tamaño de página.
+GET_TASKS_PAGE_BEFORE: str = """
+    SELECT id, status, tag, content, priority,
+        EXISTS (
+            SELECT 1 FROM task_details WHERE task_id = tasks_table.id
+        ) AS has_details
     FROM tasks_table
-    WHERE status = ?;
+    WHERE id < ?{filters}
+    ORDER BY id DESC
+    LIMIT ?;
 """
 
-# Selecciona tareas que coincidan con un 'tag' específico.
-FILTER_TASK_TAG: str = """
-    SELECT id, status, tag, content, priority, details
+
+# Condición adicional de GET_TASKS_PAGE y COUNT_TASKS para el filtro en vivo:
+# tareas en cuyo contenido cada palabra escrita es prefijo de alguna palabra
+# (en cualquier posición), resuelta con el índice FTS5 (índices de prefijo de
+# 2 y 3 caracteres).
+# Placeholders: expresión MATCH de FTS5 restringida a 'content'.
+CONTENT_PREFIX_FILTER: str = (
+    " AND id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)"
+)
+
+
+# .. .......................................................... count_tasks ..󰌠
+# Cuenta las tareas que cumplen los filtros. '{filters}' se completa igual
+# que en GET_TASKS_PAGE.
+COUNT_TASKS: str = """
+    SELECT COUNT(*)
     FROM tasks_table
-    WHERE tag = ?;
+    WHERE 1 = 1{filters};
 """
 
-# Selcciona tareas que coincidan con uns 'priority' específica.
-FILTER_TASK_PRIORITY: str = """
-    SELECT id, status, tag, content, priority, details
+
+# .. .......................................................... task_counts ..󰌠
+# Cuenta las tareas por cada combinación de status, tag y prioridad en una
+# sola pasada. Devuelve como máximo una fila por combinación (3 x 4 x 3).
+TASK_COUNTS: str = """
+    SELECT status, tag, priority, COUNT(*)
     FROM tasks_table
-    WHERE priority = ?;
+    GROUP BY status, tag, priority;
 """
 
-# --- Filtrado por 2 Criterios ---
-# Selecciona tareas por 'status' y 'tag' específicos.
-FILTER_BY_STATUS_AND_TAG: str = """
-    SELECT id, status, tag, content, priority, details
+# Igual que TASK_COUNTS, restringido a las tareas de la lista. '{ids}' se
+# completa como en GET_TASKS_BY_IDS.
+TASK_COUNTS_BY_IDS: str = """
+    SELECT status, tag, priority, COUNT(*)
     FROM tasks_table
-    WHERE status = ?
-    AND tag = ?;
+    WHERE id IN ({ids})
+    GROUP BY status, tag, priority;
 """
 
-# Selecciona tareas por 'status' y 'priority' específicos.
-FILTER_BY_STATUS_AND_PRIORITY: str = """
-    SELECT id, status, tag, content, priority, details
-    FROM tasks_table
-    WHERE status = ?
-    AND priority = ?;
+
+# .. ............................................................. new_task ..󰌠
+# Inserta una nueva tarea en la tabla.
+# Placeholders: status, tag, content, priority
+NEW_TASK: str = """
+    INSERT INTO tasks_table (
+        status, tag, content, priority
+    ) VALUES (?, ?, ?, ?);
 """
 
-# Selecciona tareas por 'tag' y 'priority' específicos.
-FILTER_BY_TAG_AND_PRIORITY: str = """
-    SELECT id, status, tag, content, priority, details
-    FROM tasks_table
-    WHERE tag = ?
-    AND priority = ?;
+# Guarda los detalles de una tarea recién creada.
+# Placeholders: ID de la tarea, texto de los detalles
+NEW_TASK_DETAILS: str = """
+    INSERT INTO task_details (task_id, body) VALUES (?, ?);
 """
 
-# --- Filtrado por 3 Criterios ---
-# Selecciona tareas por 'status', 'tag' y 'priority' específicos.
-FILTER_BY_ALL: str = """
-    SELECT id, status, tag, content, priority, details
+
+# .. ....................................................... new_tasks_many ..󰌠
+# Devuelve el ID de la última fila insertada por la conexión. Tras un
+# `executemany` corresponde a la última tarea del bloque.
+LAST_INSERT_ID: str = "SELECT last_insert_rowid();"
+
+
+# .. ......................................................... filter_tasks ..󰌠
+# Filtrado compuesto. '{filters}' y '{order}' los completa
+# `repositories.task_filter.TaskFilter`: condiciones "AND columna = ?",
+# "AND columna IN (?, ...)" o sus negaciones, y "ORDER BY ... [LIMIT ?]".
+# Placeholders: [valores de filtros], [límite].
+FILTER_TASKS: str = """
+    SELECT id, status, tag, content, priority,
+        EXISTS (
+            SELECT 1 FROM task_details WHERE task_id = tasks_table.id
+        ) AS has_details
     FROM tasks_table
-    WHERE status = ?
-    AND tag = ?
-    AND priority = ?;
+    WHERE 1 = 1{filters}{order};
+"""
+
+
+# .. ......................................................... search_tasks ..󰌠
+# Búsqueda de texto completo ordenada por relevancia (bm25). Las
+# coincidencias en 'content' pesan más que las de 'details'.
+# Placeholders: expresión MATCH de FTS5, límite de resultados.
+SEARCH_TASKS: str = """
+    SELECT t.id, t.status, t.tag, t.content, t.priority,
+        EXISTS (
+            SELECT 1 FROM task_details WHERE task_id = t.id
+        ) AS has_details
+    FROM tasks_fts
+    JOIN tasks_table AS t ON t.id = tasks_fts.rowid
+    WHERE tasks_fts MATCH ?
+    ORDER BY bm25(tasks_fts, 10.0, 1.0)
+    LIMIT ?;
 """
 
 
@@ -102,6 +607,23 @@ FILTER_BY_ALL: str = """
 # Query base para actualizar una tarea. Se completa dinámicamente.
 UPDATE_TASK: str = "UPDATE tasks_table SET"
 
+# Detalles actuales de una tarea. Devuelve una fila si la tarea existe, con
+# el texto o NULL si no tiene detalles.
+GET_TASK_DETAILS: str = """
+    SELECT d.body
+    FROM tasks_table AS t
+    LEFT JOIN task_details AS d ON d.task_id = t.id
+    WHERE t.id = ?;
+"""
+
+# Placeholders: texto de los detalles, ID de la tarea
+UPDATE_TASK_DETAILS: str = """
+    UPDATE task_details SET body = ? WHERE task_id = ?;
+"""
+
+# Placeholders: ID de la tarea
+DELETE_TASK_DETAILS: str = "DELETE FROM task_details WHERE task_id = ?;"
+
 
 # .. ................................................ check_or_uncheck_task ..󰌠
 # Selecciona una tarea por su 'id'.
@@ -110,14 +632,15 @@ SELECT_TASK: str = "SELECT * FROM tasks_table WHERE id = ?"
 # Actualiza el 'status' de una tarea específica por su 'id'.
 UPDATE_STATUS: str = "UPDATE tasks_table SET status = ? WHERE id = ?;"
 
-# Cambia el 'status' de una tarea de forma cíclica.
-# (pending -> in_progress -> completed -> pending)
+# Cambia el 'status' de una tarea de forma cíclica, sobre los códigos de
+# `models.model_task.STATUS_CODES`.
+# (pending 0 -> in_progress 1 -> completed 2 -> pending 0)
 UPDATE_STATUS_TOGGLE = """
     UPDATE tasks_table
-    SET status = CASE
-        WHEN status = 'pending' THEN 'in_progress'
-        WHEN status = 'in_progress' THEN 'completed'
-        WHEN status = 'completed' THEN 'pending'
+    SET status = CASE status
+        WHEN 0 THEN 1
+        WHEN 1 THEN 2
+        WHEN 2 THEN 0
         ELSE status
     END
     WHERE id = ?;
@@ -126,13 +649,56 @@ UPDATE_STATUS_TOGGLE = """
 
 # .. ....................................................... get_task_by_id ..󰌠
 # Selecciona una tarea por su 'id'.
+# Es la única consulta que une 'task_details'.
 GET_TASK_BY_ID = """
-    SELECT id, status, tag, content, priority, details 
-    FROM tasks_table 
-    WHERE id = ?;
+    SELECT t.id, t.status, t.tag, t.content, t.priority, d.body
+    FROM tasks_table AS t
+    LEFT JOIN task_details AS d ON d.task_id = t.id
+    WHERE t.id = ?;
 """
 
 
 # .. .......................................................... delete_task ..󰌠
 # Elimina una tarea de la tabla identificada por su 'id'.
 DELETE_TASK = "DELETE FROM tasks_table WHERE id= ?;"
+
+
+# .. ..................................................... get_tasks_by_ids ..󰌠
+# Operaciones sobre varias tareas a la vez. '{ids}' se completa con un
+# placeholder "?" por cada ID del bloque (ver `RepositoryDB._id_chunks`).
+# Selecciona las tareas cuyos IDs están en la lista.
+GET_TASKS_BY_IDS: str = """
+    SELECT id, status, tag, content, priority,
+        EXISTS (
+            SELECT 1 FROM task_details WHERE task_id = tasks_table.id
+        ) AS has_details
+    FROM tasks_table
+    WHERE id IN ({ids});
+"""
+
+
+# .. ......................................................... update_tasks ..󰌠
+# Asigna los mismos valores a varias tareas. '{set_clause}' se completa igual
+# que en UPDATE_TASK ("columna = ?, ...").
+# Placeholders: [valores del SET], [IDs].
+UPDATE_TASKS: str = "UPDATE tasks_table SET {set_clause} WHERE id IN ({ids});"
+
+
+# .. ............................................... check_or_uncheck_tasks ..󰌠
+# Cambia el 'status' de varias tareas de forma cíclica, igual que
+# UPDATE_STATUS_TOGGLE.
+UPDATE_STATUS_TOGGLE_MANY: str = """
+    UPDATE tasks_table
+    SET status = CASE status
+        WHEN 0 THEN 1
+        WHEN 1 THEN 2
+        WHEN 2 THEN 0
+        ELSE status
+    END
+    WHERE id IN ({ids});
+"""
+
+
+# .. ......................................................... delete_tasks ..󰌠
+# Elimina las tareas cuyos IDs están en la lista.
+DELETE_TASKS: str = "DELETE FROM tasks_table WHERE id IN ({ids});"
@@ -6,11 +6,28 @@ Este módulo contiene la clase RepositoryDB, que implementa todos los métodos
 necesarios para interactuar con la base de datos SQLite (crear, leer,
 actualizar, eliminar tareas).
 """
+import logging
 import sqlite3
 import repositories.querys as sql
+from itertools import islice
 from pathlib import Path
+from typing import Any, Iterable, Iterator
+from config import config_loader
 from repositories.connection_manager import connection_manager
-from models.model_task import Task
+from repositories.connection_pool import ConnectionPool
+from repositories.details_codec import (
+    SQL_FUNCTION_NAME, compress_details, decompress_details
+)
+from repositories.migrations import apply_migrations
+from repositories.task_filter import FilterValue, TaskFilter
+from models.model_task import (
+    FIELD_CODES, FIELD_VALUES, Task, TaskSummary, construct_trusted
+)
+
+
+# Máximo de IDs por sentencia "WHERE id IN (...)". Queda por debajo del
+# límite de variables de las versiones antiguas de SQLite (999).
+ID_CHUNK_SIZE: int = 900
 
 
 class RepositoryDB:
@@ -20,20 +37,103 @@ class RepositoryDB:
     que la capa de servicio interactúe con la base de datos.
     """
 
-    def __init__(self, db_path: Path):
-        """Inicializa el repositorio y establece la ruta a la base de datos.
+    def __init__(
+            self,
+            db_path: Path,
+            pragmas: dict[str, Any] | None = None,
+            compress_threshold: int | None = None,
+            compression: str | None = None,
+            validate_reads: bool | None = None
+    ):
+        """Inicializa el repositorio y su pool de conexiones.
+
+        El pool no abre ninguna conexión hasta la primera consulta; a partir
+        de ahí las conexiones se reutilizan entre llamadas hasta `close()`.
 
         Args:
             db_path (Path): La ruta completa al archivo de la base de datos.
+            pragmas (dict[str, Any] | None): PRAGMAs de SQLite a aplicar en
+                cada conexión. Por defecto se usan los de la sección
+                `[database.pragmas]` de `settings.toml`.
+            compress_threshold (int | None): Bytes a partir de los cuales se
+                comprimen los detalles (0 desactiva la compresión).
+            compression (str | None): Método de compresión de los detalles,
+                "zlib" o "lzma". Por defecto, ambos valores salen de la
+                sección `[database.details]` de `settings.toml`.
+            validate_reads (bool | None): Si es `True`, las filas leídas se
+                validan con Pydantic (modo auditoría). Por defecto se usa
+                `[database.reads]` de `settings.toml`.
         """
         self.db_path = db_path
+        self.compress_threshold = (
+            config_loader.DETAILS_COMPRESS_THRESHOLD
+            if compress_threshold is None
+            else compress_threshold
+        )
+        self.compression = compression or config_loader.DETAILS_COMPRESSION
+        self.validate_reads = (
+            config_loader.VALIDATE_READS if validate_reads is None
+            else validate_reads
+        )
+        self.pool = ConnectionPool(
+            db_path,
+            pragmas=config_loader.DB_PRAGMAS if pragmas is None else pragmas,
+            # El índice FTS lee los detalles a través de esta función.
+            functions={SQL_FUNCTION_NAME: decompress_details}
+        )
+        # Conexión fija para `data_version`, fuera del pool: el contador sólo
+        # es comparable entre lecturas hechas por la misma conexión.
+        self._watch_connection: sqlite3.Connection | None = None
+
+
+    def close(self) -> None:
+        """Cierra las conexiones abiertas por el repositorio.
+
+        Debe llamarse al terminar de usar el repositorio (por ejemplo, al
+        cerrar la aplicación) para liberar los archivos de la base de datos.
+        """
+        self.pool.close()
+        if self._watch_connection is not None:
+            self._watch_connection.close()
+            self._watch_connection = None
+
+
+    def data_version(self) -> int | None:
+        """Devuelve el contador de cambios de la base de datos.
+
+        El valor cambia cada vez que otra conexión (incluidas las del pool de
+        este mismo repositorio) confirma cambios. Comparar dos lecturas
+        permite saber si la base de datos fue modificada entre ellas.
+
+        Returns:
+            int | None: Valor de `PRAGMA data_version`, o `None` si no se
+                pudo leer.
+        """
+        try:
+            if self._watch_connection is None:
+                self._watch_connection = sqlite3.connect(
+                    self.db_path, check_same_thread=False
+                )
+            return self._watch_connection.execute(
+                sql.GET_DATA_VERSION
+            ).fetchone()[0]
+        except sqlite3.Error as e:
+            logging.error(
+                f"Error al leer la versión de la base de datos: {e}",
+                exc_info=True
+            )
+            return None
+
 
     def task_format_list(self, rows_list: list) -> list[Task]:
         """Convierte una lista de filas de la BD en una lista de objetos Task.
 
         Este método auxiliar actúa como una capa de mapeo, transformando los
         datos crudos de la base de datos (lista de tuplas) en una lista de
-        objetos `Task` validados por Pydantic.
+        objetos `Task`. Sólo se validan con Pydantic si `validate_reads` está
+        activo (ver `construct_trusted`). Los códigos de status, tag y
+        prioridad se traducen a sus valores y los detalles comprimidos se
+        descomprimen aquí.
 
         Args:
             rows_list (list): Lista de filas (tuplas) obtenida de una
@@ -42,25 +142,80 @@ class RepositoryDB:
         Returns:
             list[Task]: Lista de objetos `Task` completamente formados.
         """
-        return [
-            Task(
-                id=row[0],
-                status=row[1],
-                tag=row[2],
-                content=row[3],
-                priority=row[4],
-                details=row[5],
-            )
+        status, tag, priority = self._field_values()
+        values = (
+            {
+                "id": row[0],
+                "status": status.get(row[1], row[1]),
+                "tag": tag.get(row[2], row[2]),
+                "content": row[3],
+                "priority": priority.get(row[4], row[4]),
+                "details": decompress_details(row[5]),
+            }
+            for row in rows_list
+        )
+        if self.validate_reads:
+            return [Task(**task_values) for task_values in values]
+        return [construct_trusted(Task, task_values) for task_values in values]
+
+
+    @staticmethod
+    def _field_values() -> tuple[dict[int, str], ...]:
+        """Devuelve las tablas código -> valor de status, tag y prioridad.
+
+        Un código desconocido (escrito por otro programa) se deja tal cual,
+        para que `validate_reads` pueda rechazarlo.
+
+        Returns:
+            tuple[dict[int, str], ...]: Tablas de status, tag y prioridad.
+        """
+        return (
+            FIELD_VALUES["status"],
+            FIELD_VALUES["tag"],
+            FIELD_VALUES["priority"],
+        )
+
+
+    def summary_format_list(self, rows_list: list) -> list[TaskSummary]:
+        """Convierte filas de una consulta de listas en objetos TaskSummary.
+
+        Las consultas de listas devuelven `has_details` en la sexta columna
+        en lugar del texto de los detalles. Como en `task_format_list`, los
+        códigos se traducen a sus valores y las filas sólo se validan si
+        `validate_reads` está activo.
+
+        Args:
+            rows_list (list): Lista de filas (tuplas) obtenida de una
+                consulta de listas a la base de datos.
+
+        Returns:
+            list[TaskSummary]: Lista de resúmenes de tareas.
+        """
+        status, tag, priority = self._field_values()
+        values = (
+            {
+                "id": row[0],
+                "status": status.get(row[1], row[1]),
+                "tag": tag.get(row[2], row[2]),
+                "content": row[3],
+                "priority": priority.get(row[4], row[4]),
+                "has_details": bool(row[5]),
+            }
             for row in rows_list
-        ]
+        )
+        if self.validate_reads:
+            return [TaskSummary(**summary) for summary in values]
+        return [construct_trusted(TaskSummary, summary) for summary in values]
 
 
     # .. ......................................................... create_table
     @connection_manager
     def create_table(self, cursor=sqlite3.Cursor) -> None:
-        """Asegura que la tabla 'tasks_table' exista en la base de datos.
+        """Asegura que la tabla 'tasks_table' exista y esté actualizada.
 
-        Ejecuta la sentencia SQL para crear la tabla si esta no existe.
+        Ejecuta la sentencia SQL para crear la tabla si esta no existe y
+        luego aplica las migraciones pendientes del esquema (índices, etc.),
+        ver `repositories.migrations`.
         La gestión de la conexión y el commit es manejada por el decorador.
 
         Args:
@@ -68,11 +223,12 @@ class RepositoryDB:
                 por el decorador `connection_manager`.
         """
         cursor.execute(sql.CREATE_TABLE)
+        apply_migrations(cursor)
 
 
     # .. ........................................................ get_all_tasks
     @connection_manager
-    def get_all_tasks(self, cursor: sqlite3.Cursor) -> list[Task]:
+    def get_all_tasks(self, cursor: sqlite3.Cursor) -> list[TaskSummary]:
         """Recupera todas las tareas de la base de datos.
 
         Si la tabla no existe o hay un error, devuelve una lista vacía.
@@ -82,18 +238,215 @@ class RepositoryDB:
                 por el decorador.
 
         Returns:
-            list[Task]: Una lista de objetos `Task` que representan todas las
-                tareas en la base de datos. Estará vacía si sqlite3 devuelve
-                error.
+            list[TaskSummary]: Resúmenes (sin el texto de los detalles) de
+                todas las tareas en la base de datos. Estará vacía si sqlite3
+                devuelve error.
         """
         try:
             cursor.execute(sql.GET_ALL_TASKS)
             all_rows = cursor.fetchall()
-            return self.task_format_list(all_rows)
+            return self.summary_format_list(all_rows)
         except sqlite3.Error:
             return []
 
 
+    # .. ....................................................... get_tasks_page
+    @connection_manager
+    def get_tasks_page(
+            self,
+            cursor: sqlite3.Cursor,
+            after_id: int = 0,
+            limit: int = 500,
+            status: FilterValue = None,
+            tag: FilterValue = None,
+            priority: FilterValue = None,
+            before_id: int | None = None,
+            text: str | None = None
+    ) -> list[TaskSummary]:
+        """Recupera una página de tareas ordenadas por ID (paginación keyset).
+
+        Devuelve hasta `limit` tareas con ID mayor que `after_id`. Para pedir
+        la página siguiente se pasa como `after_id` el ID de la última tarea
+        recibida. Si se indica `before_id`, devuelve en cambio las `limit`
+        tareas inmediatamente anteriores a ese ID (página previa).
+        Opcionalmente se filtra por status, tag y/o prioridad (uno o varios
+        valores por criterio) y por texto: cada palabra escrita debe ser el
+        prefijo de alguna palabra del contenido, en cualquier posición.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor de la base de datos, inyectado
+                por el decorador.
+            after_id (int): Último ID ya recibido (0 para la primera página).
+            limit (int): Tamaño máximo de la página.
+            status (FilterValue): Estado(s) por el cual filtrar.
+            tag (FilterValue): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue): Prioridad(es) por la cual filtrar.
+            before_id (int | None): Primer ID ya recibido, para retroceder.
+            text (str | None): Palabras que deben aparecer en el contenido,
+                cada una por prefijo (ver `_content_filter`).
+
+        Returns:
+            list[TaskSummary]: Tareas de la página en orden ascendente de
+                ID. Vacía si no quedan más.
+        """
+        filters_clause, filter_params = self._content_filter(
+            TaskFilter(status=status, tag=tag, priority=priority), text
+        )
+        if before_id is None:
+            query = sql.GET_TASKS_PAGE.format(filters=filters_clause)
+            params = (after_id, *filter_params, limit)
+        else:
+            query = sql.GET_TASKS_PAGE_BEFORE.format(filters=filters_clause)
+            params = (before_id, *filter_params, limit)
+
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        if before_id is not None:
+            rows.reverse()
+        return self.summary_format_list(rows)
+
+
+    def iter_tasks(
+            self,
+            page_size: int = 500,
+            status: FilterValue = None,
+            tag: FilterValue = None,
+            priority: FilterValue = None
+    ) -> Iterator[TaskSummary]:
+        """Recorre las tareas ordenadas por ID, página a página.
+
+        Es un generador: en memoria sólo vive una página a la vez y la
+        conexión se devuelve al pool entre página y página, por lo que es
+        seguro recorrer tablas grandes o detener el recorrido a medias.
+
+        Args:
+            page_size (int): Número de tareas pedidas por consulta.
+            status (FilterValue): Estado(s) por el cual filtrar.
+            tag (FilterValue): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue): Prioridad(es) por la cual filtrar.
+
+        Yields:
+            TaskSummary: Cada tarea, en orden ascendente de ID.
+        """
+        after_id = 0
+        while True:
+            page = self.get_tasks_page(
+                after_id=after_id,
+                limit=page_size,
+                status=status,
+                tag=tag,
+                priority=priority
+            )
+            yield from page
+            # Una página incompleta indica que no quedan más tareas.
+            if len(page) < page_size:
+                return
+            last_id = page[-1].id
+            assert last_id is not None, "Tarea de la BD sin ID."
+            after_id = last_id
+
+
+    def _content_filter(
+            self,
+            task_filter: TaskFilter,
+            text: str | None
+    ) -> tuple[str, tuple[Any, ...]]:
+        """Construye las condiciones de un filtro más la de contenido.
+
+        Args:
+            task_filter (TaskFilter): Filtro por status, tag y prioridad.
+            text (str | None): Palabras que deben aparecer en el contenido,
+                cada una por prefijo. Sin palabras no se añade condición.
+
+        Returns:
+            tuple[str, tuple[Any, ...]]: Fragmento " AND ..." y parámetros.
+        """
+        filters_clause, filter_params = task_filter.where()
+        match_expression = self._fts_query(text or "", column="content")
+        if not match_expression:
+            return filters_clause, filter_params
+        return (
+            filters_clause + sql.CONTENT_PREFIX_FILTER,
+            (*filter_params, match_expression)
+        )
+
+
+    # .. .......................................................... count_tasks
+    @connection_manager
+    def count_tasks(
+            self,
+            cursor: sqlite3.Cursor,
+            status: FilterValue = None,
+            tag: FilterValue = None,
+            priority: FilterValue = None,
+            text: str | None = None
+    ) -> int:
+        """Cuenta las tareas que cumplen los filtros, sin leerlas.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor de la base de datos, inyectado
+                por el decorador.
+            status (FilterValue): Estado(s) por el cual filtrar.
+            tag (FilterValue): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue): Prioridad(es) por la cual filtrar.
+            text (str | None): Palabras que deben aparecer en el contenido,
+                cada una por prefijo.
+
+        Returns:
+            int: Número de tareas que coinciden.
+        """
+        filters_clause, filter_params = self._content_filter(
+            TaskFilter(status=status, tag=tag, priority=priority), text
+        )
+        cursor.execute(
+            sql.COUNT_TASKS.format(filters=filters_clause), filter_params
+        )
+        return cursor.fetchone()[0]
+
+
+    # .. .......................................................... task_counts
+    @connection_manager
+    def task_counts(
+            self,
+            cursor: sqlite3.Cursor,
+            task_ids: Iterable[int] | None = None
+    ) -> dict[tuple[str, str, str], int]:
+        """Cuenta las tareas por status, tag y prioridad con un `GROUP BY`.
+
+        Sólo viajan a Python los totales (una fila por combinación
+        existente), nunca las tareas.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor de la base de datos, inyectado
+                por el decorador.
+            task_ids (Iterable[int] | None): Si se indica, sólo se cuentan
+                estas tareas (ej. las afectadas por un cambio).
+
+        Returns:
+            dict[tuple[str, str, str], int]: Número de tareas por
+                `(status, tag, priority)`. Las combinaciones sin tareas no
+                aparecen.
+        """
+        if task_ids is None:
+            rows = cursor.execute(sql.TASK_COUNTS).fetchall()
+        else:
+            rows = []
+            for chunk, placeholders in self._id_chunks(task_ids):
+                query = sql.TASK_COUNTS_BY_IDS.format(ids=placeholders)
+                rows.extend(cursor.execute(query, chunk).fetchall())
+
+        status, tag, priority = self._field_values()
+        counts: dict[tuple[str, str, str], int] = {}
+        for row in rows:
+            key = (
+                status.get(row[0], row[0]),
+                tag.get(row[1], row[1]),
+                priority.get(row[2], row[2]),
+            )
+            counts[key] = counts.get(key, 0) + row[3]
+        return counts
+
+
     # .. ............................................................. new_task
     @connection_manager
     def new_task(self, task_instance: Task, cursor: sqlite3.Cursor) -> int:
@@ -108,11 +461,10 @@ class RepositoryDB:
             int: ID de la fila de la tarea recién creada.
         """
         values = (
-            task_instance.status,
-            task_instance.tag,
+            FIELD_CODES["status"][task_instance.status],
+            FIELD_CODES["tag"][task_instance.tag],
             task_instance.content,
-            task_instance.priority,
-            task_instance.details,
+            FIELD_CODES["priority"][task_instance.priority],
         )
 
         cursor.execute(sql.NEW_TASK, values)
@@ -120,70 +472,281 @@ class RepositoryDB:
         new_id = cursor.lastrowid
         # Comprobación que new_id no es None (mypy).
         assert new_id is not None, "No se pudo obtener el ID de la nueva tarea."
+        # Los detalles vacíos no se guardan (ver `has_details`).
+        if task_instance.details:
+            cursor.execute(
+                sql.NEW_TASK_DETAILS,
+                (new_id, self._stored_details(task_instance.details))
+            )
         return new_id
 
 
+    def _stored_details(self, details: str) -> str | bytes:
+        """Prepara el texto de unos detalles para guardarlo, comprimiéndolo
+        si supera `compress_threshold`.
+
+        Args:
+            details (str): Texto de los detalles.
+
+        Returns:
+            str | bytes: Valor a guardar en `task_details.body`.
+        """
+        return compress_details(
+            details, self.compress_threshold, self.compression
+        )
+
+
+    # .. ....................................................... new_tasks_many
+    def new_tasks_many(
+            self,
+            tasks: Iterable[Task],
+            chunk_size: int = 5000
+    ) -> list[int]:
+        """Inserta muchas tareas en bloques, con una transacción por bloque.
+
+        Las tareas se consumen de forma perezosa desde `tasks` (puede ser un
+        generador), por lo que en memoria sólo vive un bloque a la vez. Cada
+        bloque se inserta con `_insert_chunk`, que toma su propio préstamo
+        del pool y, por tanto, su propia transacción.
+
+        Si un bloque falla, se revierte sólo ese bloque y se deja de
+        insertar: los bloques anteriores ya están confirmados y sus IDs se
+        devuelven igualmente, para que quien llama sepa qué se guardó.
+
+        Args:
+            tasks (Iterable[Task]): Tareas (sin ID) a insertar.
+            chunk_size (int): Número de tareas por transacción.
+
+        Returns:
+            list[int]: IDs asignados, en el mismo orden que `tasks`. Si un
+                bloque falla, sólo los de los bloques confirmados antes.
+        """
+        new_ids: list[int] = []
+        task_iterator = iter(tasks)
+        while chunk := list(islice(task_iterator, chunk_size)):
+            chunk_ids = self._insert_chunk(chunk)
+            if chunk_ids is None:
+                break
+            new_ids.extend(chunk_ids)
+        return new_ids
+
+
+    @connection_manager
+    def _insert_chunk(
+            self,
+            chunk: list[Task],
+            cursor: sqlite3.Cursor
+    ) -> list[int]:
+        """Inserta un bloque de tareas y sus detalles en una transacción.
+
+        Dentro de una transacción ningún otro escritor puede insertar, así que
+        los IDs asignados al bloque son consecutivos y terminan en
+        `last_insert_rowid()`. Los detalles se insertan después, en la misma
+        transacción, con esos IDs.
+
+        Args:
+            chunk (list[Task]): Tareas (sin ID) del bloque.
+            cursor (sqlite3.Cursor): Cursor de la base de datos, inyectado
+                por el decorador.
+
+        Returns:
+            list[int]: IDs asignados, en el mismo orden que `chunk`.
+        """
+        status, tag, priority = (
+            FIELD_CODES["status"], FIELD_CODES["tag"], FIELD_CODES["priority"]
+        )
+        cursor.executemany(
+            sql.NEW_TASK,
+            [
+                (
+                    status[task.status],
+                    tag[task.tag],
+                    task.content,
+                    priority[task.priority],
+                )
+                for task in chunk
+            ]
+        )
+        last_id = cursor.execute(sql.LAST_INSERT_ID).fetchone()[0]
+        chunk_ids = range(last_id - len(chunk) + 1, last_id + 1)
+        cursor.executemany(
+            sql.NEW_TASK_DETAILS,
+            (
+                (task_id, self._stored_details(task.details))
+                for task_id, task in zip(chunk_ids, chunk)
+                if task.details
+            )
+        )
+        return list(chunk_ids)
+
+
     # .. ......................................................... filter_tasks
     @connection_manager
     def filter_tasks(
             self,
             cursor: sqlite3.Cursor,
-            status: str | None = None,
-            tag: str | None = None,
-            priority: str | None = None
-    ) -> list[Task]:
-        """Filtra tareas dinámicamente por status, tag y/o prioridad.
-
-        Utiliza un patrón Strategy para seleccionar la consulta SQL adecuada
-        basándose en los filtros proporcionados. Si no se proporciona ningún
-        filtro, devuelve todas las tareas.
+            status: FilterValue = None,
+            tag: FilterValue = None,
+            priority: FilterValue = None,
+            task_filter: TaskFilter | None = None
+    ) -> list[TaskSummary]:
+        """Filtra tareas por status, tag y/o prioridad en una sola consulta.
+
+        Los criterios simples se pasan como argumentos (uno o varios valores
+        cada uno). Para exclusiones, orden o límite se pasa un `TaskFilter`
+        completo en `task_filter`, que tiene prioridad sobre los demás
+        argumentos. La consulta se construye con `TaskFilter`, siempre
+        parametrizada. Si no hay ningún criterio, devuelve todas las tareas.
 
         Args:
             cursor (sqlite3.Cursor): Cursor de la base de datos, inyectado
                 por el decorador.
-            status (str | None): Estado por el cual filtrar.
-            tag (str | None): Etiqueta por la cual filtrar.
-            priority (str | None): Prioridad por la cual filtrar.
+            status (FilterValue): Estado(s) por el cual filtrar.
+            tag (FilterValue): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue): Prioridad(es) por la cual filtrar.
+            task_filter (TaskFilter | None): Filtro compuesto a aplicar.
 
         Returns:
-            list[Task]: Lista de objetos `Task` que coinciden con los
+            list[TaskSummary]: Resúmenes de las tareas que coinciden con los
                 criterios de filtrado.
         """
-        # El diccionario mapea una clave de filtros activos a una estrategia
-        strategy_map = {
-        # (tiene_status, tiene_tag, tiene_prioridad): (consulta, [orden_parametros])
-            (True, False, False): (sql.FILTER_TASK_STATUS, ['status']),
-            (False, True, False): (sql.FILTER_TASK_TAG, ['tag']),
-            (False, False, True): (sql.FILTER_TASK_PRIORITY, ['priority']),
-            (True, True, False): (sql.FILTER_BY_STATUS_AND_TAG, ['status', 'tag']),
-            (True, False, True): (sql.FILTER_BY_STATUS_AND_PRIORITY, ['status', 'priority']),
-            (False, True, True): (sql.FILTER_BY_TAG_AND_PRIORITY, ['tag', 'priority']),
-            (True, True, True): (sql.FILTER_BY_ALL, ['status', 'tag', 'priority']),
-        }
-
-        # 1. Creamos la clave para el diccionario
-        key = (bool(status), bool(tag), bool(priority))
-
-        # 2. Seleccionamos la estrategia
-        if not any(key):
-            # Caso especial: no hay filtros, obtener todo
-            query = sql.GET_ALL_TASKS
-            params = []
-        else:
-            query, param_names = strategy_map[key]
+        if task_filter is None:
+            task_filter = TaskFilter(status=status, tag=tag, priority=priority)
 
-            # 3. Construimos la lista de parámetros en el orden correcto
-            all_params = {'status': status, 'tag': tag, 'priority': priority}
-            params = [all_params[name] for name in param_names]
+        filters_clause, filter_params = task_filter.where()
+        order_clause, order_params = task_filter.order_and_limit()
+        query = sql.FILTER_TASKS.format(
+            filters=filters_clause, order=order_clause
+        )
+        cursor.execute(query, (*filter_params, *order_params))
+        return self.summary_format_list(cursor.fetchall())
 
-        # 4. Ejecutamos la consulta seleccionada
-        cursor.execute(query, tuple(params))
-        rows = cursor.fetchall()
 
-        return self.task_format_list(rows)
+    # .. ......................................................... search_tasks
+    @staticmethod
+    def _fts_query(text: str, column: str | None = None) -> str:
+        """Convierte el texto del usuario en una expresión MATCH de FTS5.
+
+        Cada palabra se entrecomilla (escapando las comillas dobles) para que
+        los operadores de FTS5 escritos por el usuario no provoquen errores de
+        sintaxis, y se le añade `*` para buscar por prefijo. Todas las
+        palabras deben aparecer (AND implícito).
+
+        Args:
+            text (str): Texto de búsqueda, ej. `"reunión equi"`.
+            column (str | None): Columna de `tasks_fts` a la que limitar la
+                búsqueda, ej. `"content"`. Por defecto, todas.
+
+        Returns:
+            str: Expresión MATCH, ej. `'"reunión"* "equi"*'`. Vacía si el
+                texto no contiene palabras.
+        """
+        terms = [term.replace('"', '""') for term in text.split()]
+        expression = " ".join(f'"{term}"*' for term in terms)
+        if not expression or column is None:
+            return expression
+        return f"{column} : ({expression})"
+
+
+    @connection_manager
+    def search_tasks(
+            self,
+            query: str,
+            cursor: sqlite3.Cursor,
+            limit: int = 50
+    ) -> list[TaskSummary]:
+        """Busca tareas por texto en su contenido y detalles.
+
+        Usa el índice FTS5 `tasks_fts`, mantenido por triggers, y ordena los
+        resultados por relevancia (bm25).
+
+        Args:
+            query (str): Texto a buscar. Cada palabra se busca por prefijo.
+            cursor (sqlite3.Cursor): Cursor de la base de datos, inyectado
+                por el decorador.
+            limit (int): Número máximo de resultados.
+
+        Returns:
+            list[TaskSummary]: Tareas encontradas, de la más a la menos
+                relevante. Vacía si la búsqueda no contiene palabras.
+        """
+        match_expression = self._fts_query(query)
+        if not match_expression:
+            return []
+
+        cursor.execute(sql.SEARCH_TASKS, (match_expression, limit))
+        return self.summary_format_list(cursor.fetchall())
 
 
     # .. .......................................................... update_task
+    @staticmethod
+    def _encoded_fields(new_data: dict[str, Any]) -> dict[str, Any]:
+        """Convierte status, tag y prioridad a los códigos que se guardan.
+
+        Un valor sin código se trata como la violación de restricción que
+        sería en la base de datos: `connection_manager` la registra y el
+        método decorado devuelve `None`, como cualquier otro error de SQLite.
+
+        Args:
+            new_data (dict[str, Any]): Campos a actualizar y sus valores.
+
+        Raises:
+            sqlite3.IntegrityError: Si un status, tag o prioridad no es un
+                valor válido.
+
+        Returns:
+            dict[str, Any]: Los mismos campos, con los valores codificados.
+        """
+        encoded = dict(new_data)
+        for field, codes in FIELD_CODES.items():
+            if field in encoded:
+                if encoded[field] not in codes:
+                    raise sqlite3.IntegrityError(
+                        f"Valor no válido para {field}: {encoded[field]!r}"
+                    )
+                encoded[field] = codes[encoded[field]]
+        return encoded
+
+
+    def _save_details(
+            self,
+            cursor: sqlite3.Cursor,
+            task_id: int,
+            details: str | None
+    ) -> bool:
+        """Guarda los detalles de una tarea en `task_details`, sólo si cambian.
+
+        Los detalles vacíos no se guardan: se elimina la fila, para que las
+        consultas de listas sepan si hay detalles sin leer su texto. Los
+        largos se guardan comprimidos.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor de la transacción en curso.
+            task_id (int): ID de la tarea.
+            details (str | None): Nuevo texto de los detalles.
+
+        Returns:
+            bool: `True` si la tarea existe.
+        """
+        row = cursor.execute(sql.GET_TASK_DETAILS, (task_id,)).fetchone()
+        if row is None:
+            return False
+        current, new = decompress_details(row[0]), details or None
+        if new == current:
+            return True
+        if new is None:
+            cursor.execute(sql.DELETE_TASK_DETAILS, (task_id,))
+        elif current is None:
+            cursor.execute(
+                sql.NEW_TASK_DETAILS, (task_id, self._stored_details(new))
+            )
+        else:
+            cursor.execute(
+                sql.UPDATE_TASK_DETAILS, (self._stored_details(new), task_id)
+            )
+        return True
+
+
     @connection_manager
     def update_task(
         self, task_id: int, new_data: dict[str, str], cursor: sqlite3.Cursor
@@ -191,7 +754,8 @@ class RepositoryDB:
         """Actualiza uno o más campos de una tarea existente de forma dinámica.
 
         Construye la sentencia SQL dinámicamente a partir de los datos
-        proporcionados en el diccionario `new_data`.
+        proporcionados en el diccionario `new_data`. Los detalles se guardan
+        aparte, en `task_details`, y sólo se escriben si cambiaron.
 
         Args:
             task_id (int): ID de la tarea a actualizar.
@@ -205,10 +769,16 @@ class RepositoryDB:
             print("No hay datos para actualizar la tarea.")
             return
 
+        task_data = self._encoded_fields(new_data)
+        if "details" in task_data:
+            self._save_details(cursor, task_id, task_data.pop("details"))
+        if not task_data:
+            return
+
         # Crea un str ej.: "content = ?, priority = ?, etc...".
-        set_clause = ", ".join([f"{key} = ?" for key in new_data.keys()])
+        set_clause = ", ".join([f"{key} = ?" for key in task_data.keys()])
         # Crea una tupla como: ('Nuevo contenido', 'alta', 5).
-        values = tuple(new_data.values()) + (task_id,)
+        values = tuple(task_data.values()) + (task_id,)
         # Se arma el string de la consulta.
         query = f"{sql.UPDATE_TASK} {set_clause} WHERE id = ?;"
 
@@ -279,3 +849,151 @@ class RepositoryDB:
                 por el decorador.
         """
         cursor.execute(sql.DELETE_TASK, (id_task,))
+
+
+    # .. ..................................................... get_tasks_by_ids
+    @staticmethod
+    def _id_chunks(
+            task_ids: Iterable[int],
+            chunk_size: int = ID_CHUNK_SIZE
+    ) -> Iterator[tuple[list[int], str]]:
+        """Divide una lista de IDs en bloques para consultas "IN (...)".
+
+        Los IDs repetidos se descartan conservando el orden.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas.
+            chunk_size (int): Número máximo de IDs por bloque.
+
+        Yields:
+            tuple[list[int], str]: IDs del bloque y sus placeholders, ej.
+                `([3, 4], "?, ?")`.
+        """
+        unique_ids = list(dict.fromkeys(task_ids))
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start:start + chunk_size]
+            yield chunk, ", ".join("?" * len(chunk))
+
+
+    @connection_manager
+    def get_tasks_by_ids(
+            self,
+            task_ids: Iterable[int],
+            cursor: sqlite3.Cursor
+    ) -> list[TaskSummary]:
+        """Recupera varias tareas por sus IDs.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas a recuperar.
+            cursor (sqlite3.Cursor): Cursor de la base de datos, inyectado
+                por el decorador.
+
+        Returns:
+            list[TaskSummary]: Tareas encontradas, en orden ascendente de
+                ID. Los IDs que no existen se omiten.
+        """
+        rows = []
+        for chunk, placeholders in self._id_chunks(task_ids):
+            query = sql.GET_TASKS_BY_IDS.format(ids=placeholders)
+            rows.extend(cursor.execute(query, chunk).fetchall())
+        rows.sort(key=lambda row: row[0])
+        return self.summary_format_list(rows)
+
+
+    # .. ......................................................... update_tasks
+    @connection_manager
+    def update_tasks(
+            self,
+            task_ids: Iterable[int],
+            new_data: dict[str, str],
+            cursor: sqlite3.Cursor
+    ) -> int:
+        """Asigna los mismos valores a varias tareas en una transacción.
+
+        Los detalles, si se incluyen, se guardan tarea por tarea como en
+        `update_task`.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas a actualizar.
+            new_data (dict[str, str]): Campos a actualizar y sus nuevos
+                valores. Ejemplo: {"tag": "trabajo"}
+            cursor (sqlite3.Cursor): Cursor de la base de datos, inyectado
+                por el decorador.
+
+        Returns:
+            int: Número de tareas actualizadas.
+        """
+        if not new_data:
+            return 0
+
+        task_data = self._encoded_fields(new_data)
+        if "details" in task_data:
+            details = task_data.pop("details")
+            task_ids = list(dict.fromkeys(task_ids))
+            found = sum(
+                self._save_details(cursor, task_id, details)
+                for task_id in task_ids
+            )
+            if not task_data:
+                return found
+
+        set_clause = ", ".join([f"{key} = ?" for key in task_data.keys()])
+        values = tuple(task_data.values())
+        # Los valores del SET también cuentan como variables de la sentencia.
+        chunk_size = ID_CHUNK_SIZE - len(values)
+        updated = 0
+        for chunk, placeholders in self._id_chunks(task_ids, chunk_size):
+            query = sql.UPDATE_TASKS.format(
+                set_clause=set_clause, ids=placeholders
+            )
+            updated += cursor.execute(query, (*values, *chunk)).rowcount
+        return updated
+
+
+    # .. ............................................... check_or_uncheck_tasks
+    @connection_manager
+    def check_or_uncheck_tasks(
+            self,
+            task_ids: Iterable[int],
+            cursor: sqlite3.Cursor
+    ) -> int:
+        """Cambia el estado de varias tareas de forma cíclica, en una sola
+        transacción. Ver `check_or_uncheck_task`.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas a modificar.
+            cursor (sqlite3.Cursor): Cursor de la base de datos, inyectado
+                por el decorador.
+
+        Returns:
+            int: Número de tareas modificadas.
+        """
+        updated = 0
+        for chunk, placeholders in self._id_chunks(task_ids):
+            query = sql.UPDATE_STATUS_TOGGLE_MANY.format(ids=placeholders)
+            updated += cursor.execute(query, chunk).rowcount
+        return updated
+
+
+    # .. ......................................................... delete_tasks
+    @connection_manager
+    def delete_tasks(
+            self,
+            task_ids: Iterable[int],
+            cursor: sqlite3.Cursor
+    ) -> int:
+        """Elimina varias tareas en una sola transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas a eliminar.
+            cursor (sqlite3.Cursor): Cursor de la base de datos, inyectado
+                por el decorador.
+
+        Returns:
+            int: Número de tareas eliminadas.
+        """
+        deleted = 0
+        for chunk, placeholders in self._id_chunks(task_ids):
+            query = sql.DELETE_TASKS.format(ids=placeholders)
+            deleted += cursor.execute(query, chunk).rowcount
+        return deleted
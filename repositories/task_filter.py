@@ -0,0 +1,209 @@
+# MODULO: repositories
+# .. .......................................................... task_filter ..󰌠
+"""Construye consultas de filtrado parametrizadas para la tabla de tareas.
+
+Este módulo define `TaskFilter`, la descripción de un filtro compuesto
+(varios valores por columna, exclusiones, orden y límite), y las funciones
+que lo traducen a fragmentos SQL con placeholders `?`.
+
+Los nombres de columna salen siempre de listas fijas y los valores viajan
+siempre como parámetros (convertidos a los códigos enteros con los que se
+guardan), por lo que ningún dato del usuario llega al texto SQL. El SQL
+depende sólo de la "forma" del filtro (qué columnas, cuántos valores, qué
+orden), así que se compila una vez por forma y se guarda en caché.
+"""
+from functools import lru_cache
+from typing import NamedTuple, Sequence
+from models.model_task import FIELD_CODES
+
+
+# Valor de un criterio: un valor, varios (se combinan con OR) o ninguno.
+FilterValue = str | Sequence[str] | None
+
+# Columnas por las que se puede filtrar, en el orden en que se escriben las
+# condiciones (coincide con el índice compuesto status, tag, priority).
+FILTER_COLUMNS: tuple[str, ...] = ("status", "tag", "priority")
+
+# Columnas por las que se puede ordenar.
+SORT_COLUMNS: tuple[str, ...] = ("id", "status", "tag", "priority", "content")
+
+# Forma de una condición: (columna, negada, número de valores).
+ConditionShape = tuple[str, bool, int]
+
+# Código de un valor que no existe: no coincide con ninguna fila, tampoco
+# dentro de un NOT IN (a diferencia de NULL).
+UNKNOWN_CODE: int = -1
+
+
+def filter_values(value: FilterValue) -> tuple[str, ...]:
+    """Normaliza un criterio a una tupla de valores no vacíos.
+
+    Args:
+        value (FilterValue): Valor suelto, secuencia de valores o `None`.
+
+    Returns:
+        tuple[str, ...]: Valores del criterio, sin duplicados y en su orden
+            original. Vacía si el criterio no filtra nada.
+    """
+    if not value:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(dict.fromkeys(item for item in value if item))
+
+
+class TaskFilter(NamedTuple):
+    """Criterios de un filtrado de tareas.
+
+    Los criterios de inclusión se combinan con AND entre columnas y con OR
+    entre los valores de una misma columna. Ej: "prioridad alta o media y no
+    completadas" es
+    `TaskFilter(priority=("alta", "media"), exclude_status="completed")`.
+
+    Attributes:
+        - status (FilterValue): Estados admitidos.
+        - tag (FilterValue): Etiquetas admitidas.
+        - priority (FilterValue): Prioridades admitidas.
+        - exclude_status (FilterValue): Estados excluidos.
+        - exclude_tag (FilterValue): Etiquetas excluidas.
+        - exclude_priority (FilterValue): Prioridades excluidas.
+        - order_by (Sequence[str]): Columnas de ordenación; un `-` delante
+              indica orden descendente, ej. `("-priority", "id")`.
+        - limit (int | None): Número máximo de tareas, o `None` sin límite.
+    """
+    status: FilterValue = None
+    tag: FilterValue = None
+    priority: FilterValue = None
+    exclude_status: FilterValue = None
+    exclude_tag: FilterValue = None
+    exclude_priority: FilterValue = None
+    order_by: Sequence[str] = ("id",)
+    limit: int | None = None
+
+
+    def conditions(self) -> list[tuple[str, bool, tuple[str, ...]]]:
+        """Devuelve las condiciones activas del filtro.
+
+        Returns:
+            list[tuple[str, bool, tuple[str, ...]]]: Tuplas
+                `(columna, negada, valores)`, primero las inclusiones.
+        """
+        active = []
+        for negated in (False, True):
+            prefix = "exclude_" if negated else ""
+            for column in FILTER_COLUMNS:
+                values = filter_values(getattr(self, prefix + column))
+                if values:
+                    active.append((column, negated, values))
+        return active
+
+
+    def sorted_by_id(self) -> bool:
+        """Indica si el filtro devuelve las tareas en orden de ID.
+
+        Son los filtros que `TaskCache` puede resolver con su índice de
+        bits: inclusiones, exclusiones y límite, pero no otros órdenes.
+
+        Returns:
+            bool: `True` si el único criterio de orden es `"id"`.
+        """
+        return tuple(self.order_by) == ("id",)
+
+
+    def where(self) -> tuple[str, tuple[int, ...]]:
+        """Construye las condiciones "AND ..." del filtro.
+
+        Returns:
+            tuple[str, tuple[int, ...]]: Fragmento SQL (vacío si no hay
+                condiciones) y sus parámetros, ya convertidos a códigos
+                (`models.model_task.FIELD_CODES`).
+        """
+        conditions = self.conditions()
+        shape = tuple(
+            (column, negated, len(values))
+            for column, negated, values in conditions
+        )
+        params = tuple(
+            FIELD_CODES[column].get(value, UNKNOWN_CODE)
+            for column, _, values in conditions
+            for value in values
+        )
+        return compile_conditions(shape), params
+
+
+    def order_and_limit(self) -> tuple[str, tuple[int, ...]]:
+        """Construye las cláusulas ORDER BY y LIMIT del filtro.
+
+        Raises:
+            ValueError: Si una columna de ordenación no está en
+                `SORT_COLUMNS`.
+
+        Returns:
+            tuple[str, tuple[int, ...]]: Fragmento SQL y sus parámetros (el
+                límite, si lo hay).
+        """
+        clause = compile_order(tuple(self.order_by))
+        if self.limit is None:
+            return clause, ()
+        return f"{clause} LIMIT ?", (self.limit,)
+
+
+@lru_cache(maxsize=128)
+def compile_conditions(shape: tuple[ConditionShape, ...]) -> str:
+    """Compila la forma de un filtro en condiciones SQL con placeholders.
+
+    Una condición de un valor usa `=` (o `!=`); con varios, `IN` (o
+    `NOT IN`). Las igualdades e `IN` sobre el prefijo de un índice compuesto
+    se resuelven con ese índice.
+
+    Args:
+        shape (tuple[ConditionShape, ...]): Condiciones como
+            `(columna, negada, número de valores)`.
+
+    Raises:
+        ValueError: Si una columna no está en `FILTER_COLUMNS`.
+
+    Returns:
+        str: Fragmento " AND ..." listo para añadir tras un WHERE.
+    """
+    parts = []
+    for column, negated, count in shape:
+        if column not in FILTER_COLUMNS:
+            raise ValueError(f"Columna de filtro no válida: {column!r}")
+        if count == 1:
+            operator = "!=" if negated else "="
+            parts.append(f" AND {column} {operator} ?")
+        else:
+            operator = "NOT IN" if negated else "IN"
+            placeholders = ", ".join("?" * count)
+            parts.append(f" AND {column} {operator} ({placeholders})")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=32)
+def compile_order(order_by: tuple[str, ...]) -> str:
+    """Compila la lista de ordenación en una cláusula ORDER BY.
+
+    Si `id` no está en la lista se añade al final, para que el orden sea
+    siempre determinista.
+
+    Args:
+        order_by (tuple[str, ...]): Columnas, con `-` para orden descendente.
+
+    Raises:
+        ValueError: Si una columna no está en `SORT_COLUMNS`.
+
+    Returns:
+        str: Cláusula " ORDER BY ...".
+    """
+    terms = []
+    columns = []
+    for item in order_by:
+        column = item.lstrip("-")
+        if column not in SORT_COLUMNS:
+            raise ValueError(f"Columna de orden no válida: {item!r}")
+        columns.append(column)
+        terms.append(f"{column} DESC" if item.startswith("-") else column)
+    if "id" not in columns:
+        terms.append("id")
+    return " ORDER BY " + ", ".join(terms)
@@ -0,0 +1,201 @@
+# MODULO: services
+# .. ................................................... async_task_service ..󰌠
+"""Fachada asíncrona de `TaskService` para la interfaz.
+
+Las consultas a SQLite pueden tardar (disco lento, base de datos bloqueada por
+otro proceso, importaciones grandes). Este módulo define `AsyncTaskService`,
+que ejecuta cada operación del servicio en un hilo dedicado y devuelve
+corutinas, de modo que el bucle de eventos de Textual nunca espera a SQLite.
+
+Todas las operaciones se ejecutan en el mismo hilo y en orden de llegada, por
+lo que el `TaskService` envuelto (y su caché) nunca se usa desde dos hilos a
+la vez.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, TypeVar
+from models.model_task import Task, TaskSummary
+from services.task_counts import TaskCounts
+from services.task_service import TaskService
+
+
+T = TypeVar("T")
+
+
+class AsyncTaskService:
+    """Ejecuta las operaciones de `TaskService` en un hilo dedicado.
+
+    Cada método es la versión `async` del método homónimo de `TaskService`.
+
+    Attributes:
+        - service (TaskService): Servicio síncrono envuelto.
+    """
+
+    def __init__(self, service: TaskService):
+        """Inicializa la fachada y su hilo de trabajo.
+
+        Args:
+            service (TaskService): Servicio síncrono a envolver.
+        """
+        self.service = service
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tasks-db"
+        )
+
+
+    async def _run(
+            self,
+            func: Callable[..., T],
+            *args: Any,
+            **kwargs: Any
+    ) -> T:
+        """Ejecuta una función del servicio en el hilo de la base de datos.
+
+        Si la corutina se cancela (ej. un refresco obsoleto), una consulta
+        que aún espera turno en el hilo ya no se ejecuta; la que está en curso
+        termina en segundo plano y su resultado se descarta.
+
+        Args:
+            func (Callable): Método del servicio a ejecutar.
+            *args: Argumentos posicionales para `func`.
+            **kwargs: Argumentos de palabra clave para `func`.
+
+        Returns:
+            T: Resultado de `func`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
+
+
+    async def open(self) -> None:
+        """Abre el servicio (crea y migra el esquema) en el hilo de la BD."""
+        await self._run(self.service.open)
+
+
+    async def close(self) -> None:
+        """Cierra el servicio y detiene el hilo de la base de datos."""
+        await self._run(self.service.close)
+        self._executor.shutdown(wait=False)
+
+
+    async def get_all_tasks(self) -> list[TaskSummary]:
+        """Ver `TaskService.get_all_tasks`."""
+        return await self._run(self.service.get_all_tasks)
+
+
+    async def get_tasks_page_service(self, **kwargs: Any) -> list[TaskSummary]:
+        """Ver `TaskService.get_tasks_page_service`.
+
+        Args:
+            **kwargs: `after_id`, `before_id`, `limit`, filtros y `text`.
+        """
+        return await self._run(self.service.get_tasks_page_service, **kwargs)
+
+
+    async def count_tasks_service(self, **kwargs: Any) -> int:
+        """Ver `TaskService.count_tasks_service`.
+
+        Args:
+            **kwargs: Filtros `status`, `tag`, `priority` y `text`.
+        """
+        return await self._run(self.service.count_tasks_service, **kwargs)
+
+
+    async def task_counts_service(self) -> TaskCounts:
+        """Ver `TaskService.task_counts_service`."""
+        return await self._run(self.service.task_counts_service)
+
+
+    async def get_task_by_id_service(self, task_id: int) -> Task | None:
+        """Ver `TaskService.get_task_by_id_service`."""
+        return await self._run(self.service.get_task_by_id_service, task_id)
+
+
+    async def get_tasks_by_ids_service(
+            self,
+            task_ids: Iterable[int]
+    ) -> list[TaskSummary]:
+        """Ver `TaskService.get_tasks_by_ids_service`."""
+        return await self._run(self.service.get_tasks_by_ids_service, task_ids)
+
+
+    async def new_task_service(self, task_instance: Task) -> int | None:
+        """Ver `TaskService.new_task_service`."""
+        return await self._run(self.service.new_task_service, task_instance)
+
+
+    async def new_tasks_many_service(self, tasks: Iterable[Task]) -> list[int]:
+        """Ver `TaskService.new_tasks_many_service`.
+
+        El iterable se consume en el hilo de la base de datos.
+        """
+        return await self._run(self.service.new_tasks_many_service, tasks)
+
+
+    async def check_or_uncheck_task_service(self, task_id: int) -> None:
+        """Ver `TaskService.check_or_uncheck_task_service`."""
+        await self._run(self.service.check_or_uncheck_task_service, task_id)
+
+
+    async def update_task_service(
+            self,
+            task_id: int,
+            new_data: dict[str, str]
+    ) -> None:
+        """Ver `TaskService.update_task_service`."""
+        await self._run(self.service.update_task_service, task_id, new_data)
+
+
+    async def filter_tasks_service(self, **kwargs: Any) -> list[TaskSummary]:
+        """Ver `TaskService.filter_tasks_service`.
+
+        Args:
+            **kwargs: Filtros `status`, `tag` y `priority`, o un
+                `task_filter` compuesto.
+        """
+        return await self._run(self.service.filter_tasks_service, **kwargs)
+
+
+    async def search_tasks_service(
+            self,
+            query: str,
+            limit: int = 50
+    ) -> list[TaskSummary]:
+        """Ver `TaskService.search_tasks_service`."""
+        return await self._run(
+            self.service.search_tasks_service, query, limit=limit
+        )
+
+
+    async def delete_task_service(self, task_id: int) -> None:
+        """Ver `TaskService.delete_task_service`."""
+        await self._run(self.service.delete_task_service, task_id)
+
+
+    async def check_or_uncheck_tasks_service(
+            self,
+            task_ids: Iterable[int]
+    ) -> int:
+        """Ver `TaskService.check_or_uncheck_tasks_service`."""
+        return await self._run(
+            self.service.check_or_uncheck_tasks_service, task_ids
+        )
+
+
+    async def update_tasks_service(
+            self,
+            task_ids: Iterable[int],
+            new_data: dict[str, str]
+    ) -> int:
+        """Ver `TaskService.update_tasks_service`."""
+        return await self._run(
+            self.service.update_tasks_service, task_ids, new_data
+        )
+
+
+    async def delete_tasks_service(self, task_ids: Iterable[int]) -> int:
+        """Ver `TaskService.delete_tasks_service`."""
+        return await self._run(self.service.delete_tasks_service, task_ids)
@@ -0,0 +1,271 @@
+# MODULO: services
+# .. ......................................................... bitmap_index ..󰌠
+"""Índice de bits en memoria sobre los IDs de las tareas.
+
+Este módulo define `BitmapIndex`, que guarda, para cada valor de status, tag
+y prioridad, un entero de Python usado como conjunto de bits: el bit `n` está
+activo si la tarea con ID `n` tiene ese valor. Como el modelo sólo admite
+3 estados, 4 etiquetas y 3 prioridades, cualquier combinación de filtros
+(`TaskFilter`) se resuelve con unas pocas operaciones `&`, `|` y `~` sobre
+enteros, y el número de tareas que coinciden es `int.bit_count()`.
+"""
+from itertools import compress
+from operator import attrgetter
+from typing import Iterable
+from models.model_task import TaskSummary
+from repositories.task_filter import TaskFilter
+
+
+# Campos con un conjunto de bits por valor.
+INDEXED_FIELDS: tuple[str, ...] = ("status", "tag", "priority")
+
+# Bits que se convierten a texto de una vez al extraer una página de IDs.
+WINDOW_BITS: int = 4096
+
+# Traduce los dígitos "0"/"1" del texto binario a bytes falsos/verdaderos.
+_BIT_FLAGS: bytes = bytes.maketrans(b"01", b"\x00\x01")
+
+# Traducción inversa: bytes falsos/verdaderos a dígitos "0"/"1".
+_BIT_DIGITS: bytes = bytes.maketrans(b"\x00\x01", b"01")
+
+
+class BitmapIndex:
+    """Conjuntos de bits de IDs de tareas por campo y valor.
+
+    Attributes:
+        - all (int): Conjunto de bits con los IDs de todas las tareas.
+    """
+
+    def __init__(self):
+        """Inicializa un índice vacío."""
+        self._bits: dict[str, dict[str, int]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        self.all = 0
+
+
+    def clear(self) -> None:
+        """Vacía el índice."""
+        for values in self._bits.values():
+            values.clear()
+        self.all = 0
+
+
+    def load(self, tasks: Iterable[TaskSummary]) -> None:
+        """Reemplaza el índice por el de todas las tareas dadas.
+
+        Las tareas se agrupan primero por combinación de valores (como
+        mucho 3 x 4 x 3); cada grupo se convierte a entero una sola vez y
+        los conjuntos por valor se obtienen uniendo los de sus grupos, en
+        lugar de crear un entero nuevo por cada tarea.
+
+        Args:
+            tasks (Iterable[TaskSummary]): Tareas con ID.
+        """
+        field_values = attrgetter(*INDEXED_FIELDS)
+        groups: dict[tuple[str, ...], list[int]] = {}
+        for task in tasks:
+            groups.setdefault(field_values(task), []).append(task.id)
+
+        self.clear()
+        for key, ids in groups.items():
+            bits = _bits_from_ids(ids)
+            self.all |= bits
+            for field, value in zip(INDEXED_FIELDS, key):
+                values = self._bits[field]
+                values[value] = values.get(value, 0) | bits
+
+
+    # .. ....................................................... Escritura ..󰌠
+    def add(self, task: TaskSummary) -> None:
+        """Activa el bit de una tarea en los conjuntos de sus valores.
+
+        Args:
+            task (TaskSummary): Tarea con ID.
+        """
+        bit = 1 << task.id
+        self.all |= bit
+        for field in INDEXED_FIELDS:
+            values = self._bits[field]
+            value = getattr(task, field)
+            values[value] = values.get(value, 0) | bit
+
+
+    def remove(self, task: TaskSummary) -> None:
+        """Desactiva el bit de una tarea en los conjuntos de sus valores.
+
+        Args:
+            task (TaskSummary): Tarea tal como se indexó.
+        """
+        bit = 1 << task.id
+        self.all &= ~bit
+        for field in INDEXED_FIELDS:
+            values = self._bits[field]
+            value = getattr(task, field)
+            values[value] = values.get(value, 0) & ~bit
+
+
+    # .. ........................................................ Lectura ..󰌠
+    def union(self, field: str, values: Iterable[str]) -> int:
+        """Devuelve los IDs que tienen alguno de los valores (OR).
+
+        Args:
+            field (str): Campo indexado.
+            values (Iterable[str]): Valores del campo. Un valor desconocido
+                no aporta IDs.
+
+        Returns:
+            int: Conjunto de bits con los IDs.
+        """
+        bits = 0
+        field_bits = self._bits[field]
+        for value in values:
+            bits |= field_bits.get(value, 0)
+        return bits
+
+
+    def mask(self, task_filter: TaskFilter) -> int:
+        """Resuelve las condiciones de un filtro con operaciones de bits.
+
+        Cada inclusión se interseca (AND) y cada exclusión se resta
+        (AND NOT), con la misma semántica que `TaskFilter.where`. El orden y
+        el límite del filtro no se usan.
+
+        Args:
+            task_filter (TaskFilter): Filtro a resolver.
+
+        Returns:
+            int: Conjunto de bits con los IDs que cumplen el filtro.
+        """
+        result = self.all
+        for column, negated, values in task_filter.conditions():
+            bits = self.union(column, values)
+            result = result & ~bits if negated else result & bits
+        return result
+
+
+    @staticmethod
+    def ids(
+            mask: int,
+            after_id: int = 0,
+            limit: int | None = None,
+            before_id: int | None = None
+    ) -> list[int]:
+        """Extrae IDs de un conjunto de bits, en orden ascendente.
+
+        Con `limit`, los bits se recorren por ventanas de `WINDOW_BITS`, de
+        modo que el costo depende del tamaño de la página y no del total.
+
+        Args:
+            mask (int): Conjunto de bits.
+            after_id (int): Sólo IDs mayores que éste.
+            limit (int | None): Número máximo de IDs, o `None` sin límite.
+            before_id (int | None): Si se indica, los `limit` IDs más altos
+                menores que éste (la página anterior); `after_id` se ignora.
+
+        Returns:
+            list[int]: IDs en orden ascendente.
+        """
+        if before_id is not None:
+            return BitmapIndex._ids_before(mask, before_id, limit)
+
+        offset = max(after_id + 1, 0)
+        mask >>= offset
+        if limit is None:
+            return _bit_positions(mask, offset)
+
+        found: list[int] = []
+        while mask and len(found) < limit:
+            window = mask & ((1 << WINDOW_BITS) - 1)
+            if not window:
+                # Salta de una vez hasta el siguiente bit activo.
+                skip = (mask & -mask).bit_length() - 1
+                mask >>= skip
+                offset += skip
+                continue
+            found.extend(_bit_positions(window, offset, limit - len(found)))
+            mask >>= WINDOW_BITS
+            offset += WINDOW_BITS
+        return found
+
+
+    @staticmethod
+    def _ids_before(
+            mask: int,
+            before_id: int,
+            limit: int | None
+    ) -> list[int]:
+        """Extrae los IDs más altos menores que `before_id`.
+
+        Args:
+            mask (int): Conjunto de bits.
+            before_id (int): Límite superior, excluido.
+            limit (int | None): Número máximo de IDs.
+
+        Returns:
+            list[int]: IDs en orden ascendente.
+        """
+        if before_id < mask.bit_length():
+            mask &= (1 << max(before_id, 0)) - 1
+        if limit is None:
+            return _bit_positions(mask, 0)
+
+        found: list[int] = []
+        end = mask.bit_length()
+        while end > 0 and len(found) < limit:
+            start = max(end - WINDOW_BITS, 0)
+            window = (mask >> start) & ((1 << (end - start)) - 1)
+            positions = _bit_positions(window, start)
+            found.extend(reversed(positions[-(limit - len(found)):]))
+            # Descarta la ventana leída y salta hasta el bit activo más alto.
+            mask &= (1 << start) - 1
+            end = mask.bit_length()
+        found.reverse()
+        return found
+
+
+def _bits_from_ids(ids: list[int]) -> int:
+    """Construye el conjunto de bits de una lista de IDs.
+
+    Args:
+        ids (list[int]): IDs no negativos.
+
+    Returns:
+        int: Entero con el bit de cada ID activo.
+    """
+    flags = bytearray(max(ids, default=0) + 1)
+    for task_id in ids:
+        flags[task_id] = 1
+    # Texto binario con el bit más alto primero, convertido de una vez.
+    return int(bytes(reversed(flags)).translate(_BIT_DIGITS), 2)
+
+
+def _bit_positions(
+        bits: int,
+        offset: int,
+        limit: int | None = None
+) -> list[int]:
+    """Devuelve las posiciones de los bits activos de un entero.
+
+    Args:
+        bits (int): Entero no negativo.
+        offset (int): Valor a sumar a cada posición.
+        limit (int | None): Número máximo de posiciones (las más bajas).
+
+    Returns:
+        list[int]: Posiciones más `offset`, en orden ascendente.
+    """
+    # Texto binario con el bit 0 primero.
+    text = bin(bits)[:1:-1]
+    if limit is None:
+        # Todas las posiciones: `compress` recorre el texto en C.
+        flags = text.encode("ascii").translate(_BIT_FLAGS)
+        return list(compress(range(offset, offset + len(flags)), flags))
+
+    # Sólo las primeras: `find` salta los ceros en C y se detiene pronto.
+    positions: list[int] = []
+    position = text.find("1")
+    while position != -1 and len(positions) < limit:
+        positions.append(position + offset)
+        position = text.find("1", position + 1)
+    return positions
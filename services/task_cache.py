@@ -0,0 +1,212 @@
+# MODULO: services
+# .. ........................................................... task_cache ..󰌠
+"""Caché en memoria de las tareas para la capa de servicios.
+
+Este módulo define la clase `TaskCache`, una copia en memoria de la tabla de
+tareas indexada por ID y con un índice de bits (`BitmapIndex`) por status,
+tag y prioridad. Guarda resúmenes (`TaskSummary`), sin el texto de los
+detalles.
+`TaskService` la mantiene al día escribiendo en ella cada cambio que hace en
+la base de datos (write-through) y la descarta cuando detecta cambios hechos
+por otro proceso.
+"""
+from typing import Iterable
+from models.model_task import TaskSummary
+from repositories.task_filter import FilterValue, TaskFilter
+from services.bitmap_index import BitmapIndex
+
+
+class TaskCache:
+    """Copia en memoria de las tareas con índices por ID y por campo.
+
+    Los filtros se resuelven con operaciones de bits sobre el índice y los
+    conteos con `int.bit_count()`, sin recorrer las tareas.
+
+    La caché sólo responde consultas cuando está completa (`loaded`); hasta
+    entonces el servicio debe leer de la base de datos.
+
+    Attributes:
+        - loaded (bool): `True` si la caché contiene todas las tareas.
+    """
+
+    def __init__(self):
+        """Inicializa una caché vacía y no cargada."""
+        self._tasks: dict[int, TaskSummary] = {}
+        # Índice de bits: campo -> valor -> IDs con ese valor. Sus bits
+        # están ordenados por ID, como las páginas de la base de datos.
+        self._index = BitmapIndex()
+        self.loaded = False
+
+
+    def __len__(self) -> int:
+        """Devuelve el número de tareas en caché."""
+        return len(self._tasks)
+
+
+    def clear(self) -> None:
+        """Vacía la caché y la marca como no cargada."""
+        self._tasks.clear()
+        self._index.clear()
+        self.loaded = False
+
+
+    def load(self, tasks: Iterable[TaskSummary]) -> None:
+        """Reemplaza el contenido de la caché por todas las tareas dadas.
+
+        Args:
+            tasks (Iterable[TaskSummary]): Todas las tareas de la base de
+                datos.
+        """
+        self.clear()
+        for task in tasks:
+            self._tasks[task.id] = task
+        self._index.load(self._tasks.values())
+        self.loaded = True
+
+
+    # .. ....................................................... Escritura ..󰌠
+    def put(self, task: TaskSummary) -> None:
+        """Inserta o reemplaza una tarea, actualizando los índices.
+
+        Args:
+            task (TaskSummary): Tarea con ID.
+        """
+        previous = self._tasks.get(task.id)
+        if previous is not None:
+            self._index.remove(previous)
+        self._tasks[task.id] = task
+        self._index.add(task)
+
+
+    def remove(self, task_id: int) -> None:
+        """Elimina una tarea de la caché, si está.
+
+        Args:
+            task_id (int): ID de la tarea eliminada.
+        """
+        task = self._tasks.pop(task_id, None)
+        if task is not None:
+            self._index.remove(task)
+
+
+    # .. ........................................................ Lectura ..󰌠
+    def get(self, task_id: int) -> TaskSummary | None:
+        """Devuelve una tarea por su ID.
+
+        Args:
+            task_id (int): ID de la tarea.
+
+        Returns:
+            TaskSummary | None: La tarea, o `None` si no existe.
+        """
+        return self._tasks.get(task_id)
+
+
+    def _mask(
+            self,
+            status: FilterValue = None,
+            tag: FilterValue = None,
+            priority: FilterValue = None,
+            task_filter: TaskFilter | None = None
+    ) -> int:
+        """Devuelve el conjunto de bits de los IDs que cumplen los filtros.
+
+        Los valores de un mismo criterio se unen (OR), los criterios se
+        intersecan (AND) y las exclusiones se restan, igual que en
+        `TaskFilter`.
+
+        Args:
+            status (FilterValue): Estado(s) por el cual filtrar.
+            tag (FilterValue): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue): Prioridad(es) por la cual filtrar.
+            task_filter (TaskFilter | None): Filtro compuesto; si se indica,
+                reemplaza a los demás criterios.
+
+        Returns:
+            int: Conjunto de bits con los IDs.
+        """
+        if task_filter is None:
+            task_filter = TaskFilter(status=status, tag=tag, priority=priority)
+        return self._index.mask(task_filter)
+
+
+    def filter(
+            self,
+            status: FilterValue = None,
+            tag: FilterValue = None,
+            priority: FilterValue = None,
+            task_filter: TaskFilter | None = None
+    ) -> list[TaskSummary]:
+        """Devuelve las tareas que cumplen los filtros, ordenadas por ID.
+
+        Args:
+            status (FilterValue): Estado(s) por el cual filtrar.
+            tag (FilterValue): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue): Prioridad(es) por la cual filtrar.
+            task_filter (TaskFilter | None): Filtro compuesto, con
+                exclusiones y límite; si se indica, reemplaza a los demás
+                criterios. Debe ordenar por ID (`TaskFilter.sorted_by_id`).
+
+        Returns:
+            list[TaskSummary]: Tareas que coinciden.
+        """
+        mask = self._mask(status, tag, priority, task_filter)
+        limit = task_filter.limit if task_filter is not None else None
+        return [
+            self._tasks[task_id]
+            for task_id in self._index.ids(mask, limit=limit)
+        ]
+
+
+    def count(
+            self,
+            status: FilterValue = None,
+            tag: FilterValue = None,
+            priority: FilterValue = None,
+            task_filter: TaskFilter | None = None
+    ) -> int:
+        """Cuenta las tareas que cumplen los filtros, sin recorrerlas.
+
+        Args:
+            status (FilterValue): Estado(s) por el cual filtrar.
+            tag (FilterValue): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue): Prioridad(es) por la cual filtrar.
+            task_filter (TaskFilter | None): Filtro compuesto; si se indica,
+                reemplaza a los demás criterios. El límite no se aplica.
+
+        Returns:
+            int: Número de tareas que coinciden.
+        """
+        return self._mask(status, tag, priority, task_filter).bit_count()
+
+
+    def page(
+            self,
+            after_id: int = 0,
+            limit: int = 500,
+            status: FilterValue = None,
+            tag: FilterValue = None,
+            priority: FilterValue = None,
+            before_id: int | None = None
+    ) -> list[TaskSummary]:
+        """Devuelve una página de tareas con la misma semántica que
+        `RepositoryDB.get_tasks_page`.
+
+        Args:
+            after_id (int): Último ID ya recibido.
+            limit (int): Tamaño máximo de la página.
+            status (FilterValue): Estado(s) por el cual filtrar.
+            tag (FilterValue): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue): Prioridad(es) por la cual filtrar.
+            before_id (int | None): Primer ID ya recibido, para retroceder.
+
+        Returns:
+            list[TaskSummary]: Tareas de la página en orden ascendente de ID.
+        """
+        page_ids = self._index.ids(
+            self._mask(status, tag, priority),
+            after_id=after_id,
+            limit=limit,
+            before_id=before_id
+        )
+        return [self._tasks[task_id] for task_id in page_ids]
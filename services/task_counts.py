@@ -0,0 +1,133 @@
+# MODULO: services
+# .. .......................................................... task_counts ..󰌠
+"""Totales de tareas por status, tag y prioridad para la capa de servicios.
+
+Este módulo define la clase `TaskCounts`, que guarda cuántas tareas hay en
+cada combinación `(status, tag, priority)`. Se carga con una sola consulta
+`GROUP BY` (`RepositoryDB.task_counts`) y `TaskService` la mantiene al día
+aplicando la diferencia que produce cada cambio, sin volver a contar la
+tabla ni leer sus filas.
+"""
+from collections import Counter
+from typing import Mapping
+from models.model_task import TaskSummary
+
+
+# Combinación de valores por la que se cuenta: (status, tag, priority).
+CountKey = tuple[str, str, str]
+
+# Posición de cada campo dentro de `CountKey`.
+KEY_FIELDS: tuple[str, ...] = ("status", "tag", "priority")
+
+
+class TaskCounts:
+    """Número de tareas por cada combinación de status, tag y prioridad.
+
+    Sólo responde consultas cuando está cargada (`loaded`); hasta entonces
+    el servicio debe cargarla desde la base de datos.
+
+    Attributes:
+        - loaded (bool): `True` si los totales reflejan toda la tabla.
+    """
+
+    def __init__(self):
+        """Inicializa unos totales vacíos y no cargados."""
+        self._counts: Counter[CountKey] = Counter()
+        self.loaded = False
+
+
+    def clear(self) -> None:
+        """Vacía los totales y los marca como no cargados."""
+        self._counts.clear()
+        self.loaded = False
+
+
+    def load(self, counts: Mapping[CountKey, int]) -> None:
+        """Reemplaza los totales por los leídos de la base de datos.
+
+        Args:
+            counts (Mapping[CountKey, int]): Resultado de
+                `RepositoryDB.task_counts()`.
+        """
+        self._counts = Counter(counts)
+        self.loaded = True
+
+
+    def copy(self) -> "TaskCounts":
+        """Devuelve una copia independiente, para entregarla a la UI.
+
+        Returns:
+            TaskCounts: Copia con los mismos totales.
+        """
+        snapshot = TaskCounts()
+        snapshot._counts = self._counts.copy()
+        snapshot.loaded = self.loaded
+        return snapshot
+
+
+    # .. ....................................................... Escritura ..󰌠
+    def add(self, task: TaskSummary) -> None:
+        """Suma una tarea nueva a los totales.
+
+        Args:
+            task (TaskSummary): Tarea creada.
+        """
+        self._counts[(task.status, task.tag, task.priority)] += 1
+
+
+    def apply(
+            self,
+            before: Mapping[CountKey, int],
+            after: Mapping[CountKey, int]
+    ) -> None:
+        """Aplica el cambio de un grupo de tareas.
+
+        `before` y `after` son los totales de las tareas afectadas antes y
+        después del cambio (`RepositoryDB.task_counts(task_ids=...)`); una
+        tarea eliminada no aparece en `after`.
+
+        Args:
+            before (Mapping[CountKey, int]): Totales antes del cambio.
+            after (Mapping[CountKey, int]): Totales después del cambio.
+        """
+        self._counts.subtract(before)
+        self._counts.update(after)
+        # Quita las combinaciones que quedaron sin tareas.
+        self._counts = +self._counts
+
+
+    # .. ........................................................ Lectura ..󰌠
+    def total(self) -> int:
+        """Devuelve el número total de tareas."""
+        return self._counts.total()
+
+
+    def by_field(self, field: str) -> dict[str, int]:
+        """Agrupa los totales por un solo campo.
+
+        Args:
+            field (str): `"status"`, `"tag"` o `"priority"`.
+
+        Raises:
+            ValueError: Si `field` no es uno de los campos contados.
+
+        Returns:
+            dict[str, int]: Número de tareas por cada valor del campo.
+        """
+        if field not in KEY_FIELDS:
+            raise ValueError(f"Campo no válido: {field!r}")
+        position = KEY_FIELDS.index(field)
+        totals: Counter[str] = Counter()
+        for key, count in self._counts.items():
+            totals[key[position]] += count
+        return dict(totals)
+
+
+    def as_dict(self) -> dict[CountKey, int]:
+        """Devuelve los totales por combinación `(status, tag, priority)`.
+
+        Returns:
+            dict[CountKey, int]: Copia de los totales; las combinaciones sin
+                tareas no aparecen.
+        """
+        return dict(self._counts)
@@ -7,11 +7,15 @@ Esta capa actúa como un intermediario entre la interfaz de usuario (controllers
 y la capa de acceso a datos (repositories). Orquesta las operaciones y
 asegura que la lógica de la aplicación esté centralizada.
 """
-from typing import Any
+from pathlib import Path
+from typing import Any, Iterable, Iterator
 from repositories.repository_db import RepositoryDB
-from models.model_task import Task
-from config.config_loader import UI_ICONS
-from repositories.database import DATABASE_PATH
+from models.model_task import Task, TaskSummary
+from config import config_loader
+from repositories import database
+from repositories.task_filter import FilterValue, TaskFilter
+from services.task_cache import TaskCache
+from services.task_counts import CountKey, TaskCounts
 
 
 class TaskService:
@@ -20,64 +24,414 @@ class TaskService:
     Esta clase desacopla la interfaz de usuario de los detalles de la base de
     datos. Recibe solicitudes de la UI, aplica la lógica de negocio y
     coordina las operaciones con la capa de repositorio.
+
+    Opcionalmente mantiene una caché en memoria (`TaskCache`) desde la que
+    sirve las lecturas. Cada cambio hecho a través del servicio se escribe
+    también en la caché (write-through); si otro proceso modifica la base de
+    datos (detectado con `PRAGMA data_version`), la caché se descarta y se
+    vuelve a cargar en la siguiente lectura.
+
+    Mantiene también los totales por status, tag y prioridad (`TaskCounts`):
+    se cuentan una vez con un `GROUP BY` y cada cambio les aplica sólo la
+    diferencia de las tareas afectadas.
     """
 
-    def __init__(self):
+    def __init__(
+            self,
+            db_path: Path | None = None,
+            use_cache: bool | None = None
+    ):
         """Inicializa el servicio de tareas.
 
         Crea una instancia del `RepositoryDB` para interactuar con la base de
-        datos. El nombre de la base de datos está definido aquí para
-        configurar el repositorio que usará este servicio.
+        datos. La instancia está pensada para vivir tanto como la aplicación:
+        se prepara una vez con `open()` y se libera con `close()`.
+
+        Args:
+            db_path (Path | None, optional): Ruta de la base de datos. Por
+                defecto, la base de datos de producción.
+            use_cache (bool | None, optional): Si se usa la caché en memoria.
+                Por defecto, el valor `[cache] enabled` de `settings.toml`.
         """
-        self.repository = RepositoryDB(DATABASE_PATH)
+        if db_path is None:
+            db_path = database.DATABASE_PATH
+        self.repository = RepositoryDB(db_path)
+        self._is_open = False
+        if use_cache is None:
+            use_cache = config_loader.CACHE_ENABLED
+        self.cache: TaskCache | None = TaskCache() if use_cache else None
+        # Última versión de la base de datos que la caché refleja.
+        self._data_version: int | None = None
+        self.counts = TaskCounts()
+        # Última versión de la base de datos que los totales reflejan.
+        self._counts_version: int | None = None
+
+
+    def open(self) -> None:
+        """Prepara la base de datos para su uso.
+
+        Crea la tabla y aplica las migraciones pendientes una única vez; las
+        llamadas siguientes no hacen nada.
+        """
+        if self._is_open:
+            return
         self.repository.create_table()
+        self._is_open = True
+
+
+    def close(self) -> None:
+        """Libera las conexiones a la base de datos.
+
+        Después de cerrar, el servicio no debe volver a usarse.
+        """
+        self.repository.close()
+        self._is_open = False
+        if self.cache is not None:
+            self.cache.clear()
+        self.counts.clear()
 
 
-    def get_all_tasks(self) -> list[Task]:
-        """Recupera todas las tareas como objetos `Task` puros.
+    def __enter__(self) -> "TaskService":
+        """Abre el servicio al entrar en un bloque `with`."""
+        self.open()
+        return self
+
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Cierra el servicio al salir de un bloque `with`."""
+        self.close()
+
+
+    def _cached(self) -> TaskCache | None:
+        """Devuelve la caché lista para responder lecturas.
+
+        Si la base de datos cambió desde la última sincronización (otro
+        proceso escribió en ella), la caché se descarta. Si no está cargada,
+        se carga completa recorriendo las tareas por páginas.
+
+        Returns:
+            TaskCache | None: La caché, o `None` si el servicio no usa caché.
+        """
+        if self.cache is None:
+            return None
+        version = self.repository.data_version()
+        if version is None or version != self._data_version:
+            self.cache.clear()
+        if not self.cache.loaded:
+            # La versión se lee antes de cargar: un cambio externo durante la
+            # carga se detectará en la siguiente lectura.
+            self._data_version = version
+            self.cache.load(self.repository.iter_tasks())
+        return self.cache
+
+
+    def _sync_version(self) -> None:
+        """Registra como conocida la versión actual de la base de datos.
+
+        Se llama tras cada escritura propia, ya reflejada en la caché, para
+        que no se confunda con un cambio externo.
+        """
+        if self.cache is not None and self.cache.loaded:
+            self._data_version = self.repository.data_version()
+
+
+    def _refresh_cached_task(self, task_id: int) -> None:
+        """Vuelve a leer una tarea de la base de datos y la guarda en caché.
+
+        Args:
+            task_id (int): ID de la tarea modificada.
+        """
+        if self.cache is None or not self.cache.loaded:
+            return
+        found = self.repository.get_tasks_by_ids([task_id]) or []
+        if found:
+            self.cache.put(found[0])
+        else:
+            self.cache.remove(task_id)
+        self._sync_version()
+
+
+    def _refresh_cached_tasks(self, task_ids: Iterable[int]) -> None:
+        """Vuelve a leer varias tareas y las guarda en caché.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas modificadas.
+        """
+        if self.cache is None or not self.cache.loaded:
+            return
+        task_ids = list(task_ids)
+        found = self.repository.get_tasks_by_ids(task_ids) or []
+        found_ids = set()
+        for task in found:
+            self.cache.put(task)
+            found_ids.add(task.id)
+        for task_id in task_ids:
+            if task_id not in found_ids:
+                self.cache.remove(task_id)
+        self._sync_version()
+
+
+    def _counts_current(self) -> bool:
+        """Indica si los totales reflejan la base de datos actual.
+
+        Si otro proceso la modificó desde la última sincronización, los
+        totales se descartan y se volverán a contar en la siguiente lectura.
+
+        Returns:
+            bool: `True` si los totales están cargados y al día.
+        """
+        if not self.counts.loaded:
+            return False
+        version = self.repository.data_version()
+        if version is None or version != self._counts_version:
+            self.counts.clear()
+            return False
+        return True
+
+
+    def _counts_before(
+            self,
+            task_ids: list[int]
+    ) -> dict[CountKey, int] | None:
+        """Cuenta, antes de un cambio, las tareas que éste va a modificar.
+
+        Args:
+            task_ids (list[int]): IDs de las tareas afectadas.
+
+        Returns:
+            dict[CountKey, int] | None: Totales de esas tareas, o `None` si
+                los totales no están al día y no hace falta mantenerlos.
+        """
+        if not self._counts_current():
+            return None
+        before = self.repository.task_counts(task_ids=task_ids)
+        if before is None:
+            self.counts.clear()
+        return before
+
+
+    def _update_counts(
+            self,
+            task_ids: list[int],
+            before: dict[CountKey, int] | None
+    ) -> None:
+        """Aplica a los totales la diferencia producida por un cambio.
+
+        Args:
+            task_ids (list[int]): IDs de las tareas afectadas.
+            before (dict[CountKey, int] | None): Resultado de
+                `_counts_before` para esas mismas tareas.
+        """
+        if before is None:
+            return
+        after = self.repository.task_counts(task_ids=task_ids)
+        if after is None:
+            self.counts.clear()
+            return
+        self.counts.apply(before, after)
+        self._counts_version = self.repository.data_version()
+
+
+    def get_all_tasks(self) -> list[TaskSummary]:
+        """Recupera todas las tareas como objetos `TaskSummary` puros.
 
         Este método se comunica con el repositorio para obtener una lista
         completa de las tareas, devolviéndolas como objetos de modelo sin
         formato.
 
         Returns:
-            list[Task]: Lista de objetos `Task`.
+            list[TaskSummary]: Lista de tareas, sin el texto de los detalles.
         """
+        cache = self._cached()
+        if cache is not None:
+            return cache.filter()
         return self.repository.get_all_tasks()
 
 
+    def iter_tasks(self, page_size: int = 500) -> Iterator[TaskSummary]:
+        """Recorre todas las tareas sin cargarlas todas en memoria.
+
+        Delegado en `RepositoryDB.iter_tasks`, que pide las tareas por
+        páginas ordenadas por ID.
+
+        Args:
+            page_size (int, optional): Número de tareas por consulta.
+
+        Yields:
+            TaskSummary: Cada tarea, en orden ascendente de ID.
+        """
+        return self.repository.iter_tasks(page_size=page_size)
+
+
+    def get_tasks_page_service(
+            self,
+            after_id: int = 0,
+            limit: int = 500,
+            status: FilterValue = None,
+            tag: FilterValue = None,
+            priority: FilterValue = None,
+            before_id: int | None = None,
+            text: str | None = None
+    ) -> list[TaskSummary]:
+        """Devuelve una página de tareas ordenadas por ID.
+
+        Ver `RepositoryDB.get_tasks_page`. Es la fuente de datos de la tabla
+        virtualizada de la UI, que sólo pide las filas cercanas a la vista.
+        Sin texto se responde desde la caché si está activa; con texto, con
+        el índice FTS de la base de datos.
+
+        Args:
+            after_id (int, optional): Último ID ya recibido.
+            limit (int, optional): Tamaño máximo de la página.
+            status (FilterValue, optional): Estado(s) por el cual filtrar.
+            tag (FilterValue, optional): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue, optional): Prioridad(es) por la cual
+                filtrar.
+            before_id (int | None, optional): Primer ID ya recibido, para
+                pedir la página anterior.
+            text (str | None, optional): Palabras con las que debe empezar
+                alguna palabra del contenido.
+
+        Returns:
+            list[TaskSummary]: Tareas de la página en orden ascendente de ID.
+        """
+        cache = None if text and text.strip() else self._cached()
+        if cache is not None:
+            return cache.page(
+                after_id=after_id,
+                limit=limit,
+                status=status,
+                tag=tag,
+                priority=priority,
+                before_id=before_id
+            )
+        return self.repository.get_tasks_page(
+            after_id=after_id,
+            limit=limit,
+            status=status,
+            tag=tag,
+            priority=priority,
+            before_id=before_id,
+            text=text
+        ) or []
+
+
+    def count_tasks_service(
+            self,
+            status: FilterValue = None,
+            tag: FilterValue = None,
+            priority: FilterValue = None,
+            text: str | None = None
+    ) -> int:
+        """Cuenta las tareas que cumplen los filtros.
+
+        Args:
+            status (FilterValue, optional): Estado(s) por el cual filtrar.
+            tag (FilterValue, optional): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue, optional): Prioridad(es) por la cual
+                filtrar.
+            text (str | None, optional): Palabras con las que debe empezar
+                alguna palabra del contenido.
+
+        Returns:
+            int: Número de tareas que coinciden.
+        """
+        cache = None if text and text.strip() else self._cached()
+        if cache is not None:
+            return cache.count(status=status, tag=tag, priority=priority)
+        return self.repository.count_tasks(
+            status=status, tag=tag, priority=priority, text=text
+        ) or 0
+
+
+    def task_counts_service(self) -> TaskCounts:
+        """Devuelve el número de tareas por status, tag y prioridad.
+
+        La primera llamada (o la siguiente a un cambio hecho por otro
+        proceso) cuenta la tabla con una sola consulta `GROUP BY`; las demás
+        responden con los totales en memoria, que cada cambio hecho con el
+        servicio mantiene al día. Nunca se leen las tareas.
+
+        Returns:
+            TaskCounts: Copia de los totales, independiente de los cambios
+                posteriores.
+        """
+        if not self._counts_current():
+            # La versión se lee antes de contar: un cambio externo durante
+            # la consulta se detectará en la siguiente lectura.
+            version = self.repository.data_version()
+            counts = self.repository.task_counts()
+            if counts is not None:
+                self.counts.load(counts)
+                self._counts_version = version
+        return self.counts.copy()
+
+
+    def iter_tasks_for_ui(self, page_size: int = 500) -> Iterator[tuple]:
+        """Recorre las tareas ya formateadas como filas del `DataTable`.
+
+        Versión en streaming de `get_tasks_for_ui`: no incluye la fila de
+        cabeceras y produce las filas a medida que llegan las páginas.
+
+        Args:
+            page_size (int, optional): Número de tareas por consulta.
+
+        Yields:
+            tuple[Any, ...]: Fila (id, status, tag, contenido, prioridad,
+                indicador de notas).
+        """
+        for task in self.iter_tasks(page_size=page_size):
+            yield self._task_to_ui_row(task)
+
+
+    @staticmethod
+    def _task_to_ui_row(task: TaskSummary) -> tuple[Any, ...]:
+        """Convierte una tarea en una fila para el `DataTable`.
+
+        Args:
+            task (TaskSummary): Tarea a convertir.
+
+        Returns:
+            tuple[Any, ...]: Fila (id, status, tag, contenido, prioridad,
+                indicador de notas).
+        """
+        details_indicator = (
+            config_loader.UI_ICONS['nota'] if task.has_details else ""
+        )
+        return (
+            task.id,
+            task.status,
+            task.tag,
+            task.content,
+            task.priority,
+            details_indicator
+        )
+
+
     def get_tasks_for_ui(self) -> list[tuple]:
         """Prepara y formatea los datos de las tareas para ser mostrados
         correctamente en la UI.
 
         A diferencia de `get_all_tasks`, este método transforma la lista de
-        objetos `Task` en un formato específico para el `DataTable` de Textual,
+        tareas en un formato específico para el `DataTable` de Textual,
         incluyendo cabeceras y un indicador visual para las notas extras.
+        Para tablas grandes es preferible `iter_tasks_for_ui`.
 
         Returns:
             list[tuple[Any, ...]: Lista de tuplas donde el primer elemento es
                 la fila de cabeceras y los siguientes son las filas de tareas.
         """
         headers = ("ID", "Status", "Tag", "Contenido", "Prioridad", "Notas")
-        task_objects = self.get_all_tasks()
         formatted_tasks: list[tuple[Any, ...]] = [headers]
-        for task in task_objects:
-            details_indicator = UI_ICONS['nota'] if task.details else ""
-            formatted_tasks.append(
-                (
-                    task.id,
-                    task.status,
-                    task.tag,
-                    task.content,
-                    task.priority,
-                    details_indicator
-                )
-            )
+        formatted_tasks.extend(self.iter_tasks_for_ui())
         return formatted_tasks
 
 
     def get_task_by_id_service(self, task_id: int) -> Task | None:
-        """Busca y devuelve una única tarea por su ID.
+        """Busca y devuelve una única tarea por su ID, con sus detalles.
+
+        Es la única lectura que trae el texto de los detalles, por lo que
+        siempre consulta la base de datos (la caché guarda resúmenes).
 
         Args:
             task_id (int): ID de la tarea a buscar.
@@ -88,7 +442,27 @@ class TaskService:
         return self.repository.get_task_by_id(task_id)
 
 
-    def new_task_service(self, task_instance: Task) -> None:
+    def get_tasks_by_ids_service(
+            self,
+            task_ids: Iterable[int]
+    ) -> list[TaskSummary]:
+        """Busca y devuelve varias tareas por sus IDs.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas a buscar.
+
+        Returns:
+            list[TaskSummary]: Tareas encontradas, en orden ascendente de
+                ID. Los IDs que no existen se omiten.
+        """
+        cache = self._cached()
+        if cache is not None:
+            found = [cache.get(task_id) for task_id in sorted(set(task_ids))]
+            return [task for task in found if task is not None]
+        return self.repository.get_tasks_by_ids(task_ids) or []
+
+
+    def new_task_service(self, task_instance: Task) -> int | None:
         """Procesa la creación de una nueva tarea.
 
         Recibe un objeto `Task` desde la capa de control y lo pasa al
@@ -96,8 +470,47 @@ class TaskService:
 
         Args:
             task_instance (Task): Objeto `Task` (sin ID) a crear.
+
+        Returns:
+            int | None: ID asignado a la tarea, o `None` si falló la
+                inserción.
+        """
+        counts_current = self._counts_current()
+        new_id = self.repository.new_task(task_instance)
+        if new_id is None:
+            return None
+        summary = TaskSummary.from_task(
+            task_instance.model_copy(update={"id": new_id})
+        )
+        if self.cache is not None and self.cache.loaded:
+            self.cache.put(summary)
+            self._sync_version()
+        if counts_current:
+            self.counts.add(summary)
+            self._counts_version = self.repository.data_version()
+        return new_id
+
+
+    def new_tasks_many_service(self, tasks: Iterable[Task]) -> list[int]:
+        """Procesa la creación masiva de tareas (ej. una importación).
+
+        Las tareas se insertan en bloques transaccionales mediante
+        `RepositoryDB.new_tasks_many`, mucho más rápido que llamar a
+        `new_task_service` por cada una.
+
+        Args:
+            tasks (Iterable[Task]): Objetos `Task` (sin ID) a crear.
+
+        Returns:
+            list[int]: IDs asignados a las tareas, en el mismo orden.
         """
-        self.repository.new_task(task_instance)
+        new_ids = self.repository.new_tasks_many(tasks) or []
+        # Tras una importación masiva es más barato recargar la caché en la
+        # siguiente lectura que conservar aquí todas las tareas importadas.
+        if self.cache is not None:
+            self.cache.clear()
+        self.counts.clear()
+        return new_ids
 
 
     def check_or_uncheck_task_service(self, task_id: int) -> None:
@@ -109,7 +522,10 @@ class TaskService:
         Args:
             task_id (int): ID de la tarea a modificar.
         """
+        before = self._counts_before([task_id])
         self.repository.check_or_uncheck_task(task_id)
+        self._refresh_cached_task(task_id)
+        self._update_counts([task_id], before)
 
 
     def update_task_service(
@@ -127,34 +543,63 @@ class TaskService:
             new_data (dict[str, str]): Diccionario con los campos a
                 modificar y sus nuevos valores.
         """
+        before = self._counts_before([task_id])
         self.repository.update_task(task_id, new_data)
+        self._refresh_cached_task(task_id)
+        self._update_counts([task_id], before)
 
 
     def filter_tasks_service(
         self,
-        status: str | None = None,
-        tag: str | None = None,
-        priority: str | None = None,
-    ) -> list[Task]:
+        status: FilterValue = None,
+        tag: FilterValue = None,
+        priority: FilterValue = None,
+        task_filter: TaskFilter | None = None
+    ) -> list[TaskSummary]:
         """Filtra las tareas según los criterios proporcionados.
 
-        Pasa los criterios de filtro directamente al repositorio para que
-        ejecute la consulta de búsqueda correspondiente.
+        Los filtros ordenados por ID (con o sin exclusiones y límite) se
+        resuelven con el índice de bits de la caché si está activa; los que
+        piden otro orden se resuelven con una única consulta del repositorio
+        (ver `RepositoryDB.filter_tasks`).
 
         Args:
-            status (str | None, optional): Estado por el cual filtrar.
-            tag (str | None, optional): Etiqueta por la cual filtrar.
-            priority (str | None, optional): Prioridad por la cual filtrar.
+            status (FilterValue, optional): Estado(s) por el cual filtrar.
+            tag (FilterValue, optional): Etiqueta(s) por la cual filtrar.
+            priority (FilterValue, optional): Prioridad(es) por la cual
+                filtrar.
+            task_filter (TaskFilter | None, optional): Filtro compuesto; si
+                se indica, reemplaza a los demás criterios.
 
         Returns:
-            list[Task]: Lista de objetos `Task` que coinciden con los
+            list[TaskSummary]: Lista de tareas que coinciden con los
                 criterios de filtrado.
         """
-        return self.repository.filter_tasks(
-            status=status,
-            tag=tag,
-            priority=priority
-        )
+        if task_filter is None:
+            task_filter = TaskFilter(status=status, tag=tag, priority=priority)
+
+        if task_filter.sorted_by_id():
+            cache = self._cached()
+            if cache is not None:
+                return cache.filter(task_filter=task_filter)
+        return self.repository.filter_tasks(task_filter=task_filter) or []
+
+
+    def search_tasks_service(
+            self,
+            query: str,
+            limit: int = 50
+    ) -> list[TaskSummary]:
+        """Busca tareas por texto en su contenido y detalles.
+
+        Args:
+            query (str): Texto a buscar, ej. `"reunión equipo"`.
+            limit (int, optional): Número máximo de resultados.
+
+        Returns:
+            list[TaskSummary]: Tareas encontradas, ordenadas por relevancia.
+        """
+        return self.repository.search_tasks(query, limit=limit) or []
 
 
     def delete_task_service(self, task_id: int) -> None:
@@ -163,4 +608,69 @@ class TaskService:
         Args:
             task_id (int): ID de la tarea a eliminar.
         """
+        before = self._counts_before([task_id])
         self.repository.delete_task(task_id)
+        if self.cache is not None and self.cache.loaded:
+            self.cache.remove(task_id)
+            self._sync_version()
+        self._update_counts([task_id], before)
+
+
+    def check_or_uncheck_tasks_service(self, task_ids: Iterable[int]) -> int:
+        """Cambia el estado cíclico de varias tareas en una transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas a modificar.
+
+        Returns:
+            int: Número de tareas modificadas.
+        """
+        task_ids = list(task_ids)
+        before = self._counts_before(task_ids)
+        updated = self.repository.check_or_uncheck_tasks(task_ids) or 0
+        self._refresh_cached_tasks(task_ids)
+        self._update_counts(task_ids, before)
+        return updated
+
+
+    def update_tasks_service(
+            self,
+            task_ids: Iterable[int],
+            new_data: dict[str, str]
+    ) -> int:
+        """Asigna los mismos valores a varias tareas en una transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas a actualizar.
+            new_data (dict[str, str]): Campos a modificar y sus nuevos
+                valores, ej. `{"tag": "trabajo"}`.
+
+        Returns:
+            int: Número de tareas actualizadas.
+        """
+        task_ids = list(task_ids)
+        before = self._counts_before(task_ids)
+        updated = self.repository.update_tasks(task_ids, new_data) or 0
+        self._refresh_cached_tasks(task_ids)
+        self._update_counts(task_ids, before)
+        return updated
+
+
+    def delete_tasks_service(self, task_ids: Iterable[int]) -> int:
+        """Elimina varias tareas en una transacción.
+
+        Args:
+            task_ids (Iterable[int]): IDs de las tareas a eliminar.
+
+        Returns:
+            int: Número de tareas eliminadas.
+        """
+        task_ids = list(task_ids)
+        before = self._counts_before(task_ids)
+        deleted = self.repository.delete_tasks(task_ids) or 0
+        if self.cache is not None and self.cache.loaded:
+            for task_id in task_ids:
+                self.cache.remove(task_id)
+            self._sync_version()
+        self._update_counts(task_ids, before)
+        return deleted
@@ -0,0 +1,146 @@
+# MODULO: tests/
+# .. .............................. test_cli ............................... ..󰌠
+"""
+Pruebas unitarias para los subcomandos de controllers/cli.py.
+"""
+import io
+import json
+import pytest
+from typing import Iterator
+from controllers import cli
+from repositories import database
+from repositories.database import TEST_DATABASE_PATH
+
+
+@pytest.fixture(autouse=True)
+def test_database(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Pytest fixture que dirige los subcomandos a la base de datos de
+    prueba, vacía al empezar y eliminada al terminar.
+
+    Yields:
+        Iterator[None]: Nada; sólo prepara y limpia la base de datos.
+    """
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+    monkeypatch.setattr(database, "DATABASE_PATH", TEST_DATABASE_PATH)
+    yield
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+
+
+def run(*argv: str) -> tuple[int, str]:
+    """Ejecuta un subcomando y devuelve su código de salida y su salida.
+
+    Args:
+        *argv (str): Argumentos del subcomando, ej. `"list", "--json"`.
+
+    Returns:
+        tuple[int, str]: Código de salida y texto escrito.
+    """
+    out = io.StringIO()
+    code = cli.run(list(argv), out)
+    return code, out.getvalue()
+
+
+# TEST: 01
+def test_add_and_list() -> None:
+    """Comprueba que `add` escribe el ID de la tarea creada y que `list`
+    la muestra en texto (columnas separadas por tabuladores) y en JSON,
+    respetando `--limit`.
+    """
+    assert run("add", "Comprar pan") == (0, "1\n")
+    code, output = run(
+        "add", "Reunión de equipo", "--tag", "trabajo",
+        "--priority", "alta", "--json"
+    )
+    assert code == 0 and json.loads(output) == {"id": 2}
+
+    assert run("list") == (0, (
+        "1\tpending\tpersonal\tbaja\tComprar pan\n"
+        "2\tpending\ttrabajo\talta\tReunión de equipo\n"
+    ))
+    code, output = run("list", "--limit", "1", "--json")
+    assert code == 0
+    assert [task["content"] for task in json.loads(output)] == [
+        "Comprar pan"
+    ]
+
+
+# TEST: 02
+def test_done_and_rm() -> None:
+    """Comprueba que `done` y `rm` aceptan IDs y rangos, escriben cuántas
+    tareas afectaron y devuelven 1 si no afectaron a ninguna.
+    """
+    for index in range(4):
+        run("add", f"Tarea {index}")
+
+    assert run("done", "1,3-4") == (0, "3\n")
+    code, output = run("filter", "--status", "completed", "--json")
+    assert [task["id"] for task in json.loads(output)] == [1, 3, 4]
+
+    code, output = run("rm", "2-3", "--json")
+    assert code == 0 and json.loads(output) == {"deleted": 2}
+    assert run("rm", "99") == (1, "0\n")
+    assert run("done", "2") == (1, "0\n")
+    assert run("list")[1].count("\n") == 2
+
+
+# TEST: 03
+def test_filter() -> None:
+    """Comprueba que `filter` combina campos repetidos (OR), campos
+    distintos (AND) y prefijos de palabras del contenido.
+    """
+    run("add", "Reunión de equipo", "--tag", "trabajo")
+    run("add", "Revisar informe", "--tag", "proyecto", "--priority", "alta")
+    run("add", "Reunión familiar")
+
+    def ids(*argv: str) -> list[int]:
+        code, output = run("filter", *argv, "--json")
+        assert code == 0
+        return [task["id"] for task in json.loads(output)]
+
+    assert ids("--tag", "trabajo", "--tag", "proyecto") == [1, 2]
+    assert ids("--tag", "personal", "reun") == [3]
+    assert ids("reun") == [1, 3]
+    assert ids("--priority", "alta", "reun") == []
+    assert run("filter", "--priority", "media") == (0, "")
+
+
+# TEST: 04
+def test_invalid_arguments(capsys: pytest.CaptureFixture[str]) -> None:
+    """Comprueba que un ID, una etiqueta o un límite no válidos terminan
+    con un error de uso (código 2) sin tocar la base de datos.
+    """
+    invalid = (
+        ("done", "3-x"),
+        ("add", "Tarea", "--tag", "Trabajo"),
+        ("filter", "--tag", "ocio"),
+        ("list", "--limit", "0"),
+    )
+    for argv in invalid:
+        with pytest.raises(SystemExit) as exit_info:
+            run(*argv)
+        assert exit_info.value.code == 2
+
+    assert "'3-x' no es un ID ni un rango válido" in capsys.readouterr().err
+    assert not TEST_DATABASE_PATH.exists()
+
+
+# TEST: 05
+def test_invalid_field_values(capsys: pytest.CaptureFixture[str]) -> None:
+    """Comprueba que un tag, prioridad o status fuera del modelo (también
+    con otra capitalización) se rechaza como error de uso, con los valores
+    válidos en el mensaje, sin traza de error y sin crear tareas.
+    """
+    run("add", "Tarea válida")
+    for argv in (
+        ("add", "Otra", "--tag", "Trabajo"),
+        ("add", "Otra", "--priority", "urgente"),
+        ("filter", "--status", "hecha"),
+    ):
+        with pytest.raises(SystemExit) as exit_info:
+            run(*argv)
+        assert exit_info.value.code == 2
+
+    error = capsys.readouterr().err
+    assert "invalid choice: 'Trabajo'" in error
+    assert "Traceback" not in error
+    assert run("list") == (0, "1\tpending\tpersonal\tbaja\tTarea válida\n")
@@ -0,0 +1,62 @@
+# MODULO: tests/
+# .. ........................... test_decorators ........................... ..󰌠
+"""
+Pruebas unitarias para la lectura de listas de IDs de
+controllers/decorators.py.
+"""
+import pytest
+from controllers.decorators import MAX_IDS, parse_id_list
+
+
+# TEST: 01
+def test_ids_and_ranges() -> None:
+    """Comprueba que se aceptan IDs y rangos inclusivos separados por
+    comas o espacios, con espacios alrededor del guion, y que un rango al
+    revés se recorre igual.
+    """
+    assert parse_id_list("1,3-5") == [1, 3, 4, 5]
+    assert parse_id_list(" 7  2,\t9 ") == [7, 2, 9]
+    assert parse_id_list("3 - 5, 10") == [3, 4, 5, 10]
+    assert parse_id_list("5-3") == [3, 4, 5]
+    assert parse_id_list("4-4") == [4]
+    assert parse_id_list(" , ") == []
+
+
+# TEST: 02
+def test_duplicates_keep_first_position() -> None:
+    """Comprueba que los IDs repetidos (sueltos o dentro de rangos que se
+    solapan) aparecen una sola vez, en la posición en que se escribieron
+    primero.
+    """
+    assert parse_id_list("5,1-3,2,5") == [5, 1, 2, 3]
+    assert parse_id_list("1-4,3-6") == [1, 2, 3, 4, 5, 6]
+
+
+# TEST: 03
+def test_invalid_items() -> None:
+    """Comprueba que un elemento que no es un ID ni un rango lanza
+    `ValueError` con el elemento en el mensaje.
+    """
+    for text, item in (
+        ("1,a", "'a'"),
+        ("3-x", "'3-x'"),
+        ("1-2-3", "'1-2-3'"),
+        ("-3", "'-3'"),
+        ("2.5", "'2.5'"),
+    ):
+        with pytest.raises(ValueError, match=item):
+            parse_id_list(text)
+
+
+# TEST: 04
+def test_max_ids() -> None:
+    """Comprueba que se aceptan hasta `MAX_IDS` IDs y que un rango (o una
+    suma de elementos) mayor lanza `ValueError` sin generar la lista.
+    """
+    assert len(parse_id_list(f"1-{MAX_IDS}")) == MAX_IDS
+    with pytest.raises(ValueError, match=str(MAX_IDS)):
+        parse_id_list(f"1-{MAX_IDS + 1}")
+    with pytest.raises(ValueError, match=str(MAX_IDS)):
+        parse_id_list(f"1-{MAX_IDS - 1},{MAX_IDS + 5},{MAX_IDS + 6}")
+    with pytest.raises(ValueError, match=str(MAX_IDS)):
+        parse_id_list("1-1000000000000")
@@ -0,0 +1,59 @@
+# MODULO: tests/
+# .. ........................... test_filter_bar ........................... ..󰌠
+"""
+Pruebas unitarias para la interpretación del texto de la barra de filtro en
+controllers/filter_bar.py.
+"""
+from controllers.filter_bar import parse_filter_text
+
+
+# TEST: 01
+def test_field_values() -> None:
+    """Comprueba que `clave:valor` filtra por campo, con claves en
+    español o inglés, valores a medias y varios valores separados por
+    comas, y que repetir un campo suma sus valores.
+    """
+    assert parse_filter_text("status:pen") == {
+        "status": ("pending",), "tag": None, "priority": None, "text": None
+    }
+    filters = parse_filter_text("Estado:in,comp tag:TRA prioridad:a")
+    assert filters["status"] == ("in_progress", "completed")
+    assert filters["tag"] == ("trabajo",)
+    assert filters["priority"] == ("alta",)
+    assert filters["text"] is None
+
+    # Un prefijo compartido incluye todos los valores que empiezan así.
+    assert parse_filter_text("tag:p")["tag"] == ("personal", "proyecto")
+    assert parse_filter_text("tag:tra tag:cal")["tag"] == (
+        "trabajo", "calendario"
+    )
+
+
+# TEST: 02
+def test_free_text() -> None:
+    """Comprueba que las palabras sin clave pasan al filtro de contenido,
+    en su orden y junto con los filtros por campo.
+    """
+    assert parse_filter_text("") == {
+        "status": None, "tag": None, "priority": None, "text": None
+    }
+    filters = parse_filter_text("  reuni  status:pen  equi ")
+    assert filters["status"] == ("pending",)
+    assert filters["text"] == "reuni equi"
+
+
+# TEST: 03
+def test_unknown_keys_and_values() -> None:
+    """Comprueba los casos que no son un filtro por campo válido: una clave
+    desconocida (o precedida de `-`, que no es sintaxis de negación) se
+    busca como texto, una clave sin valor se ignora y un valor sin
+    coincidencias se conserva para que el filtro no devuelva tareas.
+    """
+    filters = parse_filter_text("color:rojo -status:pen http://x")
+    assert filters["status"] is None
+    assert filters["text"] == "color:rojo -status:pen http://x"
+
+    assert parse_filter_text("tag: status:,") == {
+        "status": None, "tag": None, "priority": None, "text": None
+    }
+    assert parse_filter_text("tag:ocio,tra")["tag"] == ("ocio", "trabajo")
@@ -0,0 +1,65 @@
+# MODULO: tests/
+# .. ........................... test_interface ............................ ..󰌠
+"""
+Pruebas de la interfaz de controllers/interface.py, manejada sin terminal
+con el `Pilot` de Textual.
+"""
+import asyncio
+import pytest
+from typing import Iterator
+from textual.widgets import Markdown
+from controllers.detail_screens import ViewDetailsScreen
+from controllers.interface import Interface
+from models.model_task import Task
+from repositories.database import TEST_DATABASE_PATH
+from services.task_service import TaskService
+
+
+@pytest.fixture
+def task_ids() -> Iterator[list[int]]:
+    """Pytest fixture que crea en la base de datos de prueba una tarea sin
+    detalles y otra con detalles, y la elimina al terminar.
+
+    Yields:
+        Iterator[list[int]]: IDs de las tareas, en ese orden.
+    """
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+    with TaskService(db_path=TEST_DATABASE_PATH, use_cache=False) as service:
+        ids = service.new_tasks_many_service([
+            Task(content="Sin notas"),
+            Task(content="Con notas", details="# Lista\n- pan"),
+        ])
+    yield ids
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+
+
+async def _details_text(task_id: int) -> str:
+    """Abre los detalles de una tarea con 'v' y devuelve el Markdown
+    mostrado.
+
+    Args:
+        task_id (int): ID escrito en `AskIdScreen`.
+
+    Returns:
+        str: Texto de la pantalla de detalles.
+    """
+    app = Interface(TaskService(db_path=TEST_DATABASE_PATH))
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await pilot.press("v", *str(task_id), "enter")
+        await pilot.pause()
+        screen = app.screen
+        assert isinstance(screen, ViewDetailsScreen)
+        return screen.query_one(Markdown).source
+
+
+# TEST: 01
+def test_view_details(task_ids: list[int]) -> None:
+    """Comprueba que 'v' abre la pantalla de detalles también para una
+    tarea sin detalles, con el aviso en lugar del Markdown.
+    """
+    without_details, with_details = task_ids
+
+    text = asyncio.run(_details_text(without_details))
+    assert text == "*No hay detalles para esta tarea.*"
+    assert asyncio.run(_details_text(with_details)) == "# Lista\n- pan"
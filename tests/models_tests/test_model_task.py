@@ -2,11 +2,15 @@
 # .. .......................... model_task_tests .......................... ..󰌠
 """
 Tests unitarios para la clase Task.
-total de pruebas: 10.
+total de pruebas: 13.
 """
 import pytest
-from pydantic import ValidationError
-from models.model_task import Status, Tag, Priority, Task
+from pydantic import BaseModel, ValidationError
+from typing import Any, get_args
+from models.model_task import (
+    FIELD_CODES, FIELD_VALUES, Status, Tag, Priority, Task, TaskSummary,
+    construct_trusted
+)
 
 
 # TEST: 01
@@ -210,3 +214,75 @@ def test_task_creation_with_and_without_details() -> None:
     assert task_no_details.status == "pending"
     assert task_no_details.content == content_no_details
     assert task_no_details.details is None
+
+
+# TEST: 11
+def test_construct_trusted_matches_validated() -> None:
+    """Comprueba que una instancia creada sin validar con construct_trusted
+    es igual a la validada y se comporta igual (copias y volcado).
+    """
+    values = {
+        "id": 7,
+        "status": "completed",
+        "tag": "trabajo",
+        "content": "Tarea leída de la BD",
+        "priority": "media",
+        "has_details": True,
+    }
+
+    trusted = construct_trusted(TaskSummary, dict(values))
+    validated = TaskSummary.model_validate(values)
+
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.model_dump_json() == validated.model_dump_json()
+    assert str(trusted) == str(validated)
+    assert trusted.model_fields_set == validated.model_fields_set
+    copied = trusted.model_copy(update={"tag": "personal"})
+    assert copied.tag == "personal" and trusted.tag == "trabajo"
+    assert trusted.model_copy(deep=True) == validated
+    assert TaskSummary.model_validate(trusted.model_dump()) == trusted
+
+    task_values = {**values, "details": "Notas"}
+    del task_values["has_details"]
+    trusted_task = construct_trusted(Task, dict(task_values))
+    assert trusted_task == Task.model_validate(task_values)
+    assert trusted_task.model_copy() == trusted_task
+
+
+# TEST: 12
+def test_construct_trusted_pydantic_internals() -> None:
+    """Comprueba que pydantic sigue guardando el estado de una instancia en
+    los atributos que escribe `construct_trusted`, y que coinciden con los
+    de `model_construct`. Si una actualización de pydantic los cambia, esta
+    prueba falla antes que las lecturas del repositorio.
+    """
+    assert set(BaseModel.__slots__) == {
+        "__dict__",
+        "__pydantic_fields_set__",
+        "__pydantic_extra__",
+        "__pydantic_private__",
+    }
+    values: dict[str, Any] = {
+        "id": 1, "status": "pending", "tag": "personal",
+        "content": "Tarea", "priority": "baja", "has_details": False,
+    }
+    trusted = construct_trusted(TaskSummary, dict(values))
+    constructed = TaskSummary.model_construct(**values)
+    for name in BaseModel.__slots__:
+        assert getattr(trusted, name) == getattr(constructed, name)
+
+
+# TEST: 13
+def test_field_codes_cover_literals() -> None:
+    """Comprueba que cada valor permitido de status, tag y prioridad tiene un
+    código entero único, y que la tabla inversa devuelve el valor.
+    """
+    for field, literal in (
+        ("status", Status), ("tag", Tag), ("priority", Priority)
+    ):
+        codes = FIELD_CODES[field]
+        assert set(codes) == set(get_args(literal))
+        assert len(set(codes.values())) == len(codes)
+        for value, code in codes.items():
+            assert FIELD_VALUES[field][code] == value
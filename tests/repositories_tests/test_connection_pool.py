@@ -0,0 +1,102 @@
+# MODULO: tests/
+# .. ........................ test_connection_pool ........................ ..󰌠
+"""
+Pruebas unitarias para el módulo repositories/connection_pool.py.
+"""
+import pytest
+import sqlite3
+from typing import Iterator
+from repositories.connection_pool import ConnectionPool
+from repositories.database import TEST_DATABASE_PATH
+
+
+@pytest.fixture
+def test_pool() -> Iterator[ConnectionPool]:
+    """Pytest fixture que crea un pool sobre la base de datos de prueba.
+
+    Yields:
+        Iterator[ConnectionPool]: Pool listo para prestar conexiones.
+    """
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+    pool = ConnectionPool(TEST_DATABASE_PATH)
+    yield pool
+    pool.close()
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+
+
+# TEST: 01
+def test_connection_is_reused(test_pool: ConnectionPool) -> None:
+    """Comprueba que préstamos sucesivos reutilizan la misma conexión.
+
+    El pool debe devolver la conexión inactiva en lugar de abrir una nueva
+    en cada préstamo.
+    """
+    with test_pool.connection() as first:
+        pass
+    with test_pool.connection() as second:
+        pass
+
+    assert first is second
+
+
+# TEST: 02
+def test_nested_borrow_shares_transaction(test_pool: ConnectionPool) -> None:
+    """Comprueba que un préstamo anidado del mismo hilo comparte conexión y
+    que un error en el bloque externo revierte también el trabajo interno.
+    """
+    with test_pool.connection() as db_connect:
+        db_connect.execute("CREATE TABLE t (x INTEGER);")
+
+    with pytest.raises(RuntimeError):
+        with test_pool.connection() as outer:
+            with test_pool.connection() as inner:
+                assert inner is outer
+                inner.execute("INSERT INTO t VALUES (1);")
+            raise RuntimeError("fallo provocado")
+
+    with test_pool.connection() as db_connect:
+        count = db_connect.execute("SELECT COUNT(*) FROM t;").fetchone()[0]
+    assert count == 0
+
+
+# TEST: 03
+def test_closed_pool_rejects_borrow(test_pool: ConnectionPool) -> None:
+    """Comprueba que tras `close()` el pool no presta más conexiones."""
+    with test_pool.connection():
+        pass
+    test_pool.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        with test_pool.connection():
+            pass
+
+
+# TEST: 04
+def test_pragmas_applied_on_connect() -> None:
+    """Comprueba que los PRAGMAs configurados se aplican a cada conexión y que
+    los nombres no permitidos se ignoran.
+    """
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+    pool = ConnectionPool(
+        TEST_DATABASE_PATH,
+        pragmas={
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": -2000,
+            "writable_schema": "ON",
+        },
+    )
+
+    with pool.connection() as db_connect:
+        journal_mode = db_connect.execute("PRAGMA journal_mode;").fetchone()[0]
+        synchronous = db_connect.execute("PRAGMA synchronous;").fetchone()[0]
+        cache_size = db_connect.execute("PRAGMA cache_size;").fetchone()[0]
+        writable = db_connect.execute("PRAGMA writable_schema;").fetchone()[0]
+
+    pool.close()
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+    assert cache_size == -2000
+    assert writable == 0
@@ -0,0 +1,90 @@
+# MODULO: tests/
+# .. ......................... test_details_codec ......................... ..󰌠
+"""
+Pruebas unitarias para el módulo repositories/details_codec.py.
+"""
+import pytest
+import sqlite3
+from pathlib import Path
+from models.model_task import Task
+from repositories.details_codec import (
+    HEADER_PREFIX, SQL_FUNCTION_NAME, compress_details, decompress_details,
+    register_sql_function
+)
+from repositories.repository_db import RepositoryDB
+
+
+# TEST: 01
+@pytest.mark.parametrize("method", ["zlib", "lzma"])
+def test_compress_round_trip(method: str) -> None:
+    """Comprueba que el texto largo se comprime con cabecera y se recupera
+    igual, y que el texto corto se guarda sin cambios.
+    """
+    text = "Especificación pegada. " * 400
+
+    packed = compress_details(text, threshold=1024, method=method)
+    assert isinstance(packed, bytes)
+    assert packed.startswith(HEADER_PREFIX)
+    assert len(packed) < len(text)
+    assert decompress_details(packed) == text
+
+    assert compress_details("Corto", threshold=1024) == "Corto"
+    assert compress_details(text, threshold=0) == text
+
+
+# TEST: 02
+def test_decompress_plain_values() -> None:
+    """Comprueba que los valores guardados sin comprimir (filas antiguas) se
+    leen sin cambios y que una cabecera desconocida se rechaza.
+    """
+    assert decompress_details(None) is None
+    assert decompress_details("Texto antiguo") == "Texto antiguo"
+    assert decompress_details("Texto".encode("utf-8")) == "Texto"
+
+    with pytest.raises(ValueError):
+        decompress_details(HEADER_PREFIX + b"?datos")
+    with pytest.raises(ValueError):
+        compress_details("Texto", threshold=1, method="bz2")
+
+
+# TEST: 03
+def test_external_connection_needs_sql_function(tmp_path: Path) -> None:
+    """Comprueba que una conexión ajena al repositorio no puede eliminar
+    una tarea con detalles hasta registrar `details_text`, y que después el
+    índice FTS queda coherente.
+    """
+    db_path = tmp_path / "tareas.db"
+    repo = RepositoryDB(db_path=db_path)
+    repo.create_table()
+    task_ids = repo.new_tasks_many([
+        Task(content="Sin notas"),
+        Task(content="Con notas", details="informe " * 500),
+    ])
+    repo.close()
+
+    db_connect = sqlite3.connect(db_path)
+    try:
+        # Añadir tareas no necesita la función.
+        db_connect.execute(
+            "INSERT INTO tasks_table (status, tag, content, priority) "
+            "VALUES (0, 0, 'Desde un script', 0)"
+        )
+        with pytest.raises(sqlite3.OperationalError, match=SQL_FUNCTION_NAME):
+            db_connect.execute(
+                "DELETE FROM tasks_table WHERE id = ?", (task_ids[1],)
+            )
+
+        register_sql_function(db_connect)
+        db_connect.execute(
+            "DELETE FROM tasks_table WHERE id = ?", (task_ids[1],)
+        )
+        db_connect.commit()
+        db_connect.execute(
+            "INSERT INTO tasks_fts (tasks_fts) VALUES ('integrity-check')"
+        )
+        found = db_connect.execute(
+            "SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH 'informe'"
+        ).fetchall()
+        assert found == []
+    finally:
+        db_connect.close()
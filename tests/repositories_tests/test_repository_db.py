@@ -5,10 +5,17 @@ Pruebas unitarias para el módlo repositories/repository_db.py.
 """
 import pytest
 import sqlite3
+from pydantic import ValidationError
 from typing import Iterator
 from pathlib import Path
-from models.model_task import Task
-from repositories.repository_db import RepositoryDB
+import repositories.querys as sql
+from models.model_task import FIELD_CODES, Task, TaskSummary
+from repositories.migrations import LATEST_VERSION, MIGRATIONS
+from repositories.repository_db import ID_CHUNK_SIZE, RepositoryDB
+from repositories.details_codec import (
+    SQL_FUNCTION_NAME, decompress_details
+)
+from repositories.task_filter import TaskFilter
 from repositories.database import TEST_DATABASE_PATH
 
 
@@ -30,7 +37,8 @@ def test_repo() -> Iterator[RepositoryDB]:
     repo.create_table()
     # Entregar la instancia al test
     yield repo
-    # Limpiar base de datos después del test
+    # Cerrar las conexiones del pool y limpiar la base de datos.
+    repo.close()
     TEST_DATABASE_PATH.unlink(missing_ok=True)
 
 
@@ -71,7 +79,8 @@ def test_new_task(test_repo: RepositoryDB) -> None:
 
     Este test verifica que el método new_task() inserta una fila en
     'tasks_table' y que los datos de esa fila (status, tag, content, priority)
-    coinciden exactamente con los datos del objeto Task proporcionado.
+    coinciden exactamente con los datos del objeto Task proporcionado. Status,
+    tag y prioridad se guardan como códigos y los detalles en 'task_details'.
     """
     task_to_insert = Task(
         tag="personal",
@@ -87,8 +96,9 @@ def test_new_task(test_repo: RepositoryDB) -> None:
 
     # Consulta para extraer la única línea que debe existir en la tabla.
     cursor.execute("""
-            SELECT status, tag, content, priority, details
-            FROM tasks_table;
+            SELECT t.status, t.tag, t.content, t.priority, d.body
+            FROM tasks_table AS t
+            JOIN task_details AS d ON d.task_id = t.id;
     """)
 
     inserted_row = cursor.fetchone()
@@ -96,10 +106,10 @@ def test_new_task(test_repo: RepositoryDB) -> None:
     # Verifica si inserted_row no está vacía, NO debe ser 'None'.
     assert inserted_row is not None
     # Se verifican el orden y los valores de inserted_row contra task_to_insert
-    assert inserted_row[0] == task_to_insert.status
-    assert inserted_row[1] == task_to_insert.tag
+    assert inserted_row[0] == FIELD_CODES["status"][task_to_insert.status]
+    assert inserted_row[1] == FIELD_CODES["tag"][task_to_insert.tag]
     assert inserted_row[2] == task_to_insert.content
-    assert inserted_row[3] == task_to_insert.priority
+    assert inserted_row[3] == FIELD_CODES["priority"][task_to_insert.priority]
     assert inserted_row[4] == task_to_insert.details
 
 
@@ -282,3 +292,507 @@ def test_delete_task(test_repo: RepositoryDB) -> None:
     deleted_task = test_repo.get_task_by_id(task_id)
     # Comprobación de la eliminación de la tarea, se espera None.
     assert deleted_task is None
+
+
+# TEST: 09
+def test_new_tasks_many(test_repo: RepositoryDB) -> None:
+    """Comprueba la inserción masiva de tareas con new_tasks_many.
+
+    Se insertan tareas desde un generador con un tamaño de bloque menor que
+    el total, para forzar varias transacciones, y se verifica que los IDs
+    devueltos correspondan a las tareas en el mismo orden.
+    """
+    total = 2500
+    tasks = (Task(content=f"Tarea masiva {i}") for i in range(total))
+
+    new_ids = test_repo.new_tasks_many(tasks, chunk_size=1000)
+
+    # Un ID por tarea, sin repeticiones.
+    assert len(new_ids) == total
+    assert len(set(new_ids)) == total
+    # El orden de los IDs corresponde al orden de inserción.
+    for position in (0, 999, 1000, total - 1):
+        task = test_repo.get_task_by_id(new_ids[position])
+        assert task is not None
+        assert task.content == f"Tarea masiva {position}"
+    assert len(test_repo.get_all_tasks()) == total
+
+
+# TEST: 10
+def test_migrations_create_filter_indexes(test_repo: RepositoryDB) -> None:
+    """Comprueba que las migraciones actualizan la versión del esquema y que
+    cada combinación de filtros se resuelve con un índice.
+
+    Se inspecciona el plan de consulta (EXPLAIN QUERY PLAN) de cada consulta
+    de filtrado para confirmar que SQLite busca por índice en lugar de
+    recorrer la tabla completa.
+    """
+    filters = [
+        TaskFilter(status="pending"),
+        TaskFilter(tag="trabajo"),
+        TaskFilter(priority="alta"),
+        TaskFilter(status="pending", tag="trabajo"),
+        TaskFilter(status="pending", priority="alta"),
+        TaskFilter(tag="trabajo", priority="alta"),
+        TaskFilter(status="pending", tag="trabajo", priority="alta"),
+        TaskFilter(priority=("alta", "media"), exclude_status="completed"),
+    ]
+
+    db_connection = sqlite3.connect(test_repo.db_path)
+    version = db_connection.execute("PRAGMA user_version;").fetchone()[0]
+    plans = []
+    for task_filter in filters:
+        filters_clause, params = task_filter.where()
+        query = sql.FILTER_TASKS.format(filters=filters_clause, order="")
+        plans.append(" ".join(
+            row[3] for row in db_connection.execute(
+                f"EXPLAIN QUERY PLAN {query}", params
+            )
+        ))
+    db_connection.close()
+
+    assert version == LATEST_VERSION
+    for plan in plans:
+        assert "USING INDEX" in plan
+
+    # Volver a ejecutar create_table no debe fallar ni cambiar la versión.
+    test_repo.create_table()
+    db_connection = sqlite3.connect(test_repo.db_path)
+    assert db_connection.execute("PRAGMA user_version;").fetchone()[0] == version
+    db_connection.close()
+
+
+# TEST: 11
+def test_search_tasks(test_repo: RepositoryDB) -> None:
+    """Comprueba la búsqueda de texto completo con search_tasks.
+
+    Verifica que se encuentran coincidencias en 'content' y en 'details',
+    que la búsqueda es por prefijo y que el índice se mantiene al día tras
+    actualizar y eliminar tareas.
+    """
+    id_content = test_repo.new_task(Task(content="Preparar reunión de equipo"))
+    id_details = test_repo.new_task(
+        Task(content="Revisar informe", details="Notas de la reunión anual")
+    )
+    test_repo.new_task(Task(content="Comprar pan"))
+
+    # Coincidencias por prefijo, en content y en details.
+    found = test_repo.search_tasks("reun")
+    assert {task.id for task in found} == {id_content, id_details}
+    # La coincidencia en content se considera más relevante.
+    assert found[0].id == id_content
+    # Los operadores de FTS5 escritos por el usuario no provocan errores.
+    assert test_repo.search_tasks('pan" OR (') == []
+    assert test_repo.search_tasks("   ") == []
+
+    # El índice refleja las actualizaciones y eliminaciones.
+    test_repo.update_task(id_content, {"content": "Preparar presentación"})
+    test_repo.delete_task(id_details)
+    assert test_repo.search_tasks("reunión") == []
+    assert [t.id for t in test_repo.search_tasks("presentación")] == [id_content]
+
+
+# TEST: 12
+def test_get_tasks_page_and_iter_tasks(test_repo: RepositoryDB) -> None:
+    """Comprueba la paginación por clave (keyset) de get_tasks_page y el
+    recorrido por páginas de iter_tasks.
+
+    Se insertan 25 tareas (una de cada tres con prioridad alta) y se verifica
+    que las páginas sean consecutivas, sin repetir ni omitir tareas, tanto
+    sin filtros como filtrando por prioridad.
+    """
+    test_repo.new_tasks_many(
+        Task(content=f"Tarea {i}", priority="alta" if i % 3 == 0 else "baja")
+        for i in range(25)
+    )
+
+    first_page = test_repo.get_tasks_page(limit=10)
+    second_page = test_repo.get_tasks_page(after_id=first_page[-1].id, limit=10)
+    assert [t.content for t in first_page] == [f"Tarea {i}" for i in range(10)]
+    assert [t.content for t in second_page] == [
+        f"Tarea {i}" for i in range(10, 20)
+    ]
+
+    # El recorrido completo por páginas devuelve todas las tareas en orden.
+    all_ids = [task.id for task in test_repo.iter_tasks(page_size=4)]
+    assert len(all_ids) == 25
+    assert all_ids == sorted(all_ids)
+
+    # Los filtros se aplican en cada página.
+    high = list(test_repo.iter_tasks(page_size=2, priority="alta"))
+    assert [t.content for t in high] == [f"Tarea {i}" for i in range(0, 25, 3)]
+
+
+# TEST: 13
+def test_filter_tasks_compound(test_repo: RepositoryDB) -> None:
+    """Comprueba los filtros compuestos de filter_tasks: varios valores por
+    criterio (IN), exclusiones (NOT), orden y límite en una sola consulta.
+    """
+    test_repo.new_tasks_many([
+        Task(content="A", priority="alta", status="pending"),
+        Task(content="B", priority="media", status="completed"),
+        Task(content="C", priority="media", status="in_progress"),
+        Task(content="D", priority="baja", status="pending"),
+        Task(content="E", priority="alta", status="in_progress"),
+    ])
+
+    # "Prioridad alta o media, no completadas".
+    task_filter = TaskFilter(
+        priority=["alta", "media"], exclude_status="completed"
+    )
+    found = test_repo.filter_tasks(task_filter=task_filter)
+    assert [task.content for task in found] == ["A", "C", "E"]
+
+    # Orden descendente por contenido y límite.
+    task_filter = TaskFilter(
+        priority=("alta", "media"), order_by=("-content",), limit=2
+    )
+    found = test_repo.filter_tasks(task_filter=task_filter)
+    assert [task.content for task in found] == ["E", "C"]
+
+    # Los argumentos simples también aceptan varios valores.
+    found = test_repo.filter_tasks(status=["pending", "in_progress"])
+    assert [task.content for task in found] == ["A", "C", "D", "E"]
+    assert test_repo.count_tasks(priority=("alta", "baja")) == 3
+
+    # Los nombres de columna nunca provienen de la entrada del usuario.
+    with pytest.raises(ValueError):
+        test_repo.filter_tasks(
+            task_filter=TaskFilter(order_by=("content; DROP TABLE x",))
+        )
+
+
+# TEST: 14
+def test_batch_operations_by_ids(test_repo: RepositoryDB) -> None:
+    """Comprueba las operaciones por lote (lectura, cambio de estado,
+    actualización y eliminación por lista de IDs), incluidas listas más
+    largas que un bloque de `ID_CHUNK_SIZE`.
+    """
+    task_ids = test_repo.new_tasks_many(
+        Task(content=f"Tarea {number}")
+        for number in range(ID_CHUNK_SIZE + 100)
+    )
+    some_ids = task_ids[:3]
+
+    found = test_repo.get_tasks_by_ids([*some_ids, 99999])
+    assert [task.id for task in found] == some_ids
+
+    assert test_repo.check_or_uncheck_tasks(some_ids) == 3
+    found = test_repo.get_tasks_by_ids(some_ids)
+    assert {task.status for task in found} == {"in_progress"}
+
+    assert test_repo.update_tasks(task_ids, {"tag": "trabajo"}) == len(task_ids)
+    assert test_repo.count_tasks(tag="trabajo") == len(task_ids)
+
+    # Los IDs repetidos se cuentan una sola vez.
+    assert test_repo.delete_tasks([*task_ids, task_ids[0]]) == len(task_ids)
+    assert test_repo.count_tasks() == 0
+
+
+# TEST: 15
+def test_list_queries_skip_details(test_repo: RepositoryDB) -> None:
+    """Comprueba que las consultas de listas devuelven resúmenes sin el texto
+    de los detalles, que sólo `get_task_by_id` lee los detalles y que los
+    detalles vacíos no se guardan.
+    """
+    with_details = test_repo.new_task(Task(content="A", details="Notas"))
+    empty_details = test_repo.new_task(Task(content="B", details=""))
+    test_repo.new_task(Task(content="C"))
+
+    listed = test_repo.get_all_tasks()
+    assert all(isinstance(task, TaskSummary) for task in listed)
+    assert [task.has_details for task in listed] == [True, False, False]
+    found = test_repo.get_tasks_by_ids([with_details])
+    assert found[0].has_details
+
+    task = test_repo.get_task_by_id(with_details)
+    assert isinstance(task, Task)
+    assert task.details == "Notas"
+
+    # Vaciar los detalles al editar también elimina su fila.
+    test_repo.update_task(with_details, {"details": ""})
+    db_connection = sqlite3.connect(test_repo.db_path)
+    rows = db_connection.execute(
+        "SELECT task_id FROM task_details WHERE task_id IN (?, ?);",
+        (with_details, empty_details)
+    ).fetchall()
+    db_connection.close()
+    assert rows == []
+
+
+# TEST: 16
+def test_migration_moves_details(test_repo: RepositoryDB) -> None:
+    """Comprueba la migración de los detalles a 'task_details' desde una base
+    de datos con el esquema anterior, y que el índice FTS sigue al día al
+    editar, vaciar y eliminar detalles.
+    """
+    # Base de datos en versión 3: los detalles en 'tasks_table'.
+    test_repo.close()
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+    db_connection = sqlite3.connect(TEST_DATABASE_PATH)
+    db_connection.execute(sql.CREATE_TABLE)
+    for migration in MIGRATIONS[:3]:
+        for statement in migration.statements:
+            db_connection.execute(statement)
+    db_connection.execute(sql.SET_SCHEMA_VERSION.format(version=3))
+    db_connection.executemany(
+        "INSERT INTO tasks_table (status, tag, content, priority, details) "
+        "VALUES (?, ?, ?, ?, ?);",
+        [
+            ("completed", "trabajo", "Comprar pan", "alta", "Integral"),
+            ("pending", "personal", "Llamar", "baja", None),
+        ]
+    )
+    db_connection.commit()
+    db_connection.close()
+
+    repo = RepositoryDB(db_path=TEST_DATABASE_PATH)
+    repo.create_table()
+    try:
+        task = repo.get_task_by_id(1)
+        assert task is not None and task.details == "Integral"
+        assert (task.status, task.tag, task.priority) == (
+            "completed", "trabajo", "alta"
+        )
+        assert [t.has_details for t in repo.get_all_tasks()] == [True, False]
+        assert [t.id for t in repo.search_tasks("integral")] == [1]
+
+        # El índice sigue los cambios hechos en cualquiera de las tablas.
+        repo.update_task(2, {"details": "Al banco"})
+        repo.update_task(1, {"content": "Comprar harina", "details": ""})
+        assert [t.id for t in repo.search_tasks("banco")] == [2]
+        assert repo.search_tasks("integral") == []
+        assert [t.id for t in repo.search_tasks("harina")] == [1]
+        repo.delete_task(2)
+        assert repo.search_tasks("banco") == []
+
+        db_connection = sqlite3.connect(TEST_DATABASE_PATH)
+        db_connection.create_function(
+            SQL_FUNCTION_NAME, 1, decompress_details, deterministic=True
+        )
+        columns = [
+            row[1] for row in
+            db_connection.execute("PRAGMA table_info(tasks_table);")
+        ]
+        orphans = db_connection.execute(
+            "SELECT COUNT(*) FROM task_details;"
+        ).fetchone()[0]
+        # Falla si el índice no coincide con el contenido de las tablas.
+        db_connection.execute(
+            "INSERT INTO tasks_fts (tasks_fts, rank) "
+            "VALUES ('integrity-check', 1);"
+        )
+        db_connection.close()
+        assert "details" not in columns
+        assert orphans == 0
+    finally:
+        repo.close()
+
+
+# TEST: 17
+def test_large_details_are_compressed() -> None:
+    """Comprueba que los detalles que superan el umbral se guardan
+    comprimidos, que se leen y se buscan como texto, y que los detalles
+    guardados sin comprimir se siguen leyendo.
+    """
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+    repo = RepositoryDB(db_path=TEST_DATABASE_PATH, compress_threshold=1024)
+    repo.create_table()
+    try:
+        log = "\n".join(f"linea {n}: conexion rechazada" for n in range(500))
+        big_id = repo.new_task(Task(content="Revisar log", details=log))
+        small_id = repo.new_task(Task(content="Nota", details="Texto corto"))
+
+        db_connection = sqlite3.connect(TEST_DATABASE_PATH)
+        stored = dict(db_connection.execute(
+            "SELECT task_id, typeof(body) FROM task_details;"
+        ).fetchall())
+        size = db_connection.execute(
+            "SELECT length(body) FROM task_details WHERE task_id = ?;",
+            (big_id,)
+        ).fetchone()[0]
+        db_connection.close()
+        assert stored == {big_id: "blob", small_id: "text"}
+        assert size < len(log) // 4
+
+        task = repo.get_task_by_id(big_id)
+        assert task is not None and task.details == log
+        assert [t.id for t in repo.search_tasks("rechazada")] == [big_id]
+
+        # Al editar, el índice recibe el texto y no los bytes comprimidos.
+        repo.update_task(big_id, {"details": log.replace("rechazada", "ok")})
+        assert repo.search_tasks("rechazada") == []
+        repo.update_task(big_id, {"details": "Resuelto"})
+        task = repo.get_task_by_id(big_id)
+        assert task is not None and task.details == "Resuelto"
+        assert [t.id for t in repo.search_tasks("resuelto")] == [big_id]
+    finally:
+        repo.close()
+        TEST_DATABASE_PATH.unlink(missing_ok=True)
+
+
+# TEST: 18
+def test_validate_reads_switch(test_repo: RepositoryDB) -> None:
+    """Comprueba que las lecturas no validan las filas por defecto y que con
+    `validate_reads` activo una fila no válida (escrita por otro programa)
+    se rechaza.
+    """
+    test_repo.new_task(Task(content="Válida"))
+    db_connection = sqlite3.connect(test_repo.db_path)
+    db_connection.execute(
+        "INSERT INTO tasks_table (status, tag, content, priority) "
+        "VALUES ('archivada', 'personal', 'Externa', 'baja');"
+    )
+    db_connection.commit()
+    db_connection.close()
+
+    test_repo.validate_reads = False
+    assert [t.status for t in test_repo.get_all_tasks()] == [
+        "pending", "archivada"
+    ]
+
+    test_repo.validate_reads = True
+    with pytest.raises(ValidationError):
+        test_repo.get_all_tasks()
+
+
+# TEST: 19
+def test_fields_stored_as_codes(
+        test_repo: RepositoryDB,
+        caplog: pytest.LogCaptureFixture
+) -> None:
+    """Comprueba que status, tag y prioridad se guardan como códigos enteros
+    con tablas de consulta iguales a las del modelo, y que las lecturas,
+    filtros, orden y cambios de estado trabajan con esos códigos.
+    """
+    urgent = test_repo.new_task(
+        Task(content="A", status="in_progress", tag="calendario",
+             priority="alta")
+    )
+    test_repo.new_task(Task(content="B", priority="media"))
+    test_repo.new_task(Task(content="C"))
+
+    db_connection = sqlite3.connect(test_repo.db_path)
+    for table, field in (
+        ("task_statuses", "status"),
+        ("task_tags", "tag"),
+        ("task_priorities", "priority"),
+    ):
+        names = dict(db_connection.execute(f"SELECT name, code FROM {table};"))
+        assert names == FIELD_CODES[field]
+    types = db_connection.execute(
+        "SELECT DISTINCT typeof(status), typeof(tag), typeof(priority) "
+        "FROM tasks_table;"
+    ).fetchall()
+    db_connection.close()
+    assert types == [("integer", "integer", "integer")]
+
+    task = test_repo.get_task_by_id(urgent)
+    assert task is not None
+    assert (task.status, task.tag, task.priority) == (
+        "in_progress", "calendario", "alta"
+    )
+    # El orden por prioridad sigue los códigos: baja < media < alta.
+    found = test_repo.filter_tasks(
+        task_filter=TaskFilter(order_by=("-priority",))
+    )
+    assert [t.content for t in found] == ["A", "B", "C"]
+    # Un valor desconocido no coincide con ninguna tarea, ni al excluirlo.
+    assert test_repo.filter_tasks(status="archivada") == []
+    assert test_repo.count_tasks(tag="calendario") == 1
+    found = test_repo.filter_tasks(
+        task_filter=TaskFilter(exclude_status="archivada")
+    )
+    assert len(found) == 3
+
+    test_repo.check_or_uncheck_task(urgent)
+    task = test_repo.get_task_by_id(urgent)
+    assert task is not None and task.status == "completed"
+    # Un valor sin código no lanza: se registra como error de la base de
+    # datos y no cambia nada.
+    test_repo.update_task(urgent, {"tag": "otra"})
+    assert test_repo.update_tasks([urgent], {"priority": "Alta"}) is None
+    assert "Valor no válido para tag: 'otra'" in caplog.text
+    task = test_repo.get_task_by_id(urgent)
+    assert task is not None and (task.tag, task.priority) == (
+        "calendario", "alta"
+    )
+
+
+# TEST: 20
+def test_task_counts(test_repo: RepositoryDB) -> None:
+    """Comprueba que `task_counts` agrupa las tareas por status, tag y
+    prioridad con los valores del modelo, para toda la tabla o sólo para
+    una lista de IDs.
+    """
+    ids = test_repo.new_tasks_many(
+        Task(
+            content=f"Tarea {index}",
+            tag="trabajo" if index % 2 else "personal",
+            priority="alta" if index < 3 else "baja",
+        )
+        for index in range(6)
+    )
+    test_repo.check_or_uncheck_task(ids[0])
+
+    assert test_repo.task_counts() == {
+        ("in_progress", "personal", "alta"): 1,
+        ("pending", "trabajo", "alta"): 1,
+        ("pending", "personal", "alta"): 1,
+        ("pending", "trabajo", "baja"): 2,
+        ("pending", "personal", "baja"): 1,
+    }
+    assert test_repo.task_counts(task_ids=[ids[0], ids[5], 999]) == {
+        ("in_progress", "personal", "alta"): 1,
+        ("pending", "trabajo", "baja"): 1,
+    }
+    assert test_repo.task_counts(task_ids=[]) == {}
+
+
+# TEST: 21
+def test_tasks_page_text_prefix(test_repo: RepositoryDB) -> None:
+    """Comprueba que `get_tasks_page` y `count_tasks` filtran por prefijo
+    de palabras del contenido (sin tildes), combinado con los demás filtros,
+    y que los detalles no cuentan para ese filtro.
+    """
+    ids = test_repo.new_tasks_many([
+        Task(content="Reunión de equipo", tag="trabajo"),
+        Task(content="Revisar reunion anual"),
+        Task(content="Comprar pan", details="reunión pendiente"),
+        Task(content="Equipo de fútbol", tag="trabajo"),
+    ])
+
+    page = test_repo.get_tasks_page(text="reun")
+    assert [task.id for task in page] == ids[:2]
+    assert test_repo.count_tasks(text="reun") == 2
+    assert test_repo.count_tasks(text="reun equ") == 1
+    assert test_repo.count_tasks(text="equ", tag="trabajo") == 2
+    page = test_repo.get_tasks_page(text="equ", after_id=ids[0], limit=5)
+    assert [task.id for task in page] == [ids[3]]
+    assert test_repo.count_tasks(text="  ") == 4
+
+
+# TEST: 22
+def test_new_tasks_many_failed_chunk(
+        test_repo: RepositoryDB,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Comprueba que si un bloque de `new_tasks_many` falla, sólo ese
+    bloque se revierte, se deja de insertar y se devuelven los IDs de los
+    bloques ya confirmados.
+    """
+    stored_details = test_repo._stored_details
+
+    def failing_details(details: str) -> str | bytes:
+        if details == "falla":
+            raise sqlite3.IntegrityError("detalles rechazados")
+        return stored_details(details)
+
+    monkeypatch.setattr(test_repo, "_stored_details", failing_details)
+    tasks = [Task(content=f"Tarea {index}") for index in range(5)]
+    tasks[3] = Task(content="Tarea 3", details="falla")
+
+    new_ids = test_repo.new_tasks_many(tasks, chunk_size=2)
+
+    assert len(new_ids) == 2
+    assert [task.id for task in test_repo.get_all_tasks()] == new_ids
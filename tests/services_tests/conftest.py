@@ -0,0 +1,49 @@
+# MODULO: tests/
+# .. .............................. conftest ............................... ..󰌠
+"""
+Fixtures compartidas por las pruebas de services/.
+"""
+import pytest
+from typing import Iterator
+from repositories.database import TEST_DATABASE_PATH
+from services.task_service import TaskService
+
+
+def _open_service(use_cache: bool) -> Iterator[TaskService]:
+    """Abre un TaskService sobre una base de datos de prueba vacía y la
+    elimina al cerrarlo.
+
+    Args:
+        use_cache (bool): Si el servicio usa la caché en memoria.
+
+    Yields:
+        Iterator[TaskService]: Servicio abierto.
+    """
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+    service = TaskService(db_path=TEST_DATABASE_PATH, use_cache=use_cache)
+    service.open()
+    yield service
+    service.close()
+    TEST_DATABASE_PATH.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def cached_service() -> Iterator[TaskService]:
+    """Pytest fixture que crea un TaskService con caché sobre la base de
+    datos de prueba.
+
+    Yields:
+        Iterator[TaskService]: Servicio abierto, con caché activada.
+    """
+    yield from _open_service(use_cache=True)
+
+
+@pytest.fixture
+def service() -> Iterator[TaskService]:
+    """Pytest fixture que crea un TaskService sin caché sobre la base de
+    datos de prueba.
+
+    Yields:
+        Iterator[TaskService]: Servicio abierto, sin caché.
+    """
+    yield from _open_service(use_cache=False)
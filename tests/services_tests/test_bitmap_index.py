@@ -0,0 +1,72 @@
+# MODULO: tests/
+# .. .......................... test_bitmap_index .......................... ..󰌠
+"""
+Pruebas unitarias para el índice de bits de services/bitmap_index.py y su
+uso desde TaskCache y TaskService.
+"""
+from models.model_task import Task, TaskSummary
+from repositories.task_filter import TaskFilter
+from services.bitmap_index import WINDOW_BITS, BitmapIndex
+from services.task_service import TaskService
+
+
+# TEST: 01
+def test_bitmap_masks_and_ids() -> None:
+    """Comprueba que las combinaciones de filtros se resuelven con AND, OR
+    y AND NOT, y que las páginas de IDs cruzan ventanas y huecos grandes.
+    """
+    index = BitmapIndex()
+    far_id = WINDOW_BITS * 3 + 5
+    index.load([
+        TaskSummary(id=1, content="A", status="pending", priority="alta"),
+        TaskSummary(id=2, content="B", status="completed", priority="alta"),
+        TaskSummary(id=3, content="C", status="in_progress", tag="trabajo"),
+        TaskSummary(id=far_id, content="D", status="pending", priority="alta"),
+    ])
+
+    mask = index.mask(TaskFilter(status=("pending", "completed"),
+                                 priority="alta"))
+    assert mask.bit_count() == 3
+    assert index.ids(mask) == [1, 2, far_id]
+    assert index.ids(mask, after_id=1, limit=1) == [2]
+    assert index.ids(mask, after_id=2, limit=5) == [far_id]
+    assert index.ids(mask, before_id=far_id, limit=1) == [2]
+    assert index.ids(mask, before_id=2 ** 63, limit=2) == [2, far_id]
+
+    mask = index.mask(TaskFilter(exclude_status="pending", tag="personal"))
+    assert index.ids(mask) == [2]
+    assert index.mask(TaskFilter(tag="calendario")) == 0
+
+    # Los cambios incrementales mantienen los conjuntos de cada valor.
+    index.remove(TaskSummary(id=1, content="A", status="pending", priority="alta"))
+    index.add(TaskSummary(id=1, content="A", status="completed", priority="baja"))
+    assert index.ids(index.mask(TaskFilter(status="completed"))) == [1, 2]
+    assert index.ids(index.mask(TaskFilter(priority="alta"))) == [2, far_id]
+
+
+# TEST: 02
+def test_cache_answers_compound_filters(cached_service: TaskService) -> None:
+    """Comprueba que los filtros con exclusiones y límite ordenados por ID
+    se responden desde la caché con el mismo resultado que la base de
+    datos.
+    """
+    cached_service.new_tasks_many_service(
+        Task(
+            content=f"Tarea {index}",
+            status=("pending", "in_progress", "completed")[index % 3],
+            tag=("personal", "trabajo")[index % 2],
+            priority=("baja", "media", "alta")[index % 3],
+        )
+        for index in range(30)
+    )
+    task_filter = TaskFilter(
+        priority=("alta", "media"), exclude_tag="trabajo", limit=4
+    )
+
+    from_cache = cached_service.filter_tasks_service(task_filter=task_filter)
+    cache = cached_service.cache
+    assert cache is not None and cache.loaded
+    from_db = cached_service.repository.filter_tasks(task_filter=task_filter)
+    assert from_cache == from_db
+    assert len(from_cache) == 4
+    assert cache.count(task_filter=task_filter) == 10
@@ -0,0 +1,107 @@
+# MODULO: tests/
+# .. ........................... test_task_cache ........................... ..󰌠
+"""
+Pruebas unitarias para la caché en memoria de services/task_cache.py y su
+uso desde TaskService.
+"""
+import sqlite3
+from models.model_task import Task, TaskSummary
+from repositories.database import TEST_DATABASE_PATH
+from services.task_cache import TaskCache
+from services.task_service import TaskService
+
+
+# TEST: 01
+def test_cache_page_and_filter() -> None:
+    """Comprueba que la caché pagina y filtra con la misma semántica que el
+    repositorio (orden por ID, after_id/before_id, filtros combinados).
+    """
+    cache = TaskCache()
+    cache.load(
+        TaskSummary(
+            id=task_id,
+            content=f"Tarea {task_id}",
+            priority="alta" if task_id % 2 else "baja",
+            tag="trabajo" if task_id % 3 == 0 else "personal",
+        )
+        for task_id in range(1, 21)
+    )
+
+    assert [t.id for t in cache.page(after_id=5, limit=3)] == [6, 7, 8]
+    assert [t.id for t in cache.page(before_id=5, limit=3)] == [2, 3, 4]
+    assert [t.id for t in cache.filter(priority="alta", tag="trabajo")] == [
+        3, 9, 15
+    ]
+    assert cache.count(priority="baja") == 10
+    # Varios valores de un mismo criterio se combinan con OR.
+    assert cache.count(priority=("alta", "baja"), tag=["trabajo"]) == 6
+
+    # Las modificaciones actualizan los índices secundarios.
+    cache.put(TaskSummary(id=3, content="Tarea 3", priority="baja", tag="trabajo"))
+    cache.remove(9)
+    assert [t.id for t in cache.filter(priority="alta", tag="trabajo")] == [15]
+    assert cache.get(9) is None
+
+
+# TEST: 02
+def test_service_write_through(cached_service: TaskService) -> None:
+    """Comprueba que los cambios hechos con el servicio se reflejan en la
+    caché sin recargarla.
+    """
+    first_id = cached_service.new_task_service(Task(content="Primera"))
+    assert first_id is not None
+    # La primera lectura carga la caché.
+    assert cached_service.count_tasks_service() == 1
+    cache = cached_service.cache
+    assert cache is not None and cache.loaded
+
+    second_id = cached_service.new_task_service(Task(content="Segunda"))
+    assert second_id is not None
+    cached_service.check_or_uncheck_task_service(first_id)
+    cached_service.delete_task_service(second_id)
+
+    assert cache.loaded
+    assert cached_service.count_tasks_service() == 1
+    task = cached_service.get_task_by_id_service(first_id)
+    assert task is not None and task.status == "in_progress"
+
+
+# TEST: 03
+def test_service_detects_external_changes(cached_service: TaskService) -> None:
+    """Comprueba que un cambio hecho por otra conexión (otro proceso)
+    invalida la caché y se ve en la siguiente lectura.
+    """
+    cached_service.new_task_service(Task(content="Propia"))
+    assert cached_service.count_tasks_service() == 1
+
+    external = sqlite3.connect(TEST_DATABASE_PATH)
+    external.execute(
+        "INSERT INTO tasks_table (status, tag, content, priority) "
+        "VALUES (0, 0, 'Externa', 0);"
+    )
+    external.commit()
+    external.close()
+
+    assert cached_service.count_tasks_service() == 2
+    contents = {task.content for task in cached_service.get_all_tasks()}
+    assert contents == {"Propia", "Externa"}
+
+
+# TEST: 04
+def test_service_rejects_unknown_values(cached_service: TaskService) -> None:
+    """Comprueba que un tag o prioridad desconocidos no lanzan excepción
+    desde el servicio: la escritura no se hace y la caché sigue igual.
+    """
+    task_id = cached_service.new_task_service(Task(content="Tarea"))
+    assert task_id is not None
+    assert cached_service.count_tasks_service(tag="personal") == 1
+
+    cached_service.update_task_service(task_id, {"tag": "Trabajo"})
+    assert cached_service.update_tasks_service(
+        [task_id], {"priority": "urgente"}
+    ) == 0
+
+    task = cached_service.get_task_by_id_service(task_id)
+    assert task is not None
+    assert (task.tag, task.priority) == ("personal", "baja")
+    assert cached_service.count_tasks_service(tag="personal") == 1
@@ -0,0 +1,92 @@
+# MODULO: tests/
+# .. .......................... test_task_counts ........................... ..󰌠
+"""
+Pruebas unitarias para los totales de services/task_counts.py y su
+mantenimiento desde TaskService.
+"""
+import pytest
+import sqlite3
+from unittest.mock import Mock
+from models.model_task import Task, TaskSummary
+from repositories.database import TEST_DATABASE_PATH
+from services.task_counts import TaskCounts
+from services.task_service import TaskService
+
+
+# TEST: 01
+def test_counts_apply_and_group() -> None:
+    """Comprueba que los totales se agrupan por campo y que aplicar la
+    diferencia de un cambio mueve las tareas entre combinaciones.
+    """
+    counts = TaskCounts()
+    counts.load({
+        ("pending", "personal", "alta"): 2,
+        ("completed", "trabajo", "baja"): 1,
+    })
+    counts.add(TaskSummary(id=4, content="Nueva", tag="trabajo"))
+
+    assert counts.total() == 4
+    assert counts.by_field("status") == {"pending": 3, "completed": 1}
+    assert counts.by_field("tag") == {"personal": 2, "trabajo": 2}
+
+    # Una tarea pasa a 'in_progress' y otra se elimina.
+    counts.apply(
+        before={
+            ("pending", "personal", "alta"): 1,
+            ("completed", "trabajo", "baja"): 1,
+        },
+        after={("in_progress", "personal", "alta"): 1},
+    )
+    assert counts.as_dict() == {
+        ("pending", "personal", "alta"): 1,
+        ("in_progress", "personal", "alta"): 1,
+        ("pending", "trabajo", "baja"): 1,
+    }
+    with pytest.raises(ValueError):
+        counts.by_field("content")
+
+
+# TEST: 02
+def test_service_keeps_counts_up_to_date(
+        service: TaskService,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Comprueba que los cambios hechos con el servicio actualizan los
+    totales sin volver a contar la tabla, y que un cambio externo obliga a
+    contarla de nuevo.
+    """
+    first_id = service.new_task_service(Task(content="Primera"))
+    assert first_id is not None
+    assert service.task_counts_service().total() == 1
+
+    # A partir de aquí sólo se cuentan las tareas afectadas.
+    task_counts = service.repository.task_counts
+    spy = Mock(wraps=task_counts)
+    monkeypatch.setattr(service.repository, "task_counts", spy)
+    second_id = service.new_task_service(
+        Task(content="Segunda", tag="trabajo")
+    )
+    assert second_id is not None
+    service.check_or_uncheck_tasks_service([first_id, second_id])
+    service.update_task_service(first_id, {"priority": "alta"})
+    service.delete_task_service(second_id)
+    counts = service.task_counts_service()
+    assert all(
+        call.kwargs.get("task_ids") is not None
+        for call in spy.call_args_list
+    )
+    assert counts.as_dict() == {("in_progress", "personal", "alta"): 1}
+    assert counts.as_dict() == task_counts()
+
+    external = sqlite3.connect(TEST_DATABASE_PATH)
+    external.execute(
+        "INSERT INTO tasks_table (status, tag, content, priority) "
+        "VALUES (2, 1, 'Externa', 0);"
+    )
+    external.commit()
+    external.close()
+
+    counts = service.task_counts_service()
+    assert spy.call_args.kwargs.get("task_ids") is None
+    assert counts.by_field("status") == {"in_progress": 1, "completed": 1}
+    assert counts.by_field("tag") == {"personal": 1, "proyecto": 1}